@@ -7,6 +7,7 @@ exception handlers, and route configurations.
 
 
 from contextlib import asynccontextmanager
+import os
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -21,6 +22,7 @@ from ..shared.exceptions import (
     InvalidFilterError,
     FilteringError
 )
+from ...verifiers.parse_cache import ParseCache, get_parse_cache, set_parse_cache
 from .routes.verification import router as verification_router
 from .routes.discovery import router as discovery_router
 
@@ -30,10 +32,25 @@ import nltk  # type: ignore
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Download NLTK punkt tokenizer data at startup
+# Environment variables that enable and bound the process-wide parse cache
+PARSE_CACHE_ENTRIES_ENV = "ARGDOWN_FEEDBACK_PARSE_CACHE_ENTRIES"
+PARSE_CACHE_BYTES_ENV = "ARGDOWN_FEEDBACK_PARSE_CACHE_BYTES"
+
+
+def configure_parse_cache() -> None:
+    """Install a parse cache if enabled by the environment (maximum number of entries > 0)."""
+    max_entries = int(os.environ.get(PARSE_CACHE_ENTRIES_ENV, "0"))
+    if max_entries > 0:
+        max_snippet_bytes = int(os.environ.get(PARSE_CACHE_BYTES_ENV, "10000000"))
+        set_parse_cache(ParseCache(max_entries=max_entries, max_snippet_bytes=max_snippet_bytes))
+        logger.info(f"Parse cache enabled (max. {max_entries} entries, {max_snippet_bytes} snippet bytes)")
+
+
+# Download NLTK punkt tokenizer data and configure caches at startup
 @asynccontextmanager
 async def lifespan(app):
     nltk.download('punkt')
+    configure_parse_cache()
     yield
 
 # Create FastAPI application
@@ -138,11 +155,15 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
 @app.get("/health")
 async def health_check() -> Dict[str, Any]:
     """Health check endpoint."""
-    return {
+    health: Dict[str, Any] = {
         "status": "healthy",
         "service": "argdown-feedback-api",
         "version": "1.0.0"
     }
+    parse_cache = get_parse_cache()
+    if parse_cache is not None:
+        health["parse_cache"] = parse_cache.stats()
+    return health
 
 # Root endpoint
 @app.get("/")
@@ -43,6 +43,7 @@ from ..core.arganno import (
     AnnotationDensityScorer,
     AnnotationCoverageScorer,
 )
+from ..core.logreco import SOLVER_BUDGET_CONFIG_OPTIONS
 
 
 ### Scorers ###
@@ -118,6 +119,7 @@ class ArgannoArgmapLogrecoBuilder(VerifierBuilder):
             description="Minimum number of arguments required in the reconstruction",
             required=False,
         ),
+        *SOLVER_BUDGET_CONFIG_OPTIONS,
     ]
     is_coherence_verifier = True
 
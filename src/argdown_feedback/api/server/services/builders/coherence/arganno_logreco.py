@@ -36,6 +36,7 @@ from ..core.arganno import (
     AnnotationScopeScorer,
 )
 from ..core.logreco import (
+    SOLVER_BUDGET_CONFIG_OPTIONS,
     LogrecoFormalizationsFaithfulnessScorer,
     LogrecoPredicateLogicScorer,
     LogrecoTrivialityScorer,
@@ -142,6 +143,7 @@ class ArgannoLogrecoBuilder(VerifierBuilder):
             description="Key used for declarations information",
             required=False,
         ),
+        *SOLVER_BUDGET_CONFIG_OPTIONS,
     ]
     is_coherence_verifier = True
 
@@ -32,6 +32,7 @@ from argdown_feedback.verifiers.processing_handler import (
 )
 
 from ..base import VerifierBuilder
+from ..core.logreco import SOLVER_BUDGET_CONFIG_OPTIONS
 from ..core.argmap import (
     ArgmapSizeScorer,
     ArgmapDensityScorer,
@@ -106,7 +107,8 @@ class ArgmapLogrecoBuilder(VerifierBuilder):
             default=2,
             description="Minimum number of arguments required in the reconstruction",
             required=False
-        )
+        ),
+        *SOLVER_BUDGET_CONFIG_OPTIONS,
     ]
     is_coherence_verifier = True
     
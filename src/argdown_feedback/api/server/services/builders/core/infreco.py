@@ -164,6 +164,13 @@ class InfrecoBuilder(VerifierBuilder):
             description="Key used for inference information in arguments",
             required=False
         ),
+        VerifierConfigOption(
+            name="fused",
+            type="bool",
+            default=False,
+            description="Compute all infreco checks in a single traversal of the reconstruction (same results)",
+            required=False
+        ),
     ]
     
     def build_handlers_pipeline(self, filters_spec: dict[FilterRoleType, Any], **kwargs) -> List[BaseHandler]:
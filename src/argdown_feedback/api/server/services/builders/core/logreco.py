@@ -6,7 +6,7 @@ import textdistance
 from argdown_feedback.api.server.services.verifier_registry import BaseScorer
 from argdown_feedback.api.shared.filtering import FilterRoleType
 from argdown_feedback.logic.fol_to_nl import FOL2NLTranslator
-from argdown_feedback.logic.logic import get_propositional_variables
+from argdown_feedback.logic.logic import formula_signature
 from argdown_feedback.verifiers.base import BaseHandler
 from argdown_feedback.verifiers.core.infreco_handler import (
     InfRecoCompositeHandler,
@@ -32,6 +32,45 @@ from .infreco import (
 )
 
 
+SOLVER_BUDGET_CONFIG_OPTIONS = [
+    VerifierConfigOption(
+        name="timeout_ms",
+        type="integer",
+        default=None,
+        description="Time limit of every Z3 validity check in milliseconds (unbounded if not set)",
+        required=False,
+    ),
+    VerifierConfigOption(
+        name="request_timeout_ms",
+        type="integer",
+        default=None,
+        description="Time limit of all Z3 validity checks of a request in milliseconds (unbounded if not set)",
+        required=False,
+    ),
+    VerifierConfigOption(
+        name="rlimit",
+        type="integer",
+        default=None,
+        description="Z3 resource limit of every validity check (unbounded if not set)",
+        required=False,
+    ),
+    VerifierConfigOption(
+        name="max_memory_mb",
+        type="integer",
+        default=None,
+        description="Memory limit of every Z3 validity check in megabytes (unbounded if not set)",
+        required=False,
+    ),
+    VerifierConfigOption(
+        name="max_workers",
+        type="integer",
+        default=None,
+        description="Number of worker threads checking the arguments of a document concurrently (serial checks if not set)",
+        required=False,
+    ),
+]
+
+
 ### Scorers ###
 
 
@@ -85,7 +124,7 @@ class LogrecoPredicateLogicScorer(BaseScorer):
             )
 
         n_has_prop_vars = sum(
-            bool(get_propositional_variables(expr)) for expr in all_expressions.values()
+            bool(formula_signature(expr).propositional_variables) for expr in all_expressions.values()
         )
         score = 1 - (n_has_prop_vars / len(all_expressions))
         scoring = ScoringResult(
@@ -269,6 +308,7 @@ class LogrecoBuilder(VerifierBuilder):
             description="Key used for declarations information",
             required=False,
         ),
+        *SOLVER_BUDGET_CONFIG_OPTIONS,
     ]
 
     def build_handlers_pipeline(
@@ -2,3 +2,5 @@
 from .logic import Syntax  # noqa: F401
 from .logic import key_present_in_form  # noqa: F401
 from .logic import get_arities  # noqa: F401
+from .logic import FormulaSignature, formula_signature  # noqa: F401
+from .formula_dag import FormulaNode, formula_node, to_expression  # noqa: F401
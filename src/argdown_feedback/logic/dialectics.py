@@ -15,13 +15,49 @@ NEGATION_SCHEMES = [
 ]
 
 
+def _negations(prop: Proposition) -> frozenset[str]:
+    """Renderings of the negations of all texts of the proposition."""
+    return frozenset(scheme.format(text=text) for scheme in NEGATION_SCHEMES for text in prop.texts)
+
+
+class PropositionIndex:
+    """Texts and negated texts of the propositions of an Argdown document, and pairs of
+    propositions that attack or contradict each other, for hash lookups in `are_contradictory`."""
+
+    def __init__(self, argdown: Argdown):
+        self.propositions = {prop.label: prop for prop in argdown.propositions}
+        self.texts = {prop.label: frozenset(prop.texts) for prop in argdown.propositions}
+        self.negations = {prop.label: _negations(prop) for prop in argdown.propositions}
+        self.contradicting = {
+            frozenset((drel.source, drel.target))
+            for drel in argdown.dialectical_relations
+            if drel.source != drel.target and drel.valence in [Valence.ATTACK, Valence.CONTRADICT]
+        }
+
+    def indexes(self, prop: Proposition) -> bool:
+        """Whether the proposition is indexed (rather than taken from another document)."""
+        return self.propositions.get(prop.label) is prop
+
+
+_PROPOSITION_INDEX_ATTRIBUTE = "_proposition_index"
+
+
+def proposition_index(argdown: Argdown) -> PropositionIndex:
+    """proposition index of the document, computed once and stored with the document"""
+    index = getattr(argdown, _PROPOSITION_INDEX_ATTRIBUTE, None)
+    if index is None:
+        index = PropositionIndex(argdown)
+        setattr(argdown, _PROPOSITION_INDEX_ATTRIBUTE, index)
+    return index
+
+
 def are_identical(prop1: Proposition | None, prop2: Proposition | None) -> bool:
     """Check if two propositions are identical."""
     if prop1 is None or prop2 is None:
         return False
     return (
         prop1.label == prop2.label
-        or any(text in prop2.texts for text in prop1.texts)
+        or not set(prop1.texts).isdisjoint(prop2.texts)
     )
 
 def are_contradictory(prop1: Proposition | None, prop2: Proposition | None, argdown: Argdown | None = None) -> bool:
@@ -31,79 +67,96 @@ def are_contradictory(prop1: Proposition | None, prop2: Proposition | None, argd
     if prop1.label == prop2.label:
         return False
     if argdown is not None:
-        if any(
-            drel.source in [prop1.label, prop2.label]
-            and drel.target in [prop1.label, prop2.label]
-            and drel.source != drel.target
-            and drel.valence in [Valence.ATTACK, Valence.CONTRADICT]
-            for drel in argdown.dialectical_relations
-        ):
+        index = proposition_index(argdown)
+        if frozenset((prop1.label, prop2.label)) in index.contradicting:
             return True
-    negations_prop1 = [
-        scheme.format(text=text) for scheme in NEGATION_SCHEMES for text in prop1.texts
-    ]
-    negations_prop2 = [
-        scheme.format(text=text) for scheme in NEGATION_SCHEMES for text in prop2.texts
-    ]
+        if index.indexes(prop1) and index.indexes(prop2):
+            return (
+                not index.texts[prop1.label].isdisjoint(index.negations[prop2.label])
+                or not index.texts[prop2.label].isdisjoint(index.negations[prop1.label])
+            )
     return (
-        any(text in negations_prop2 for text in prop1.texts)
-        or any(text in negations_prop1 for text in prop2.texts)
+        not _negations(prop2).isdisjoint(prop1.texts)
+        or not _negations(prop1).isdisjoint(prop2.texts)
     )
 
+ATTACKING_VALENCES = (Valence.ATTACK, Valence.CONTRADICT)
+
+
+class DialecticalIndex:
+    """Direct and one-step indirect dialectical relations between the nodes of an argument map.
+
+    Support (attack) pairs are precomputed by composing the direct relations via
+    intermediate propositions, so that `indirectly_supports` and `indirectly_attacks`
+    are set lookups rather than scans over all propositions of the map."""
+
+    def __init__(self, argdown_map: Argdown):
+        # direct relations by source: supported nodes, and attacked or contradicted nodes
+        supported: dict[str, set[str]] = {}
+        attacked: dict[str, set[str]] = {}
+        self.supports: set[tuple[str, str]] = set()
+        self.attacks: set[tuple[str, str]] = set()
+        for drel in argdown_map.dialectical_relations:
+            if drel.valence == Valence.SUPPORT:
+                supported.setdefault(drel.source, set()).add(drel.target)
+                self.supports.add((drel.source, drel.target))
+            elif drel.valence in ATTACKING_VALENCES:
+                attacked.setdefault(drel.source, set()).add(drel.target)
+                if drel.valence == Valence.ATTACK:
+                    self.attacks.add((drel.source, drel.target))
+
+        # relations via intermediate propositions: support of support, attack of attack
+        # (indirect support), support of attack and attack of support (indirect attack)
+        supporting: dict[str, set[str]] = {}
+        attacking: dict[str, set[str]] = {}
+        for source, targets in supported.items():
+            for target in targets:
+                supporting.setdefault(target, set()).add(source)
+        for source, targets in attacked.items():
+            for target in targets:
+                attacking.setdefault(target, set()).add(source)
+        for prop in argdown_map.propositions:
+            via = prop.label
+            if via is None:
+                continue
+            for sources, targets, relations in (
+                (supporting, supported, self.supports),
+                (attacking, attacked, self.supports),
+                (supporting, attacked, self.attacks),
+                (attacking, supported, self.attacks),
+            ):
+                relations.update(
+                    (source, target)
+                    for source in sources.get(via, ())
+                    for target in targets.get(via, ())
+                    if via != source and via != target
+                )
+
+
+_INDEX_ATTRIBUTE = "_dialectical_index"
+
+
+def dialectical_index(argdown_map: Argdown) -> DialecticalIndex:
+    """dialectical index of the argument map, computed once and stored with the map"""
+    index = getattr(argdown_map, _INDEX_ATTRIBUTE, None)
+    if index is None:
+        index = DialecticalIndex(argdown_map)
+        setattr(argdown_map, _INDEX_ATTRIBUTE, index)
+    return index
+
+
 def indirectly_supports(from_label: str, to_label: str, argdown_map: Argdown) -> bool:
     """Check if one node directly or indirectly (via intermediate prop) supports another one in argument map."""
     if from_label == to_label:
         return True
-
-    rels_direct = argdown_map.get_dialectical_relation(from_label, to_label)
-    rels_direct = [] if rels_direct is None else rels_direct
-    if any(rd.valence == Valence.SUPPORT for rd in rels_direct):
-        return True
-
-    for prop in argdown_map.propositions:
-        if prop.label is None or prop.label == from_label or prop.label == to_label:
-            continue
-        rels1 = argdown_map.get_dialectical_relation(from_label, prop.label)
-        rels2 = argdown_map.get_dialectical_relation(prop.label, to_label)
-        rels1 = [] if rels1 is None else rels1
-        rels2 = [] if rels2 is None else rels2
-        for rel1 in rels1:
-            for rel2 in rels2:
-                if (
-                    (rel1.valence == Valence.SUPPORT and rel2.valence == Valence.SUPPORT)
-                    or (rel1.valence in [Valence.ATTACK, Valence.CONTRADICT] and rel2.valence in [Valence.ATTACK, Valence.CONTRADICT]) 
-                ):
-                    return True
-
-    return False
+    return (from_label, to_label) in dialectical_index(argdown_map).supports
 
 
 def indirectly_attacks(from_label: str, to_label: str, argdown_map: Argdown) -> bool:
     """Check if one node directly or indirectly (via intermediate prop) attacks another one in argument map."""
     if from_label == to_label:
         return False
-
-    rels_direct = argdown_map.get_dialectical_relation(from_label, to_label)
-    rels_direct = [] if rels_direct is None else rels_direct
-    if any(rd.valence == Valence.ATTACK for rd in rels_direct):
-        return True
-
-    for prop in argdown_map.propositions:
-        if prop.label is None or prop.label == from_label or prop.label == to_label:
-            continue
-        rels1 = argdown_map.get_dialectical_relation(from_label, prop.label)
-        rels2 = argdown_map.get_dialectical_relation(prop.label, to_label)
-        rels1 = [] if rels1 is None else rels1
-        rels2 = [] if rels2 is None else rels2
-        for rel1 in rels1:
-            for rel2 in rels2:
-                if (
-                    (rel1.valence == Valence.SUPPORT and rel2.valence in [Valence.ATTACK, Valence.CONTRADICT])
-                    or (rel1.valence in [Valence.ATTACK, Valence.CONTRADICT] and rel2.valence == Valence.SUPPORT) 
-                ):
-                    return True
-
-    return False
+    return (from_label, to_label) in dialectical_index(argdown_map).attacks
 
 
 
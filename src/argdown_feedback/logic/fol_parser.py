@@ -1,11 +1,270 @@
-"""Parser for first-order logic formulae using NLTK"""
+"""Parser for first-order logic formulae using NLTK
+
+Formalizations are parsed by a dedicated tokenizer and precedence climbing
+parser for the first-order fragment of NLTK's logic syntax (quantifiers,
+connectives, predicates, constants and identity). It builds the very same
+`Expression` objects as `Expression.fromstring` and reports syntax errors with
+the same messages, but avoids the overhead of NLTK's general lambda calculus
+parser. Formulas beyond that fragment (lambda and iota terms, excessive
+nesting) are parsed by NLTK.
+"""
 
 from functools import lru_cache
+import re
+
 from nltk.sem.logic import (  # type: ignore
+    AllExpression,
+    AndExpression,
+    ApplicationExpression,
+    ConstantExpression,
+    EqualityExpression,
+    ExistsExpression,
+    ExpectedMoreTokensException,
     Expression,
+    FunctionVariableExpression,
+    IffExpression,
+    ImpExpression,
+    LambdaExpression,
     LogicalExpressionException,
+    NegatedExpression,
+    OrExpression,
+    Tokens,
+    UnexpectedTokenException,
+    Variable,
+    VariableExpression,
+)
+
+
+# Tokens as split by NLTK's LogicParser: longest matching symbol, or a maximal
+# run of other non-whitespace characters ('<' only starts a symbol if it is
+# followed by the rest of '<->' or '<=>').
+_TOKEN_RE = re.compile(
+    r"[ \t\n]*"
+    r"(<->|<=>|->|=>|==|!=|[-\\.(),!&^|=]"
+    r"|(?:[^ \t\n\-\\.(),!&^|=<]|<(?!->|=>))+)"
 )
 
+# Operator precedences (lower binds tighter), cf. `LogicParser.operator_precedence`
+_APP = 3
+_EQUALITY = 4
+_QUANTIFIER = 5
+_NOT = 2
+_TOP = 10
+
+_KEYWORDS = frozenset(Tokens.TOKENS)
+_NEGATIONS = frozenset(Tokens.NOT_LIST)
+_EQUALITIES = frozenset(Tokens.EQ_LIST + Tokens.NEQ_LIST)
+_QUANTIFIERS = {
+    **{tok: ExistsExpression for tok in Tokens.EXISTS_LIST},
+    **{tok: AllExpression for tok in Tokens.ALL_LIST},
+}
+_CONNECTIVES = {
+    **{tok: (AndExpression, 6) for tok in Tokens.AND_LIST},
+    **{tok: (OrExpression, 7) for tok in Tokens.OR_LIST},
+    **{tok: (ImpExpression, 8) for tok in Tokens.IMP_LIST},
+    **{tok: (IffExpression, 9) for tok in Tokens.IFF_LIST},
+}
+# tokens that may continue an expression
+_ADJUNCTS = frozenset({*_EQUALITIES, Tokens.OPEN, *_CONNECTIVES})
+# lambda calculus beyond the first-order fragment
+_UNSUPPORTED_TOKENS = frozenset(Tokens.LAMBDA_LIST + Tokens.IOTA_LIST)
+
+# NLTK bounds nesting, too; deeper formulas are left to NLTK to report
+_MAX_DEPTH = 200
+
+
+class _Unsupported(Exception):
+    """Formula is to be parsed by NLTK."""
+
+
+@lru_cache(maxsize=4096)
+def _variable(name: str) -> tuple[type, Variable]:
+    # class of variable expression (individual/function/event variable, or constant), by name
+    return type(VariableExpression(Variable(name))), Variable(name)
+
+
+class _FormulaParser:
+    """Precedence climbing parser that mirrors the parsing rules, and error
+    positions, of NLTK's `LogicParser` for first-order formulas."""
+
+    def __init__(self, data: str):
+        self.data = data.rstrip()
+        self.tokens: list[str] = _TOKEN_RE.findall(self.data)
+        self.n_tokens = len(self.tokens)
+        self.index = 0
+        self.depth = 0
+
+    def parse(self) -> Expression:
+        if not _UNSUPPORTED_TOKENS.isdisjoint(self.tokens):
+            raise _Unsupported()
+        try:
+            result = self.expression(_TOP)
+            if self.index < self.n_tokens:
+                raise UnexpectedTokenException(self.index + 1, self.tokens[self.index])
+        except LogicalExpressionException as e:
+            # character positions of tokens (and of the end of input), only needed for errors
+            positions = [m.start(1) for m in _TOKEN_RE.finditer(self.data)]
+            positions += [len(self.data), len(self.data) + 1]
+            if e.index is None or not 0 < e.index <= len(positions):
+                raise _Unsupported() from e
+            msg = "{}\n{}\n{}^".format(e, self.data, " " * positions[e.index - 1])
+            raise LogicalExpressionException(None, msg) from e
+        return result
+
+    def peek(self) -> str | None:
+        return self.tokens[self.index] if self.index < self.n_tokens else None
+
+    def expression(self, context: int) -> Expression:
+        self.depth += 1
+        if self.depth > _MAX_DEPTH:
+            raise _Unsupported()
+        if self.index >= self.n_tokens:
+            raise ExpectedMoreTokensException(self.index + 1, message="Expression expected.")
+        tok = self.tokens[self.index]
+        self.index += 1
+
+        if tok not in _KEYWORDS:
+            accum = self.predication(tok)
+        elif tok in _NEGATIONS:
+            accum = NegatedExpression(self.expression(_NOT))
+        elif tok in _QUANTIFIERS:
+            accum = self.quantification(tok)
+        elif tok == Tokens.OPEN:
+            accum = self.expression(_TOP)
+            self.expect(Tokens.CLOSE)
+        else:
+            raise UnexpectedTokenException(self.index, tok, message="Expression expected.")
+
+        # adjuncts, cf. `LogicParser.attempt_adjuncts`
+        while self.index < self.n_tokens and self.tokens[self.index] in _ADJUNCTS:
+            index = self.index
+            accum = self.equality(accum, context)
+            accum = self.application(accum, context)
+            accum = self.connectives(accum, context)
+            if index == self.index:
+                break
+        self.depth -= 1
+        return accum
+
+    def predication(self, tok: str) -> Expression:
+        cls, variable = _variable(tok)
+        accum = cls(variable)
+        if self.peek() == Tokens.OPEN:
+            if cls is not FunctionVariableExpression and cls is not ConstantExpression:
+                raise LogicalExpressionException(
+                    self.index,
+                    "'%s' is an illegal predicate name.  "
+                    "Individual variables may not be used as predicates." % tok,
+                )
+            self.index += 1
+            accum = self.arguments(accum)
+        return accum
+
+    def arguments(self, accum: Expression) -> Expression:
+        # curried application to the comma-separated arguments, after the opening paren
+        accum = ApplicationExpression(accum, self.expression(_APP))
+        while self.peek() == Tokens.COMMA:
+            self.index += 1
+            accum = ApplicationExpression(accum, self.expression(_APP))
+        self.expect(Tokens.CLOSE)
+        return accum
+
+    def bound_variable(self) -> Variable:
+        if self.index >= self.n_tokens:
+            raise ExpectedMoreTokensException(self.index + 1, "Variable expected.")
+        tok = self.tokens[self.index]
+        self.index += 1
+        cls, variable = _variable(tok)
+        if cls is ConstantExpression:
+            raise LogicalExpressionException(
+                self.index,
+                "'%s' is an illegal variable name.  Constants may not be quantified." % tok,
+            )
+        return variable
+
+    def quantification(self, tok: str) -> Expression:
+        if self.index >= self.n_tokens:
+            raise ExpectedMoreTokensException(
+                self.index + 2,
+                message="Variable and Expression expected following quantifier '%s'." % tok,
+            )
+        variables = [self.bound_variable()]
+        while True:
+            next_tok = self.peek()
+            if next_tok is None or (next_tok == Tokens.DOT and self.index + 1 >= self.n_tokens):
+                raise ExpectedMoreTokensException(self.index + 2, message="Expression expected.")
+            if next_tok in _KEYWORDS:
+                break
+            # 'all x y.M' abbreviates 'all x.all y.M'
+            variables.append(self.bound_variable())
+        if next_tok == Tokens.DOT:
+            self.index += 1
+
+        accum = self.expression(_QUANTIFIER)
+        factory = _QUANTIFIERS[tok]
+        while variables:
+            accum = factory(variables.pop(), accum)
+        return accum
+
+    def equality(self, accum: Expression, context: int) -> Expression:
+        tok = self.peek()
+        if tok in _EQUALITIES and _EQUALITY < context:
+            self.index += 1
+            accum = EqualityExpression(accum, self.expression(_EQUALITY))
+            if tok in Tokens.NEQ_LIST:
+                accum = NegatedExpression(accum)
+        return accum
+
+    def application(self, accum: Expression, context: int) -> Expression:
+        if context >= _APP and self.peek() == Tokens.OPEN:
+            if not isinstance(
+                accum,
+                (LambdaExpression, ApplicationExpression, FunctionVariableExpression, ConstantExpression),
+            ):
+                raise LogicalExpressionException(
+                    self.index,
+                    "The function '%s' is not a Lambda Expression, an Application Expression, "
+                    "or a functional predicate, so it may not take arguments." % accum,
+                )
+            self.index += 1
+            accum = self.arguments(accum)
+        return accum
+
+    def connectives(self, accum: Expression, context: int) -> Expression:
+        chain = 0
+        while self.index < self.n_tokens:
+            connective = _CONNECTIVES.get(self.tokens[self.index])
+            if connective is None or connective[1] >= context:
+                break
+            # (left-nested) chains of connectives count towards the nesting depth
+            chain += 1
+            if self.depth + chain > _MAX_DEPTH:
+                raise _Unsupported()
+            self.index += 1
+            factory, precedence = connective
+            accum = factory(accum, self.expression(precedence))
+        return accum
+
+    def expect(self, expected: str) -> None:
+        if self.index >= self.n_tokens:
+            raise ExpectedMoreTokensException(
+                self.index + 1, message="Expected token '%s'." % expected
+            )
+        tok = self.tokens[self.index]
+        self.index += 1
+        if tok != expected:
+            raise UnexpectedTokenException(self.index, tok, expected)
+
+
+def parse_formula(form: str) -> Expression:
+    """parses a formula like `Expression.fromstring` (without caching)
+
+    Raises LogicalExpressionException with the same messages as NLTK."""
+    try:
+        return _FormulaParser(form).parse()
+    except _Unsupported:
+        return Expression.fromstring(form)
+
 
 class FOLParser:
     """parser methods for first-order-logic formulae
@@ -16,7 +275,7 @@ class FOLParser:
     def parse(form: str) -> Expression:
         """parses string formalizationsas NLTK first-order-logic formula"""
         try:
-            return Expression.fromstring(form)
+            return parse_formula(form)
         except LogicalExpressionException as e:
             raise ValueError(
                 f"Invalid formula: {form}. Error: {e}"
@@ -24,5 +283,4 @@ class FOLParser:
         except Exception as e:
             raise ValueError(
                 f"Unexpected error while parsing formula: {form}. Error: {e}"
-            ) from e                
-
+            ) from e
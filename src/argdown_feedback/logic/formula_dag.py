@@ -0,0 +1,263 @@
+"""formula_dag.py
+
+Canonical, hash-consed representation of first-order formulas.
+
+Formulas are represented as a DAG of interned `FormulaNode`s: structurally equal
+subformulas, in whichever propositions or documents they occur, are one and the
+same node. Nodes are canonical up to
+
+* renaming of bound variables (which are represented by de Bruijn indices),
+* parenthesisation of conjunctions and disjunctions (which are n-ary), and
+* order of the operands of conjunctions, disjunctions, biconditionals and identity
+  statements (which are sorted),
+
+so that two formalizations are equal in this sense iff they are the same node,
+and iff they have the same (stable, 128-bit) `fingerprint`.
+"""
+
+import hashlib
+import threading
+import weakref
+
+from nltk.sem.logic import (  # type: ignore
+    AbstractVariableExpression,
+    AllExpression,
+    AndExpression,
+    ApplicationExpression,
+    EqualityExpression,
+    ExistsExpression,
+    Expression,
+    FunctionVariableExpression,
+    IffExpression,
+    ImpExpression,
+    NegatedExpression,
+    OrExpression,
+    Variable,
+    VariableExpression,
+)
+
+# node kinds
+SYMBOL = "symbol"  # free variable, constant or predicate (label: name)
+BOUND = "bound"  # bound variable (label: de Bruijn index)
+APPLICATION = "app"  # predicate applied to arguments (children: predicate, *arguments)
+NOT = "not"
+AND = "and"  # n-ary, operands sorted
+OR = "or"  # n-ary, operands sorted
+IMPLIES = "implies"
+IFF = "iff"  # operands sorted
+EQUALS = "equals"  # operands sorted
+ALL = "all"  # label: sort of bound variable (INDIVIDUAL or FUNCTION)
+EXISTS = "exists"
+
+INDIVIDUAL = "individual"
+FUNCTION = "function"
+
+_COMMUTATIVE = {AND, OR, IFF, EQUALS}
+_BINDERS = {ALL: AllExpression, EXISTS: ExistsExpression}
+_CONNECTIVES = {IMPLIES: ImpExpression, IFF: IffExpression, EQUALS: EqualityExpression}
+
+# names of bound variables in NLTK expressions, by sort
+_BOUND_NAMES = {
+    INDIVIDUAL: ["x", "y", "z", "u", "v", "w"],
+    FUNCTION: ["X", "Y", "Z", "U", "V", "W"],
+}
+
+
+class FormulaNode:
+    """Interned node of a formula DAG (see module docstring).
+
+    Nodes are created with `formula_node` (from NLTK expressions) and are never
+    constructed directly; equal nodes are identical. `symbols` are the names of
+    the free symbols of the (sub)formula, and `fingerprint` is a 128-bit digest
+    that is stable across processes."""
+
+    __slots__ = ("kind", "label", "children", "fingerprint", "symbols", "loose", "_hash", "_expression", "__weakref__")
+
+    kind: str
+    label: str | int | None
+    children: tuple["FormulaNode", ...]
+    fingerprint: bytes
+    symbols: frozenset[str]
+    loose: int  # number of enclosing binders the node refers to; 0 iff closed
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self):
+        return _intern, (self.kind, self.label, self.children)
+
+    def __repr__(self) -> str:
+        return f"FormulaNode({to_expression(self) if not self.loose else self.kind!r}, {self.fingerprint.hex()[:12]})"
+
+    @property
+    def is_closed(self) -> bool:
+        return self.loose == 0
+
+
+_table: "weakref.WeakValueDictionary[bytes, FormulaNode]" = weakref.WeakValueDictionary()
+_table_lock = threading.Lock()
+
+
+def _intern(kind: str, label: str | int | None, children: tuple[FormulaNode, ...]) -> FormulaNode:
+    if kind in _COMMUTATIVE:
+        children = tuple(sorted(children, key=lambda c: c.fingerprint))
+    digest = hashlib.blake2b(f"{kind}\0{label}\0".encode("utf-8"), digest_size=16)
+    for child in children:
+        digest.update(child.fingerprint)
+    fingerprint = digest.digest()
+
+    with _table_lock:
+        node = _table.get(fingerprint)
+        if node is not None:
+            return node
+        node = object.__new__(FormulaNode)
+        node.kind = kind
+        node.label = label
+        node.children = children
+        node.fingerprint = fingerprint
+        node._hash = int.from_bytes(fingerprint[:8], "big", signed=True)
+        node._expression = None
+        if kind == SYMBOL:
+            node.symbols = frozenset([str(label)])
+            node.loose = 0
+        elif kind == BOUND:
+            node.symbols = frozenset()
+            node.loose = int(label) + 1  # type: ignore[arg-type]
+        else:
+            node.symbols = frozenset().union(*(c.symbols for c in children))
+            loose = max((c.loose for c in children), default=0)
+            node.loose = max(loose - 1, 0) if kind in _BINDERS else loose
+        _table[fingerprint] = node
+        return node
+
+
+def _operands(expression: Expression, cls: type) -> list[Expression]:
+    # operands of nested binary expressions of type cls, from left to right
+    operands = []
+    stack = [expression]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, cls):
+            stack.extend((current.second, current.first))
+        else:
+            operands.append(current)
+    return operands
+
+
+def _from_expression(expression: Expression, bound: list[str]) -> FormulaNode:
+    if isinstance(expression, AbstractVariableExpression):
+        name = expression.variable.name
+        if name in bound:
+            return _intern(BOUND, bound[::-1].index(name), ())
+        return _intern(SYMBOL, name, ())
+    if isinstance(expression, ApplicationExpression):
+        function, arguments = expression.uncurry()
+        return _intern(
+            APPLICATION, None, tuple(_from_expression(e, bound) for e in [function, *arguments])
+        )
+    if isinstance(expression, NegatedExpression):
+        return _intern(NOT, None, (_from_expression(expression.term, bound),))
+    if isinstance(expression, (AndExpression, OrExpression)):
+        kind = AND if isinstance(expression, AndExpression) else OR
+        operands = _operands(expression, type(expression))
+        return _intern(kind, None, tuple(_from_expression(e, bound) for e in operands))
+    if isinstance(expression, (AllExpression, ExistsExpression)):
+        kind = ALL if isinstance(expression, AllExpression) else EXISTS
+        sort = FUNCTION if isinstance(VariableExpression(expression.variable), FunctionVariableExpression) else INDIVIDUAL
+        term = _from_expression(expression.term, [*bound, expression.variable.name])
+        return _intern(kind, sort, (term,))
+    for kind, cls in _CONNECTIVES.items():
+        if isinstance(expression, cls):
+            return _intern(
+                kind, None, (_from_expression(expression.first, bound), _from_expression(expression.second, bound))
+            )
+    raise ValueError(f"Cannot represent expression {expression} as formula node.")
+
+
+_NODE_ATTRIBUTE = "_formula_node"
+
+
+def formula_node(expression: Expression) -> FormulaNode:
+    """canonical node of the expression, computed once and stored with the expression
+
+    Raises ValueError for expressions beyond first-order logic (e.g. lambda terms)."""
+    node = getattr(expression, _NODE_ATTRIBUTE, None)
+    if node is None:
+        node = _from_expression(expression, [])
+        setattr(expression, _NODE_ATTRIBUTE, node)
+    return node
+
+
+def negation(node: FormulaNode) -> FormulaNode:
+    """node of the negated formula; double negations are eliminated"""
+    if node.kind == NOT:
+        return node.children[0]
+    return _intern(NOT, None, (node,))
+
+
+def _substitute(node: FormulaNode, term: FormulaNode, depth: int) -> FormulaNode:
+    if node.loose <= depth:
+        # does not refer to the substituted variable
+        return node
+    if node.kind == BOUND:
+        return term
+    if node.kind in _BINDERS:
+        depth += 1
+    return _intern(node.kind, node.label, tuple(_substitute(c, term, depth) for c in node.children))
+
+
+def instantiate(node: FormulaNode, term: FormulaNode) -> FormulaNode:
+    """node of the body of a closed quantified formula, with the bound variable
+    replaced by the closed term"""
+    if node.kind not in _BINDERS or not node.is_closed or not term.is_closed:
+        raise ValueError("Only closed quantified formulas can be instantiated with closed terms.")
+    return _substitute(node.children[0], term, 0)
+
+
+def _bound_name(sort: str, avoid: frozenset[str], bound: list[str]) -> str:
+    i = 0
+    while True:
+        for name in _BOUND_NAMES[sort]:
+            candidate = f"{name}{i}" if i else name
+            if candidate not in avoid and candidate not in bound:
+                return candidate
+        i += 1
+
+
+def _to_expression(node: FormulaNode, bound: list[str]) -> Expression:
+    if node._expression is not None:
+        return node._expression
+    if node.kind == SYMBOL:
+        expression = VariableExpression(Variable(str(node.label)))
+    elif node.kind == BOUND:
+        return VariableExpression(Variable(bound[-1 - int(node.label)]))  # type: ignore[arg-type]
+    elif node.kind == APPLICATION:
+        expression = _to_expression(node.children[0], bound)
+        for argument in node.children[1:]:
+            expression = ApplicationExpression(expression, _to_expression(argument, bound))
+    elif node.kind == NOT:
+        expression = NegatedExpression(_to_expression(node.children[0], bound))
+    elif node.kind in (AND, OR):
+        cls = AndExpression if node.kind == AND else OrExpression
+        expression = _to_expression(node.children[0], bound)
+        for operand in node.children[1:]:
+            expression = cls(expression, _to_expression(operand, bound))
+    elif node.kind in _BINDERS:
+        name = _bound_name(str(node.label), node.symbols, bound)
+        term = _to_expression(node.children[0], [*bound, name])
+        expression = _BINDERS[node.kind](Variable(name), term)
+    else:
+        first, second = (_to_expression(c, bound) for c in node.children)
+        expression = _CONNECTIVES[node.kind](first, second)
+    if node.is_closed:
+        # closed subformulas are shared by all expressions converted from the DAG
+        node._expression = expression
+        setattr(expression, _NODE_ATTRIBUTE, node)
+    return expression
+
+
+def to_expression(node: FormulaNode) -> Expression:
+    """NLTK expression of a closed node, in canonical form (shared by equal nodes)."""
+    if not node.is_closed:
+        raise ValueError("Only closed formulas can be converted into expressions.")
+    return _to_expression(node, [])
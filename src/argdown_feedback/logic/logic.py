@@ -6,9 +6,13 @@ import enum
 from nltk.sem.logic import (  # type: ignore
     Expression,
     IndividualVariableExpression,
+    FunctionVariableExpression,
     EqualityExpression,
     ApplicationExpression,
     ConstantExpression,
+    NegatedExpression,
+    BinaryExpression,
+    VariableBinderExpression,
 )
 
 
@@ -29,50 +33,151 @@ def key_present_in_form(form: str, key: str) -> bool:
     )
     return present
 
-def get_propositional_variables(expression: Expression) -> list[str]:
-    """returns a list of propositional variables in the expression"""
-    variables = []
+class FormulaSignature:
+    """Symbols of a formula, collected in a single traversal of the expression tree.
+
+    * `free_variables`: free individual and function variables
+    * `constants`: individual constants
+    * `predicates`: predicate constants
+    * `symbols`: all of the above, i.e. the placeholders to be declared
+    * `arities`: arities of applied predicates and function variables, 0 for other symbols
+    * `propositional_variables`: variables and constants that are not arguments of predicates
+
+    `arities` and `propositional_variables` raise a ValueError if they are not defined for
+    the formula (e.g., if a predicate is used with different arities).
+
+    Use `formula_signature` to get the (cached) signature of an expression.
+    """
+
+    __slots__ = (
+        "free_variables",
+        "constants",
+        "predicates",
+        "symbols",
+        "_arities",
+        "_arity_error",
+        "_propositional_variables",
+        "_propositional_error",
+    )
+
+    def __init__(self, expression: Expression):
+        free_variables: set[str] = set()
+        constants: set[str] = set()
+        predicates: set[str] = set()
+        propositional_variables: set[str] = set()
+        propositional_error: str | None = None
+        # applications (or unapplied function variables) outside of identity statements,
+        # in the order in which `get_arities` used to visit them
+        applications: list[tuple[str, int] | str] = []
+
+        # nodes with bound variables, and whether they are in an argument of a predicate or
+        # in an identity statement
+        stack: list[tuple[Expression, frozenset, bool, bool]] = [(expression, frozenset(), False, False)]
+        while stack:
+            expr, bound, in_argument, in_identity = stack.pop()
+            if isinstance(expr, (IndividualVariableExpression, ConstantExpression)):
+                name = expr.variable.name
+                if isinstance(expr, ConstantExpression):
+                    constants.add(name)
+                elif name not in bound:
+                    free_variables.add(name)
+                if not in_argument:
+                    propositional_variables.add(name)
+            elif isinstance(expr, FunctionVariableExpression):
+                name = expr.variable.name
+                if name not in bound:
+                    free_variables.add(name)
+                if not in_argument:
+                    message = f"Function variable '{name}' is used without arguments in {expression}"
+                    propositional_error = propositional_error or message
+                    if not in_identity:
+                        applications.append(message)
+            elif isinstance(expr, ApplicationExpression):
+                arguments = []
+                function = expr
+                while isinstance(function, ApplicationExpression):
+                    arguments.append(function.argument)
+                    function = function.function
+                if not in_argument and not in_identity:
+                    if isinstance(function, (FunctionVariableExpression, ConstantExpression)):
+                        applications.append((function.variable.name, len(arguments)))
+                    else:
+                        applications.append(f"'{function}' is not a predicate in {expression}")
+                if isinstance(function, ConstantExpression):
+                    predicates.add(function.variable.name)
+                else:
+                    stack.append((function, bound, True, in_identity))
+                stack.extend((a, bound, True, in_identity) for a in arguments)
+            elif isinstance(expr, EqualityExpression):
+                stack.append((expr.second, bound, in_argument, True))
+                stack.append((expr.first, bound, in_argument, True))
+            elif isinstance(expr, BinaryExpression):
+                stack.append((expr.second, bound, in_argument, in_identity))
+                stack.append((expr.first, bound, in_argument, in_identity))
+            elif isinstance(expr, NegatedExpression):
+                stack.append((expr.term, bound, in_argument, in_identity))
+            elif isinstance(expr, VariableBinderExpression):
+                stack.append((expr.term, bound | {expr.variable.name}, in_argument, in_identity))
+            else:
+                raise ValueError(f"Unsupported expression {expr} in {expression}")
 
-    def visit(subexpression: Expression):
-        """recursively visits the expression tree and analyse IndividualVariableExpressions"""
-        if isinstance(subexpression, IndividualVariableExpression) or isinstance(subexpression, ConstantExpression):
-            variables.extend(
-                [str(v) for v in subexpression.variables() | subexpression.constants()]
-            )
-        elif not isinstance(
-            subexpression,
-            (ApplicationExpression, ConstantExpression, IndividualVariableExpression),
-        ):
-            subexpression.visit(visit, lambda x: None)
+        self.free_variables = frozenset(free_variables)
+        self.constants = frozenset(constants)
+        self.predicates = frozenset(predicates)
+        self.symbols = self.free_variables | self.constants | self.predicates
+        self._propositional_variables = frozenset(propositional_variables)
+        self._propositional_error = propositional_error
 
-    visit(expression)
-    return list(set(variables))
+        # cf. `Expression.variables`: free variables and symbols starting with '?' or '@'
+        arities = {
+            k: 0 for k in self.symbols
+            if k in self.free_variables or k in self.predicates or k[:1] in ("?", "@")
+        }
+        self._arity_error: str | None = None
+        for application in applications:
+            if isinstance(application, str):
+                self._arity_error = application
+                break
+            name, arity = application
+            if name not in arities:
+                self._arity_error = f"Predicate variable '{name}' is bound in {expression}"
+                break
+            if arities[name] > 0 and arities[name] != arity:
+                self._arity_error = f"Inconsistent arity of variables in expression {expression}"
+                break
+            arities[name] = arity
+        self._arities = arities
+
+    @property
+    def arities(self) -> dict[str, int]:
+        if self._arity_error is not None:
+            raise ValueError(self._arity_error)
+        return self._arities
+
+    @property
+    def propositional_variables(self) -> frozenset[str]:
+        if self._propositional_error is not None:
+            raise ValueError(self._propositional_error)
+        return self._propositional_variables
+
+
+_SIGNATURE_ATTRIBUTE = "_formula_signature"
+
+
+def formula_signature(expression: Expression) -> FormulaSignature:
+    """signature of the expression, computed once and stored with the expression"""
+    signature = getattr(expression, _SIGNATURE_ATTRIBUTE, None)
+    if signature is None:
+        signature = FormulaSignature(expression)
+        setattr(expression, _SIGNATURE_ATTRIBUTE, signature)
+    return signature
+
+
+def get_propositional_variables(expression: Expression) -> list[str]:
+    """returns a list of propositional variables in the expression"""
+    return list(formula_signature(expression).propositional_variables)
 
 
 def get_arities(expression: Expression) -> dict[str, int]:
     """returns a dictionary of variables and their arity"""
-    variables = {k: 0 for k in expression.variables() | expression.predicates()}
-
-    def visit(subexpression: Expression):
-        """recursively visits the expression tree and analyse ApplicationExpressions"""
-        if isinstance(subexpression, ApplicationExpression):
-            arity = 1
-            while isinstance(subexpression.function, ApplicationExpression):
-                arity += 1
-                subexpression = subexpression.function
-            if (
-                variables[subexpression.function.variable] > 0
-                and variables[subexpression.function.variable] != arity
-            ):
-                raise ValueError(
-                    f"Inconsistent arity of variables in expression {expression}"
-                )
-            variables[subexpression.function.variable] = arity
-        elif not isinstance(
-            subexpression,
-            (ConstantExpression, IndividualVariableExpression, EqualityExpression),
-        ):
-            subexpression.visit(visit, lambda x: None)
-
-    visit(expression)
-    return {str(k): v for k, v in variables.items()}
+    return dict(formula_signature(expression).arities)
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 import logging
+import threading
 
 from nltk.sem.logic import (  # type: ignore
     Expression,
@@ -63,15 +65,51 @@ class LogicRenderingMachine(ABC):
 
     def postprocess(self, rendered: str) -> str:
         # remove unnecessary parentheses
-        while (
-            rendered[0] == "(" and rendered[-1] == ")" and
-            all(rendered[1:i].count("(") >= rendered[1:i].count(")") for i in range(1, len(rendered)-1))
-        ):
-            rendered = rendered[1:-1]
+        n_outer = _outer_parentheses(rendered)
+        if n_outer:
+            rendered = rendered[n_outer:-n_outer]
 
         return rendered
 
 
+def _outer_parentheses(rendered: str) -> int:
+    """Number of pairs of parentheses that enclose the entire string and can be removed.
+
+    The k-th pair (counting from 0) can be removed if all previous pairs can, and the
+    nesting depth never drops below k+1 between its opening and (excluding the last
+    character before) its closing parenthesis. Depths and their minima over these
+    nested ranges are computed in a single pass each."""
+    n = len(rendered)
+    # candidates: leading "(" matched with trailing ")"
+    k_max = 0
+    while 2 * (k_max + 1) <= n and rendered[k_max] == "(" and rendered[n - 1 - k_max] == ")":
+        k_max += 1
+    if k_max == 0:
+        return 0
+
+    depths = [0] * (n + 1)  # depth after the first j characters
+    depth = 0
+    for j, char in enumerate(rendered):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        depths[j + 1] = depth
+
+    # min_depths[k]: minimum of depths[k+1 .. n-k-2], from the innermost candidate outwards
+    min_depths = [0.0] * k_max
+    minimum = min(depths[k_max:n - k_max], default=float("inf"))
+    min_depths[k_max - 1] = minimum
+    for k in range(k_max - 2, -1, -1):
+        minimum = min(minimum, depths[k + 1], depths[n - k - 2])
+        min_depths[k] = minimum
+
+    n_outer = 0
+    while n_outer < k_max and min_depths[n_outer] >= n_outer + 1:
+        n_outer += 1
+    return n_outer
+
+
 class LatexLogicRenderingMachine(LogicRenderingMachine):
 
     def equality(self, first: str, second: str) -> str:
@@ -148,70 +186,128 @@ class Z3LogicRenderingMachine(LogicRenderingMachine):
         return rendered
 
 
-
-
+class _RenderingMemo:
+    """Thread-safe LRU cache of renderings of (sub)expressions, keyed by expression
+    identity and syntax.
+
+    Renderings depend on the variable names of an expression, so alpha-equivalent
+    (i.e., equal) expressions may not share them. Entries hold a reference to their
+    expression, so that the ids of cached expressions cannot be reused."""
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[int, Syntax, bool], tuple[Expression, str]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, expression: Expression, syntax: Syntax, final: bool = False) -> str | None:
+        """Cached rendering of expression (postprocessed if `final`), or None."""
+        key = (id(expression), syntax, final)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, expression: Expression, syntax: Syntax, rendered: str, final: bool = False) -> None:
+        with self._lock:
+            key = (id(expression), syntax, final)
+            self._entries[key] = (expression, rendered)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+_rendering_memo = _RenderingMemo()
+
+
+def _resolve_conjunction(expression: Expression) -> list[Expression]:
+    """resolves conjunctions in the expression tree"""
+    return _resolve_chain(expression, AndExpression)
+
+
+def _resolve_disjunction(expression: Expression) -> list[Expression]:
+    """resolves disjunctions in the expression tree"""
+    return _resolve_chain(expression, OrExpression)
+
+
+def _resolve_chain(expression: Expression, cls: type) -> list[Expression]:
+    # operands of nested binary expressions of type cls, from left to right
+    operands = []
+    stack = [expression]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, cls):
+            stack.extend((current.second, current.first))
+        else:
+            operands.append(current)
+    return operands
+
+
+def _resolve_application(expression: ApplicationExpression) -> tuple[Expression, list[Expression]]:
+    """resolves nested applications in the expression tree"""
+    arguments = [expression.argument]
+    while isinstance(expression.function, ApplicationExpression):
+        expression = expression.function
+        arguments.append(expression.argument)
+    return expression.function, arguments[::-1]
+
+
+def _resolve_quantifier(expression: AllExpression | ExistsExpression) -> tuple[list[Variable], Expression]:
+    """resolves nested all- or exists-expressions in the expression tree"""
+    cls = type(expression)
+    variables = [expression.variable]
+    while isinstance(expression.term, cls):
+        expression = expression.term
+        variables.append(expression.variable)
+    return variables, expression.term
 
 
 def render_expression(expression: Expression, syntax: Syntax) -> str:
-    """Render expression in given syntax."""
+    """Render expression in given syntax.
 
-    def resolve_conjunction(expression: AndExpression) -> list[Expression]:
-        """resolves conjunctions in the expression tree"""
-        if isinstance(expression, AndExpression):
-            return resolve_conjunction(expression.first) + resolve_conjunction(expression.second)
-        return [expression]
-
-    def resolve_disjunction(expression: OrExpression) -> list[Expression]:
-        """resolves disjunctions in the expression tree"""
-        if isinstance(expression, OrExpression):
-            return resolve_disjunction(expression.first) + resolve_disjunction(expression.second)
-        return [expression]
-    
-    def resolve_application(expression: ApplicationExpression) -> tuple[FunctionVariableExpression,list[IndividualVariableExpression]]:
-        """resolves nested applications in the expression tree"""
-        if isinstance(expression.function, ApplicationExpression):
-            function, arguments = resolve_application(expression.function)
-            return function, arguments + [expression.argument]
-        return expression.function, [expression.argument]
-
-    def resolve_all_expression(expression: AllExpression) -> tuple[list[Variable],Expression]:
-        """resolves nested all-expressions in the expression tree"""
-        if isinstance(expression.term, AllExpression):
-            variables, term = resolve_all_expression(expression.term)
-            return [expression.variable] + variables, term
-        return [expression.variable], expression.term
-
-    def resolve_exists_expression(expression: ExistsExpression) -> tuple[list[Variable],Expression]:
-        """resolves nested all-expressions in the expression tree"""
-        if isinstance(expression.term, ExistsExpression):
-            variables, term = resolve_exists_expression(expression.term)
-            return [expression.variable] + variables, term
-        return [expression.variable], expression.term
+    Renderings of the expression and its subexpressions are memoized (by identity)."""
 
     def render(expression: Expression, lrm: LogicRenderingMachine) -> str:
         """recursively renders the expression tree"""
         if isinstance(expression, (IndividualVariableExpression, FunctionVariableExpression)):
             return expression.variable.name
+        if isinstance(expression, (ConstantExpression, Variable)):
+            return str(expression)
+        rendered = _rendering_memo.get(expression, syntax)
+        if rendered is None:
+            rendered = render_composite(expression, lrm)
+            _rendering_memo.put(expression, syntax, rendered)
+        return rendered
+
+    def render_composite(expression: Expression, lrm: LogicRenderingMachine) -> str:
         if isinstance(expression, EqualityExpression):
             return lrm.equality(str(expression.first), str(expression.second))
-        if isinstance(expression, ConstantExpression):
-            return str(expression)
         if isinstance(expression, ApplicationExpression):
-            function, arguments = resolve_application(expression)
+            function, arguments = _resolve_application(expression)
             return lrm.application(render(function, lrm), [render(a, lrm) for a in arguments])
         if isinstance(expression, ExistsExpression):
-            variables, term = resolve_exists_expression(expression)
+            variables, term = _resolve_quantifier(expression)
             return lrm.exists([render(v, lrm) for v in variables], render(term, lrm))
         if isinstance(expression, AllExpression):
-            variables, term = resolve_all_expression(expression)
+            variables, term = _resolve_quantifier(expression)
             return lrm.all([render(v, lrm) for v in variables], render(term, lrm))
         if isinstance(expression, NegatedExpression):
             return lrm.negated(render(expression.term, lrm))
         if isinstance(expression, AndExpression):
-            conjuncts = resolve_conjunction(expression)
+            conjuncts = _resolve_conjunction(expression)
             return lrm.conjunction([render(c, lrm) for c in conjuncts])
         if isinstance(expression, OrExpression):
-            disjuncts = resolve_disjunction(expression)
+            disjuncts = _resolve_disjunction(expression)
             return lrm.disjunction([render(d, lrm) for d in disjuncts])
         if isinstance(expression, ImpExpression):
             return lrm.implication(render(expression.first, lrm), render(expression.second, lrm))
@@ -230,8 +326,9 @@ def render_expression(expression: Expression, syntax: Syntax) -> str:
         logging.getLogger().warning(f"Unsupported syntax: {syntax}. Defaulting to NLTK.")
         return str(expression)
 
-    rendered = render(expression, lrm)
-    rendered = lrm.postprocess(rendered)
+    rendered = _rendering_memo.get(expression, syntax, final=True)
+    if rendered is None:
+        rendered = lrm.postprocess(render(expression, lrm))
+        _rendering_memo.put(expression, syntax, rendered, final=True)
 
     return rendered
-
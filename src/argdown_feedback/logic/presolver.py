@@ -0,0 +1,260 @@
+"""presolver.py
+
+Syntactic pre-solver for validity checks.
+
+Before an inference is handed to the SMT solver, a few sound rules are tried on
+the canonical nodes of its formulas (see `formula_dag`):
+
+* The conclusion is valid if it is among the facts derived from the premises by
+  conjunction elimination, instantiation of universal premises with the constants
+  of the inference, and (chained) modus ponens and modus tollens; or if the
+  conclusion is a conjunction, disjunction or conditional that follows from these
+  facts by introduction; or if the facts contain a formula and its negation.
+* The conclusion is invalid if the premises are true and the conclusion is false
+  in some interpretation over a one-element domain. This covers, e.g., conclusions
+  with predicates that occur in no premise.
+
+All other inferences are left to the solver. Rules are only applied to inferences
+that translate into SMT without errors (see `smtlib.check_validity_z3`).
+"""
+
+import dataclasses
+
+from nltk.sem.logic import Expression  # type: ignore
+
+from .formula_dag import (
+    ALL,
+    AND,
+    APPLICATION,
+    EQUALS,
+    EXISTS,
+    IFF,
+    IMPLIES,
+    INDIVIDUAL,
+    NOT,
+    OR,
+    SYMBOL,
+    FormulaNode,
+    formula_node,
+    instantiate,
+    negation,
+)
+from .logic import formula_signature
+from .propositional import MAX_TRUTH_TABLE_ATOMS, TruthTable
+
+# bound on derived facts, so that instantiation stays cheap
+MAX_FACTS = 1000
+
+
+def _individual_constants(nodes: list[FormulaNode]) -> set[FormulaNode]:
+    """Symbols that occur as arguments of predicates or in identity statements."""
+    constants: set[FormulaNode] = set()
+    visited: set[FormulaNode] = set()
+    stack = list(nodes)
+    while stack:
+        node = stack.pop()
+        if node in visited:
+            continue
+        visited.add(node)
+        if node.kind == APPLICATION:
+            terms = node.children[1:]
+        elif node.kind == EQUALS:
+            terms = node.children
+        else:
+            stack.extend(node.children)
+            continue
+        constants.update(t for t in terms if t.kind == SYMBOL)
+    return constants
+
+
+def derived_facts(premises: list[FormulaNode], constants: set[FormulaNode]) -> set[FormulaNode]:
+    """Premises and the formulas derived from them by conjunction elimination,
+    instantiation of universal formulas with `constants`, and modus ponens and
+    modus tollens (also for biconditionals). Antecedents (resp. negated consequents)
+    need not be facts themselves, it suffices that they follow from the facts by
+    introduction."""
+    facts: set[FormulaNode] = set()
+    conditionals: list[tuple[FormulaNode, FormulaNode]] = []
+    agenda = list(premises)
+    while agenda:
+        while agenda and len(facts) < MAX_FACTS:
+            node = agenda.pop()
+            if node in facts:
+                continue
+            facts.add(node)
+            if node.kind == AND:
+                agenda.extend(node.children)
+            elif node.kind == IMPLIES:
+                conditionals.append((node.children[0], node.children[1]))
+            elif node.kind == IFF:
+                first, second = node.children
+                conditionals.extend([(first, second), (second, first)])
+            elif node.kind == ALL and node.label == INDIVIDUAL:
+                agenda.extend(instantiate(node, c) for c in constants)
+        if len(facts) >= MAX_FACTS:
+            break
+        for antecedent, consequent in conditionals:
+            if consequent not in facts and _follows(antecedent, facts):
+                agenda.append(consequent)
+            elif negation(antecedent) not in facts and _follows(negation(consequent), facts):
+                agenda.append(negation(antecedent))
+    return facts
+
+
+def _follows(conclusion: FormulaNode, facts: set[FormulaNode]) -> bool:
+    if conclusion in facts:
+        return True
+    if conclusion.kind == AND:
+        return all(_follows(c, facts) for c in conclusion.children)
+    if conclusion.kind == OR:
+        return any(_follows(c, facts) for c in conclusion.children)
+    if conclusion.kind == IMPLIES:
+        antecedent, consequent = conclusion.children
+        return _follows(consequent, facts) or _follows(negation(antecedent), facts)
+    return False
+
+
+def _one_element_atoms(nodes: list[FormulaNode], booleans: frozenset[str]) -> set[str] | None:
+    """Predicates and propositional variables, or None if a formula has atoms
+    that are not interpretable in a one-element domain this way."""
+    atoms: set[str] = set()
+    visited: set[FormulaNode] = set()
+    stack = list(nodes)
+    while stack:
+        node = stack.pop()
+        if node in visited:
+            continue
+        visited.add(node)
+        if node.kind == SYMBOL:
+            atoms.add(str(node.label))
+        elif node.kind == APPLICATION:
+            if node.children[0].kind != SYMBOL:
+                return None
+            atoms.add(str(node.children[0].label))
+        elif node.kind == EQUALS:
+            # identity of propositional variables, i.e. material equivalence
+            atoms.update(str(c.label) for c in node.children if c.kind == SYMBOL and c.label in booleans)
+        elif node.kind in (NOT, AND, OR, IMPLIES, IFF, ALL, EXISTS):
+            stack.extend(node.children)
+        else:
+            return None
+    return atoms
+
+
+def _evaluate(
+    node: FormulaNode, table: TruthTable, booleans: frozenset[str], values: dict[FormulaNode, int]
+) -> int:
+    """Truth values of a formula in all interpretations over a one-element domain."""
+    value = values.get(node)
+    if value is not None:
+        return value
+    kind = node.kind
+    if kind == SYMBOL:
+        value = table.column(str(node.label))
+    elif kind == APPLICATION:
+        value = table.column(str(node.children[0].label))
+    elif kind == EQUALS:
+        first, second = node.children
+        if first.label in booleans or second.label in booleans:
+            value = table.column(str(first.label)) ^ table.column(str(second.label)) ^ table.mask
+        else:
+            # there's just one individual
+            value = table.mask
+    elif kind in (ALL, EXISTS):
+        value = _evaluate(node.children[0], table, booleans, values)
+    else:
+        operands = [_evaluate(c, table, booleans, values) for c in node.children]
+        if kind == NOT:
+            value = operands[0] ^ table.mask
+        elif kind == AND:
+            value = table.mask
+            for operand in operands:
+                value &= operand
+        elif kind == OR:
+            value = 0
+            for operand in operands:
+                value |= operand
+        elif kind == IMPLIES:
+            value = (operands[0] ^ table.mask) | operands[1]
+        else:  # IFF
+            value = operands[0] ^ operands[1] ^ table.mask
+    values[node] = value
+    return value
+
+
+def _one_element_countermodel(
+    premises: list[FormulaNode], conclusion: FormulaNode, booleans: frozenset[str]
+) -> bool:
+    """Whether there is an interpretation over a one-element domain in which all
+    premises are true and the conclusion is false."""
+    atoms = _one_element_atoms([*premises, conclusion], booleans)
+    if atoms is None or len(atoms) > MAX_TRUTH_TABLE_ATOMS:
+        return False
+    table = TruthTable(sorted(atoms))
+    values: dict[FormulaNode, int] = {}
+    return not table.entails(
+        [_evaluate(p, table, booleans, values) for p in premises],
+        _evaluate(conclusion, table, booleans, values),
+    )
+
+
+def presolve_validity(
+    premises_formalized_nltk: dict[str, Expression],
+    conclusion_formalized_nltk: dict[str, Expression],
+) -> bool | None:
+    """Validity of the inference from premises to conclusion if settled by the
+    rules of the pre-solver (see module docstring), None otherwise.
+
+    The inference must translate into SMT without errors, as ill-formed or
+    undeclared formulas are not detected here."""
+    if not conclusion_formalized_nltk:
+        return None
+    try:
+        premises = [formula_node(e) for e in premises_formalized_nltk.values()]
+        conclusion = formula_node(next(iter(conclusion_formalized_nltk.values())))
+        # symbols that are declared as Booleans rather than individuals (cf. `Z3Translator.declare`)
+        booleans = frozenset().union(
+            *(
+                formula_signature(e).propositional_variables
+                for e in [*premises_formalized_nltk.values(), *conclusion_formalized_nltk.values()]
+            )
+        )
+    except ValueError:
+        return None
+
+    facts = derived_facts(premises, _individual_constants([*premises, conclusion]))
+    if _follows(conclusion, facts) or any(negation(f) in facts for f in facts):
+        return True
+    if _one_element_countermodel(premises, conclusion, booleans):
+        return False
+    return None
+
+
+@dataclasses.dataclass(frozen=True)
+class Presolver:
+    """Settings of the syntactic pre-solver used by Z3 validity checks.
+
+    With `cross_check`, every verdict of the pre-solver is compared with the
+    verdict of the corresponding Z3 check, and mismatches raise a
+    `PresolverCrossCheckError` (for testing, slow)."""
+
+    enabled: bool = True
+    cross_check: bool = False
+
+
+class PresolverCrossCheckError(AssertionError):
+    """Verdicts of pre-solver and Z3 check differ."""
+
+
+_presolver = Presolver()
+
+
+def set_presolver(settings: Presolver) -> None:
+    """Configures the pre-solver used by all Z3 checks in this process."""
+    global _presolver
+    _presolver = settings
+
+
+def get_presolver() -> Presolver:
+    """Settings of the pre-solver used by Z3 checks in this process."""
+    return _presolver
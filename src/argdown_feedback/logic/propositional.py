@@ -0,0 +1,275 @@
+"""propositional.py
+
+Fast path for validity checks of purely propositional inferences.
+
+Formulas without quantifiers, predicates and identity statements between
+individual terms are evaluated on all truth value assignments at once: every
+atom is represented by a bitmask with one bit per row of the truth table, so
+that connectives become single bitwise operations on (big) integers. Above
+`max_truth_table_atoms`, inferences are decided with Z3's SAT tactic instead.
+"""
+
+import dataclasses
+import enum
+from typing import Any
+
+from nltk.sem.logic import (  # type: ignore
+    AndExpression,
+    ConstantExpression,
+    EqualityExpression,
+    Expression,
+    IffExpression,
+    ImpExpression,
+    IndividualVariableExpression,
+    NegatedExpression,
+    OrExpression,
+)
+from z3 import And, Bool, Context, Implies, Not, Or, Tactic, Then, unknown, unsat  # type: ignore
+
+from .formula_dag import ALL, EXISTS, FormulaNode, formula_node
+from .solver_budget import SolverBudget
+
+
+class Fragment(enum.Enum):
+    """Logical fragment of a validity query."""
+
+    PROPOSITIONAL = "propositional"
+    # predicates and identity, but no quantifiers (QF_UF)
+    QUANTIFIER_FREE = "quantifier_free"
+    FIRST_ORDER = "first_order"
+
+
+MAX_TRUTH_TABLE_ATOMS = 16
+
+
+def _is_atom(expression: Expression) -> bool:
+    # same atoms as in `get_propositional_variables`
+    return isinstance(expression, (IndividualVariableExpression, ConstantExpression))
+
+
+def propositional_atoms(expression: Expression) -> set[str] | None:
+    """Atoms of a propositional formula, or None if the formula is not propositional."""
+    atoms: set[str] = set()
+    stack = [expression]
+    while stack:
+        expr = stack.pop()
+        if _is_atom(expr):
+            atoms.add(expr.variable.name)
+        elif isinstance(expr, NegatedExpression):
+            stack.append(expr.term)
+        elif isinstance(expr, (AndExpression, OrExpression, ImpExpression, IffExpression)):
+            stack.extend((expr.first, expr.second))
+        elif isinstance(expr, EqualityExpression) and _is_atom(expr.first) and _is_atom(expr.second):
+            # identity of propositional variables, i.e. material equivalence
+            stack.extend((expr.first, expr.second))
+        else:
+            return None
+    return atoms
+
+
+def classify_fragment(expressions: list[Expression]) -> Fragment:
+    """Smallest fragment that contains all expressions."""
+    if all(propositional_atoms(e) is not None for e in expressions):
+        return Fragment.PROPOSITIONAL
+    try:
+        nodes = [formula_node(e) for e in expressions]
+    except ValueError:
+        return Fragment.FIRST_ORDER
+    visited: set[FormulaNode] = set()
+    while nodes:
+        node = nodes.pop()
+        if node in visited:
+            continue
+        visited.add(node)
+        if node.kind in (ALL, EXISTS):
+            return Fragment.FIRST_ORDER
+        nodes.extend(node.children)
+    return Fragment.QUANTIFIER_FREE
+
+
+class TruthTable:
+    """Evaluates propositional formulas on all assignments of truth values to `atoms`."""
+
+    def __init__(self, atoms: list[str]):
+        self.atoms = list(atoms)
+        n_rows = 1 << len(self.atoms)
+        self.mask = (1 << n_rows) - 1
+        self._columns: dict[str, int] = {}
+        for i, atom in enumerate(self.atoms):
+            # bit j is set iff atom i is true in row j
+            width = 1 << i
+            column, length = ((1 << width) - 1) << width, 2 * width
+            while length < n_rows:
+                column |= column << length
+                length *= 2
+            self._columns[atom] = column & self.mask
+
+    def column(self, atom: str) -> int:
+        """Truth values of atom in all rows, as bitmask."""
+        return self._columns[atom]
+
+    def evaluate(self, expression: Expression) -> int:
+        """Truth values of expression in all rows, as bitmask."""
+        if _is_atom(expression):
+            return self._columns[expression.variable.name]
+        if isinstance(expression, NegatedExpression):
+            return self.evaluate(expression.term) ^ self.mask
+        first = self.evaluate(expression.first)
+        second = self.evaluate(expression.second)
+        if isinstance(expression, AndExpression):
+            return first & second
+        if isinstance(expression, OrExpression):
+            return first | second
+        if isinstance(expression, ImpExpression):
+            return (first ^ self.mask) | second
+        # IffExpression, EqualityExpression
+        return (first ^ second) ^ self.mask
+
+    def entails(self, premises: list[int], conclusion: int) -> bool:
+        """Whether conclusion is true in every row in which all premises are true."""
+        rows = self.mask
+        for premise in premises:
+            rows &= premise
+        return rows & ~conclusion == 0
+
+
+def _z3_formula(expression: Expression, atoms: dict[str, Any]) -> Any:
+    if _is_atom(expression):
+        return atoms[expression.variable.name]
+    if isinstance(expression, NegatedExpression):
+        return Not(_z3_formula(expression.term, atoms))
+    first = _z3_formula(expression.first, atoms)
+    second = _z3_formula(expression.second, atoms)
+    if isinstance(expression, AndExpression):
+        return And(first, second)
+    if isinstance(expression, OrExpression):
+        return Or(first, second)
+    if isinstance(expression, ImpExpression):
+        return Implies(first, second)
+    return first == second
+
+
+def _sat_entails(
+    premises: list[Expression],
+    conclusion: Expression,
+    atoms: list[str],
+    ctx: Context,
+    budget: SolverBudget | None = None,
+    deadline: float | None = None,
+) -> bool:
+    variables = {a: Bool(a, ctx) for a in atoms}
+    solver = Then(Tactic("simplify", ctx=ctx), Tactic("sat", ctx=ctx)).solver()
+    for premise in premises:
+        solver.add(_z3_formula(premise, variables))
+    solver.add(Not(_z3_formula(conclusion, variables)))
+    if budget is not None:
+        budget.configure(solver, deadline)
+    result = solver.check()
+    if result == unknown and budget is not None:
+        budget.check_exceeded(solver)
+    return result == unsat
+
+
+def _propositional_signature(
+    expressions: list[Expression], plchd_substitutions: list[list[str]]
+) -> list[str] | None:
+    """Sorted atoms of the expressions, or None if the fast path is not applicable
+    (non-propositional formulas, or undeclared atoms which Z3 checks report as errors)."""
+    atoms: set[str] = set()
+    for expr in expressions:
+        expr_atoms = propositional_atoms(expr)
+        if expr_atoms is None:
+            return None
+        atoms |= expr_atoms
+    if not atoms.issubset(dict(plchd_substitutions)):
+        return None
+    return sorted(atoms)
+
+
+def check_validity_propositional(
+    premises_formalized_nltk: dict[str, Expression],
+    conclusion_formalized_nltk: dict[str, Expression],
+    plchd_substitutions: list[list[str]],
+    ctx: Context | None = None,
+    max_truth_table_atoms: int = MAX_TRUTH_TABLE_ATOMS,
+    budget: SolverBudget | None = None,
+    deadline: float | None = None,
+) -> bool | None:
+    """Decides validity of a propositional inference (cf. `check_validity_z3`).
+
+    Returns None if the inference is not propositional. The SAT tactic is bounded by
+    `budget` (see `SolverBudget`), truth tables are small enough not to need bounds."""
+    if not conclusion_formalized_nltk:
+        return None
+    premises = list(premises_formalized_nltk.values())
+    conclusion = next(iter(conclusion_formalized_nltk.values()))
+    atoms = _propositional_signature(
+        [*premises, *conclusion_formalized_nltk.values()], plchd_substitutions
+    )
+    if atoms is None:
+        return None
+    if len(atoms) > max_truth_table_atoms:
+        return _sat_entails(
+            premises, conclusion, atoms, ctx if ctx is not None else Context(), budget, deadline
+        )
+    table = TruthTable(atoms)
+    return table.entails([table.evaluate(p) for p in premises], table.evaluate(conclusion))
+
+
+def dispensable_premises_propositional(
+    premises_formalized_nltk: dict[str, Expression],
+    conclusion_formalized_nltk: dict[str, Expression],
+    plchd_substitutions: list[list[str]],
+    max_truth_table_atoms: int = MAX_TRUTH_TABLE_ATOMS,
+) -> list[str] | None:
+    """Keys of premises that are not required to infer the conclusion of a
+    propositional inference (cf. `Z3Session.dispensable_premises`).
+
+    Returns None if the inference is not propositional or has too many atoms."""
+    if not conclusion_formalized_nltk:
+        return None
+    atoms = _propositional_signature(
+        [*premises_formalized_nltk.values(), *conclusion_formalized_nltk.values()],
+        plchd_substitutions,
+    )
+    if atoms is None or len(atoms) > max_truth_table_atoms:
+        return None
+    table = TruthTable(atoms)
+    premises = {k: table.evaluate(e) for k, e in premises_formalized_nltk.items()}
+    conclusion = table.evaluate(next(iter(conclusion_formalized_nltk.values())))
+    return [
+        k
+        for k in premises
+        if table.entails([v for j, v in premises.items() if j != k], conclusion)
+    ]
+
+
+@dataclasses.dataclass(frozen=True)
+class PropositionalFastPath:
+    """Settings of the propositional fast path used by Z3 validity checks.
+
+    With `cross_check`, every verdict of the fast path is compared with the
+    verdict of the corresponding Z3 check, and mismatches raise a
+    `PropositionalCrossCheckError` (for testing, slow)."""
+
+    enabled: bool = True
+    max_truth_table_atoms: int = MAX_TRUTH_TABLE_ATOMS
+    cross_check: bool = False
+
+
+class PropositionalCrossCheckError(AssertionError):
+    """Verdicts of propositional fast path and Z3 check differ."""
+
+
+_fast_path = PropositionalFastPath()
+
+
+def set_propositional_fast_path(settings: PropositionalFastPath) -> None:
+    """Configures the propositional fast path used by all Z3 checks in this process."""
+    global _fast_path
+    _fast_path = settings
+
+
+def get_propositional_fast_path() -> PropositionalFastPath:
+    """Settings of the propositional fast path used by Z3 checks in this process."""
+    return _fast_path
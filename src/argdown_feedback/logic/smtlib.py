@@ -27,16 +27,86 @@ Z3:
 
 """
 
-from nltk.sem.logic import Expression  # type: ignore
-from z3 import parse_smt2_string, SimpleSolver, unsat  # type: ignore
+import threading
+from typing import Any, NamedTuple
+
+from nltk.sem.logic import (  # type: ignore
+    AbstractVariableExpression,
+    AllExpression,
+    AndExpression,
+    ApplicationExpression,
+    EqualityExpression,
+    ExistsExpression,
+    Expression,
+    IffExpression,
+    ImpExpression,
+    NegatedExpression,
+    OrExpression,
+)
+from z3 import (  # type: ignore
+    Ast,
+    Bool,
+    BoolRef,
+    BoolSort,
+    Const,
+    Context,
+    DeclareSort,
+    Exists,
+    ExprRef,
+    ForAll,
+    Function,
+    FuncDeclRef,
+    FreshBool,
+    is_bool,
+    sat,
+    SimpleSolver,
+    unknown,
+    unsat,
+)
+from z3.z3core import (  # type: ignore
+    Z3_mk_and,
+    Z3_mk_app,
+    Z3_mk_eq,
+    Z3_mk_implies,
+    Z3_mk_not,
+    Z3_mk_or,
+)
 
 from .logic_renderer import render_expression, UNIVERSAL_TYPE
-from .logic import Syntax, get_arities, get_propositional_variables
+from .logic import Syntax, formula_signature
+from .presolver import get_presolver, presolve_validity, PresolverCrossCheckError
+from .solver_budget import SolverBudget
+from .propositional import (
+    classify_fragment,
+    check_validity_propositional,
+    dispensable_premises_propositional,
+    get_propositional_fast_path,
+    Fragment,
+    PropositionalCrossCheckError,
+)
+from .solver_strategy import fragment_solver, get_solver_strategy, race_portfolio
+from .validity_cache import get_validity_cache, validity_query_key
+
+
+_thread_local = threading.local()
+
+
+def get_z3_context() -> Context:
+    """Z3 context of the current thread.
+
+    Z3 contexts must not be shared between threads. Rather than using Z3's
+    global default context, every thread (e.g. every worker of the verification
+    service) creates and reuses its own context."""
+    ctx = getattr(_thread_local, "z3_context", None)
+    if ctx is None:
+        ctx = Context()
+        _thread_local.z3_context = ctx
+    return ctx
 
 
 def _SMT_preamble(
     plchd_substitutions: list[list[str]],
-    propositional_variables: list[str],
+    propositional_variables: set[str],
     predicate_arities: dict[str, int],
 ) -> str:
     """SMT preamble to define propositional variables, constants and predicates."""
@@ -145,12 +215,12 @@ def SMT_program_local(
     plchd_substitutions: list[list[str]],
 ) -> str:
     """SMT program to test validity of local inferences."""
-    predicate_arities = {}
-    propositional_variables = []
+    predicate_arities: dict[str, int] = {}
+    propositional_variables: set[str] = set()
     for _, expr in premises_formalized_nltk.items():
-        predicate_arities.update(get_arities(expr))
-        propositional_variables.extend(get_propositional_variables(expr))
-    propositional_variables = list(set(propositional_variables))
+        signature = formula_signature(expr)
+        predicate_arities.update(signature.arities)
+        propositional_variables |= signature.propositional_variables
 
     preamble = _SMT_preamble(
         plchd_substitutions=plchd_substitutions,
@@ -173,15 +243,12 @@ def SMT_program_global(
 ) -> str:
     """SMT program for to test validity of global inference.
     fromm all premises to the conclusion."""
-    predicate_arities = {}
-    propositional_variables = []
-    for _, expr in premises_formalized_nltk.items():
-        predicate_arities.update(get_arities(expr))
-        propositional_variables.extend(get_propositional_variables(expr))
-    for _, expr in conclusion_formalized_nltk.items():
-        predicate_arities.update(get_arities(expr))
-        propositional_variables.extend(get_propositional_variables(expr))
-    propositional_variables = list(set(propositional_variables))
+    predicate_arities: dict[str, int] = {}
+    propositional_variables: set[str] = set()
+    for expr in [*premises_formalized_nltk.values(), *conclusion_formalized_nltk.values()]:
+        signature = formula_signature(expr)
+        predicate_arities.update(signature.arities)
+        propositional_variables |= signature.propositional_variables
     preamble = _SMT_preamble(
         plchd_substitutions=plchd_substitutions,
         propositional_variables=propositional_variables,
@@ -194,19 +261,705 @@ def SMT_program_global(
     return "\n".join([preamble, snippet])
 
 
+class SMTProgram:
+    """SMT2-LIB program of a global validity check, rendered lazily.
+
+    The program text is only needed for feedback messages, so it is not
+    generated before it is actually converted to a string."""
+
+    def __init__(
+        self,
+        premises_formalized_nltk: dict[str, Expression],
+        conclusion_formalized_nltk: dict[str, Expression],
+        plchd_substitutions: list[list[str]],
+    ):
+        self.premises_formalized_nltk = premises_formalized_nltk
+        self.conclusion_formalized_nltk = conclusion_formalized_nltk
+        self.plchd_substitutions = plchd_substitutions
+        self._code: str | None = None
+
+    def __str__(self) -> str:
+        if self._code is None:
+            self._code = SMT_program_global(
+                premises_formalized_nltk=self.premises_formalized_nltk,
+                conclusion_formalized_nltk=self.conclusion_formalized_nltk,
+                plchd_substitutions=self.plchd_substitutions,
+            )
+        return self._code
+
+    def __repr__(self) -> str:
+        return f"SMTProgram({str(self)!r})"
+
+
+class Z3Symbols(NamedTuple):
+    """Constants and functions declared for a check."""
+
+    constants: dict[str, ExprRef]
+    functions: dict[str, FuncDeclRef]
+    key: frozenset  # identifies the declarations, used for caching translations
+
+
+def _symbol_usage(expression: Expression) -> dict[str, tuple[bool, int]]:
+    """Whether every symbol of the formula is a propositional variable, and its arity."""
+    signature = formula_signature(expression)
+    propositional_variables, arities = signature.propositional_variables, signature.arities
+    return {k: (k in propositional_variables, arities.get(k, 0)) for k in signature.symbols}
+
+
+class Z3Translator:
+    """Translates NLTK expressions directly into Z3 expressions.
+
+    Symbols are declared exactly as in the SMT2-LIB programs generated by
+    `SMT_program_global`, so that direct translation and SMT2-LIB code yield
+    the same verdicts: only declared placeholders are available, lower-case
+    placeholders are propositional variables or constants (of the universal
+    sort), and predicates have the arity they are used with.
+
+    Declared sorts, constants and functions as well as translated formulas
+    are cached, so one translator should be reused for all checks of a document.
+    """
+
+    def __init__(self, ctx: Context | None = None):
+        self.ctx = ctx if ctx is not None else get_z3_context()
+        self.universal = DeclareSort(UNIVERSAL_TYPE, self.ctx)
+        self._decls: dict[tuple, Any] = {}
+        # cache keyed by id of expression, expressions are kept alive to keep ids valid
+        self._translations: dict[tuple[int, frozenset], tuple[Expression, BoolRef]] = {}
+
+    def _declared(self, key: tuple, factory: Any) -> Any:
+        decl = self._decls.get(key)
+        if decl is None:
+            decl = factory()
+            self._decls[key] = decl
+        return decl
+
+    def declare(
+        self,
+        plchd_substitutions: list[list[str]],
+        expressions: list[Expression],
+    ) -> Z3Symbols:
+        """Declares constants and predicates used in a check (cf. `_SMT_preamble`)."""
+        predicate_arities: dict[str, int] = {}
+        propositional_variables: set[str] = set()
+        for expr in expressions:
+            signature = formula_signature(expr)
+            predicate_arities.update(signature.arities)
+            propositional_variables |= signature.propositional_variables
+
+        constants: dict[str, ExprRef] = {}
+        functions: dict[str, FuncDeclRef] = {}
+        keys: list[tuple] = []
+        for k in dict(plchd_substitutions):
+            if k in propositional_variables:
+                keys.append(("bool", k))
+                constants[k] = self._declared(keys[-1], lambda: Bool(k, self.ctx))
+            elif k.islower():
+                keys.append(("const", k))
+                constants[k] = self._declared(keys[-1], lambda: Const(k, self.universal))
+            arity = predicate_arities.get(k, 0)
+            if arity > 0:
+                keys.append(("fun", k, arity))
+                functions[k] = self._declared(
+                    keys[-1],
+                    lambda: Function(k, *([self.universal] * arity), BoolSort(self.ctx)),
+                )
+        return Z3Symbols(constants, functions, frozenset(keys))
+
+    def translate(self, expression: Expression, symbols: Z3Symbols) -> BoolRef:
+        """Translates formula, given the declared constants and functions."""
+        cached = self._translations.get((id(expression), symbols.key))
+        if cached is not None:
+            return cached[1]
+
+        constants, functions = symbols.constants, symbols.functions
+        ctx = self.ctx
+        ctx_ref = ctx.ref()
+
+        # connectives are built with Z3's C API, which checks sorts itself,
+        # rather than with the (much slower) sort-casting Python wrappers
+        def boolean(ast: Any) -> BoolRef:
+            return BoolRef(ast, ctx)
+
+        def symbol(expr: Expression, bound: dict[str, ExprRef]) -> ExprRef:
+            if not isinstance(expr, AbstractVariableExpression):
+                raise ValueError(f"Unsupported term: {expr}")
+            name = expr.variable.name
+            if name in bound:
+                return bound[name]
+            if name in constants:
+                return constants[name]
+            raise ValueError(f"unknown constant {name}")
+
+        def translate(expr: Expression, bound: dict[str, ExprRef]) -> ExprRef:
+            if isinstance(expr, AbstractVariableExpression):
+                return symbol(expr, bound)
+            if isinstance(expr, EqualityExpression):
+                first, second = symbol(expr.first, bound), symbol(expr.second, bound)
+                return boolean(Z3_mk_eq(ctx_ref, first.as_ast(), second.as_ast()))
+            if isinstance(expr, ApplicationExpression):
+                function, arguments = expr.uncurry()
+                if not isinstance(function, AbstractVariableExpression):
+                    raise ValueError(f"Unsupported function term: {function}")
+                name = function.variable.name
+                decl = functions.get(name)
+                if name in bound or decl is None or decl.arity() != len(arguments):
+                    raise ValueError(
+                        f"unknown function {name} with {len(arguments)} argument(s)"
+                    )
+                args = [translate(a, bound) for a in arguments]
+                asts = (Ast * len(args))(*[a.as_ast() for a in args])
+                return boolean(Z3_mk_app(ctx_ref, decl.ast, len(args), asts))
+            if isinstance(expr, (AllExpression, ExistsExpression)):
+                quantifier = type(expr)
+                names: list[str] = []
+                term = expr
+                while isinstance(term, quantifier):
+                    names.append(term.variable.name)
+                    term = term.term
+                variables = [Const(name, self.universal) for name in names]
+                body = translate(term, {**bound, **dict(zip(names, variables))})
+                if not is_bool(body):
+                    raise ValueError(f"Quantified formula is not of sort Bool: {term}")
+                if quantifier is AllExpression:
+                    return ForAll(variables, body)
+                return Exists(variables, body)
+            if isinstance(expr, NegatedExpression):
+                return boolean(Z3_mk_not(ctx_ref, translate(expr.term, bound).as_ast()))
+            if isinstance(expr, (AndExpression, OrExpression)):
+                first, second = translate(expr.first, bound), translate(expr.second, bound)
+                asts = (Ast * 2)(first.as_ast(), second.as_ast())
+                mk = Z3_mk_and if isinstance(expr, AndExpression) else Z3_mk_or
+                return boolean(mk(ctx_ref, 2, asts))
+            if isinstance(expr, ImpExpression):
+                first, second = translate(expr.first, bound), translate(expr.second, bound)
+                return boolean(Z3_mk_implies(ctx_ref, first.as_ast(), second.as_ast()))
+            if isinstance(expr, IffExpression):
+                first, second = translate(expr.first, bound), translate(expr.second, bound)
+                return boolean(Z3_mk_eq(ctx_ref, first.as_ast(), second.as_ast()))
+            raise ValueError(f"Unsupported expression: {expr}")
+
+        translated = translate(expression, {})
+        if not is_bool(translated):
+            raise ValueError(f"Formula is not of sort Bool: {expression}")
+        self._translations[(id(expression), symbols.key)] = (expression, translated)
+        return translated
+
+    def counterexample_query(self, premises: list[BoolRef], conclusion: BoolRef) -> BoolRef:
+        """Formula `(not (=> (and premises) conclusion))`, unsatisfiable iff inference is valid."""
+        ctx_ref = self.ctx.ref()
+        asts = (Ast * len(premises))(*[p.as_ast() for p in premises])
+        implication = Z3_mk_implies(ctx_ref, Z3_mk_and(ctx_ref, len(premises), asts), conclusion.as_ast())
+        return BoolRef(Z3_mk_not(ctx_ref, implication), self.ctx)
+
+
+def _cached_validity(
+    premises_formalized_nltk: dict[str, Expression],
+    conclusion_formalized_nltk: dict[str, Expression],
+    plchd_substitutions: list[list[str]],
+) -> tuple[Any, str | None, bool | None]:
+    """Looks up a verdict in the validity cache (if installed), returns cache, key, and verdict (or None)."""
+    cache = get_validity_cache()
+    if cache is None:
+        return None, None, None
+    key = validity_query_key(premises_formalized_nltk, conclusion_formalized_nltk, plchd_substitutions)
+    return cache, key, cache.get(key)
+
+
+def _check_isolated(
+    premises_formalized_nltk: dict[str, Expression],
+    conclusion_formalized_nltk: dict[str, Expression],
+    plchd_substitutions: list[list[str]],
+    translator: Z3Translator,
+    budget: SolverBudget | None = None,
+    deadline: float | None = None,
+    translated: tuple[list[BoolRef], list[BoolRef]] | None = None,
+) -> Any:
+    """Solves the counterexample query of an inference with a fresh solver, returns check-sat result.
+
+    Formulas are translated unless their `translated` premises and conclusions
+    (see `_translate_inference`) are given."""
+    if translated is None:
+        translated = _translate_inference(
+            premises_formalized_nltk, conclusion_formalized_nltk, plchd_substitutions, translator
+        )
+    premises, conclusions = translated
+    return _check_query(
+        translator.counterexample_query(premises, conclusions[0]),
+        classify_fragment([*premises_formalized_nltk.values(), *conclusion_formalized_nltk.values()]),
+        translator.ctx,
+        budget,
+        deadline,
+    )
+
+
+def _translate_inference(
+    premises_formalized_nltk: dict[str, Expression],
+    conclusion_formalized_nltk: dict[str, Expression],
+    plchd_substitutions: list[list[str]],
+    translator: Z3Translator,
+    symbols: Z3Symbols | None = None,
+) -> tuple[list[BoolRef], list[BoolRef]]:
+    """Translated premises and conclusions; raises errors for ill-formed or undeclared formulas.
+
+    Symbols are declared for the inference, unless `symbols` are given."""
+    if symbols is None:
+        symbols = translator.declare(
+            plchd_substitutions,
+            [*premises_formalized_nltk.values(), *conclusion_formalized_nltk.values()],
+        )
+    premises = [translator.translate(e, symbols) for e in premises_formalized_nltk.values()]
+    conclusions = [translator.translate(e, symbols) for e in conclusion_formalized_nltk.values()]
+    return premises, conclusions
+
+
+def _check_query(
+    query: BoolRef,
+    fragment: Fragment,
+    ctx: Context,
+    budget: SolverBudget | None = None,
+    deadline: float | None = None,
+) -> Any:
+    """Checks satisfiability of a query with a fresh solver (see `solver_strategy.fragment_solver`);
+    hard quantified queries are raced in worker processes if configured."""
+    strategy = get_solver_strategy()
+    solver = fragment_solver(fragment, ctx, strategy)
+    solver.add(query)
+    if not strategy.portfolio or fragment != Fragment.FIRST_ORDER:
+        return _check_within_budget(solver, [], budget, deadline)
+
+    timeout_ms = budget.check_timeout_ms(deadline) if budget is not None else None
+    if budget is not None:
+        budget.configure(solver, deadline)
+    # queries that are not decided before racing (and within budget) are raced
+    race = timeout_ms is None or timeout_ms > strategy.race_after_ms
+    if race:
+        solver.set("timeout", strategy.race_after_ms)
+    result = solver.check()
+    if result != unknown:
+        return result
+    if not race:
+        if budget is not None:
+            budget.check_exceeded(solver)
+        return result
+
+    timeout_ms = budget.check_timeout_ms(deadline) if budget is not None else None
+    result, reason = race_portfolio(solver.sexpr(), budget, timeout_ms)
+    if result == unknown and budget is not None:
+        budget.check_reason(reason)
+    return result
+
+
+def _check_within_budget(
+    solver: Any, assumptions: list[BoolRef], budget: SolverBudget | None, deadline: float | None
+) -> Any:
+    """Checks satisfiability under assumptions; raises SolverBudgetExceeded if the budget is exhausted."""
+    if budget is None:
+        return solver.check(*assumptions)
+    budget.configure(solver, deadline)
+    result = solver.check(*assumptions)
+    if result == unknown:
+        budget.check_exceeded(solver)
+    return result
+
+
+def _propositional_validity(
+    premises_formalized_nltk: dict[str, Expression],
+    conclusion_formalized_nltk: dict[str, Expression],
+    plchd_substitutions: list[list[str]],
+    ctx: Context,
+    budget: SolverBudget | None = None,
+    deadline: float | None = None,
+) -> bool | None:
+    """Decides propositional inferences without SMT solving (see `propositional`), returns None otherwise."""
+    settings = get_propositional_fast_path()
+    if not settings.enabled:
+        return None
+    valid = check_validity_propositional(
+        premises_formalized_nltk,
+        conclusion_formalized_nltk,
+        plchd_substitutions,
+        ctx=ctx,
+        max_truth_table_atoms=settings.max_truth_table_atoms,
+        budget=budget,
+        deadline=deadline,
+    )
+    if valid is not None and settings.cross_check:
+        expected = _check_isolated(
+            premises_formalized_nltk,
+            conclusion_formalized_nltk,
+            plchd_substitutions,
+            Z3Translator(ctx),
+            budget,
+            deadline,
+        )
+        if expected != unknown and valid != (expected == unsat):
+            raise PropositionalCrossCheckError(
+                f"Propositional fast path yields valid={valid}, Z3 check yields {expected}: "
+                f"{SMTProgram(premises_formalized_nltk, conclusion_formalized_nltk, plchd_substitutions)}"
+            )
+    return valid
+
+
+def _presolved_validity(
+    premises_formalized_nltk: dict[str, Expression],
+    conclusion_formalized_nltk: dict[str, Expression],
+    plchd_substitutions: list[list[str]],
+    ctx: Context,
+) -> bool | None:
+    """Decides inferences with the syntactic pre-solver (see `presolver`), returns None otherwise.
+
+    Inferences must have been translated without errors."""
+    settings = get_presolver()
+    if not settings.enabled:
+        return None
+    valid = presolve_validity(premises_formalized_nltk, conclusion_formalized_nltk)
+    if valid is not None and settings.cross_check:
+        expected = _check_isolated(
+            premises_formalized_nltk,
+            conclusion_formalized_nltk,
+            plchd_substitutions,
+            Z3Translator(ctx),
+        )
+        if expected != unknown and valid != (expected == unsat):
+            raise PresolverCrossCheckError(
+                f"Pre-solver yields valid={valid}, Z3 check yields {expected}: "
+                f"{SMTProgram(premises_formalized_nltk, conclusion_formalized_nltk, plchd_substitutions)}"
+            )
+    return valid
+
+
+class Z3Session:
+    """Incremental Z3 solver session for all validity checks of a document.
+
+    Symbols are declared once (see `Z3Translator`), and every formula is asserted
+    only once, guarded by an assumption literal. Each check is then answered by
+    solving under the assumptions that activate its premises and its negated
+    conclusion. Should a check be inconclusive within the session, it is repeated
+    with a fresh solver, so that verdicts coincide with isolated checks.
+
+    If a `budget` is given, every check is bounded accordingly, and all checks
+    must be finished by the `deadline` (defaults to the budget's request deadline).
+    """
+
+    def __init__(
+        self,
+        ctx: Context | None = None,
+        budget: SolverBudget | None = None,
+        deadline: float | None = None,
+    ):
+        self.translator = Z3Translator(ctx)
+        self.ctx = self.translator.ctx
+        self.solver = SimpleSolver(ctx=self.ctx)
+        self.budget = budget
+        self.deadline = deadline if deadline is not None or budget is None else budget.deadline()
+        # (formula, negated) -> (formula, guard); formulas are kept alive to keep ids valid
+        self._guards: dict[tuple[int, bool], tuple[BoolRef, BoolRef]] = {}
+        # placeholders, usage of symbols and symbols declared for the document (see `declare`)
+        self._document: tuple[list[list[str]], dict[str, tuple[bool, int]], Z3Symbols] | None = None
+
+    def declare(self, plchd_substitutions: list[list[str]], expressions: list[Expression]) -> None:
+        """Declares the symbols of all formulas of the document once for all checks.
+
+        Checks among these formulas (or their negations) then share declarations and
+        translations, rather than declaring symbols for every check. This requires that
+        all formulas use every symbol alike (as propositional variable, or with the same
+        arity); otherwise, and for other formulas, symbols are still declared per check."""
+        self._document = None
+        usage: dict[str, tuple[bool, int]] = {}
+        try:
+            for expr in expressions:
+                for k, use in _symbol_usage(expr).items():
+                    if usage.setdefault(k, use) != use:
+                        return
+        except ValueError:
+            return
+        symbols = self.translator.declare(plchd_substitutions, expressions)
+        self._document = (plchd_substitutions, usage, symbols)
+
+    def _symbols(self, plchd_substitutions: list[list[str]], expressions: list[Expression]) -> Z3Symbols:
+        """Symbols of the document if they are declared alike for the check, else the check's own symbols."""
+        if self._document is not None:
+            document_plchd, usage, symbols = self._document
+            try:
+                if (plchd_substitutions is document_plchd or plchd_substitutions == document_plchd) and all(
+                    usage.get(k) == use for expr in expressions for k, use in _symbol_usage(expr).items()
+                ):
+                    return symbols
+            except ValueError:
+                pass  # raised again when declaring symbols for the check
+        return self.translator.declare(plchd_substitutions, expressions)
+
+    def _guard(self, formula: BoolRef, negated: bool = False) -> BoolRef:
+        """Assumption literal that activates (the negation of) the formula."""
+        key = (formula.get_id(), negated)
+        cached = self._guards.get(key)
+        if cached is None:
+            ctx_ref = self.ctx.ref()
+            guard = FreshBool("guard", self.ctx)
+            guarded = Z3_mk_not(ctx_ref, formula.as_ast()) if negated else formula.as_ast()
+            self.solver.add(BoolRef(Z3_mk_implies(ctx_ref, guard.as_ast(), guarded), self.ctx))
+            cached = (formula, guard)
+            self._guards[key] = cached
+        return cached[1]
+
+    def check_validity(
+        self,
+        premises_formalized_nltk: dict[str, Expression],
+        conclusion_formalized_nltk: dict[str, Expression],
+        plchd_substitutions: list[list[str]],
+    ) -> tuple[bool, SMTProgram]:
+        """Checks validity of the inference from premises to conclusion (cf. `check_validity_z3`)."""
+        smtlib_code = SMTProgram(
+            premises_formalized_nltk=premises_formalized_nltk,
+            conclusion_formalized_nltk=conclusion_formalized_nltk,
+            plchd_substitutions=plchd_substitutions,
+        )
+        cache, key, valid = _cached_validity(
+            premises_formalized_nltk, conclusion_formalized_nltk, plchd_substitutions
+        )
+        if valid is None:
+            valid = _propositional_validity(
+                premises_formalized_nltk,
+                conclusion_formalized_nltk,
+                plchd_substitutions,
+                self.ctx,
+                self.budget,
+                self.deadline,
+            )
+            if cache is not None and valid is not None:
+                cache.put(key, valid)
+        if valid is not None:
+            return valid, smtlib_code
+
+        translator = self.translator
+        symbols = self._symbols(
+            plchd_substitutions,
+            [*premises_formalized_nltk.values(), *conclusion_formalized_nltk.values()],
+        )
+        premises, conclusions = _translate_inference(
+            premises_formalized_nltk, conclusion_formalized_nltk, plchd_substitutions, translator, symbols
+        )
+        valid = _presolved_validity(
+            premises_formalized_nltk, conclusion_formalized_nltk, plchd_substitutions, self.ctx
+        )
+        if valid is not None:
+            if cache is not None:
+                cache.put(key, valid)
+            return valid, smtlib_code
+
+        assumptions = [self._guard(p) for p in premises] + [self._guard(conclusions[0], negated=True)]
+        result = _check_within_budget(self.solver, assumptions, self.budget, self.deadline)
+        if result == unknown:
+            result = _check_query(
+                translator.counterexample_query(premises, conclusions[0]),
+                classify_fragment([*premises_formalized_nltk.values(), *conclusion_formalized_nltk.values()]),
+                self.ctx,
+                self.budget,
+                self.deadline,
+            )
+
+        if cache is not None and result != unknown:
+            cache.put(key, result == unsat)
+        return result == unsat, smtlib_code
+
+    def dispensable_premises(
+        self,
+        premises_formalized_nltk: dict[str, Expression],
+        conclusion_formalized_nltk: dict[str, Expression],
+        plchd_substitutions: list[list[str]],
+    ) -> dict[str, SMTProgram]:
+        """Premises that are not required to infer the conclusion, i.e., the remaining
+        premises still entail the conclusion (with SMT2-LIB programs that show this).
+
+        Uses unsat cores instead of checking every premise separately: If all premises
+        entail the conclusion, every premise outside of the unsat core is dispensable,
+        and only the premises in the core have to be checked individually (each of which
+        checks yields another core, possibly settling further premises). If all premises
+        don't entail the conclusion, no premise is dispensable. Propositional inferences
+        are evaluated with truth tables instead (see `propositional`)."""
+        settings = get_propositional_fast_path()
+        dispensable_keys = (
+            dispensable_premises_propositional(
+                premises_formalized_nltk,
+                conclusion_formalized_nltk,
+                plchd_substitutions,
+                max_truth_table_atoms=settings.max_truth_table_atoms,
+            )
+            if settings.enabled
+            else None
+        )
+        if dispensable_keys is None or settings.cross_check:
+            expected = self._dispensable_premises_z3(
+                premises_formalized_nltk, conclusion_formalized_nltk, plchd_substitutions
+            )
+            if dispensable_keys is not None and dispensable_keys != expected:
+                raise PropositionalCrossCheckError(
+                    f"Propositional fast path yields dispensable premises {dispensable_keys}, "
+                    f"Z3 checks yield {expected}"
+                )
+            dispensable_keys = expected
+
+        return {
+            k: SMTProgram(
+                premises_formalized_nltk={j: e for j, e in premises_formalized_nltk.items() if j != k},
+                conclusion_formalized_nltk=conclusion_formalized_nltk,
+                plchd_substitutions=plchd_substitutions,
+            )
+            for k in dispensable_keys
+        }
+
+    def _dispensable_premises_z3(
+        self,
+        premises_formalized_nltk: dict[str, Expression],
+        conclusion_formalized_nltk: dict[str, Expression],
+        plchd_substitutions: list[list[str]],
+    ) -> list[str]:
+        translator = self.translator
+        symbols = self._symbols(
+            plchd_substitutions,
+            [*premises_formalized_nltk.values(), *conclusion_formalized_nltk.values()],
+        )
+        guards = {
+            k: self._guard(translator.translate(e, symbols))
+            for k, e in premises_formalized_nltk.items()
+        }
+        conclusions = [translator.translate(e, symbols) for e in conclusion_formalized_nltk.values()]
+        negated_conclusion = self._guard(conclusions[0], negated=True)
+
+        def entails(keys: list[str], need_core: bool = False) -> tuple[Any, set[int] | None]:
+            """Checks entailment, returns result and ids of guards in unsat core (if available)."""
+            cache, key, valid = _cached_validity(
+                {k: premises_formalized_nltk[k] for k in keys},
+                conclusion_formalized_nltk,
+                plchd_substitutions,
+            )
+            if valid is False or (valid and not need_core):
+                return (unsat if valid else sat), None
+            result = _check_within_budget(
+                self.solver, [*[guards[k] for k in keys], negated_conclusion], self.budget, self.deadline
+            )
+            if cache is not None and result != unknown:
+                cache.put(key, result == unsat)
+            if result == unsat:
+                return result, {g.get_id() for g in self.solver.unsat_core()}
+            if result == unknown:
+                solver = SimpleSolver(ctx=self.ctx)
+                solver.add(
+                    translator.counterexample_query(
+                        [translator.translate(premises_formalized_nltk[k], symbols) for k in keys],
+                        conclusions[0],
+                    )
+                )
+                result = _check_within_budget(solver, [], self.budget, self.deadline)
+                if cache is not None and result != unknown:
+                    cache.put(key, result == unsat)
+            return result, None
+
+        def settle(core: set[int] | None, removed: str | None) -> None:
+            """Premises outside of an unsat core of the remaining premises are dispensable."""
+            if core is None:
+                return
+            for k in undecided.copy():
+                if k != removed and guards[k].get_id() not in core:
+                    dispensable.add(k)
+                    undecided.remove(k)
+
+        keys = list(premises_formalized_nltk)
+        dispensable: set[str] = set()
+        undecided = set(keys)
+        result, core = entails(keys, need_core=True)
+        if result == sat:
+            undecided.clear()
+        settle(core, None)
+        for k in keys:
+            if k not in undecided:
+                continue
+            undecided.remove(k)
+            result, core = entails([j for j in keys if j != k])
+            if result == unsat:
+                dispensable.add(k)
+                settle(core, k)
+
+        return [k for k in keys if k in dispensable]
+
+
 def check_validity_z3(
     premises_formalized_nltk: dict[str, Expression],
     conclusion_formalized_nltk: dict[str, Expression],
     plchd_substitutions: list[list[str]],
-) -> tuple[bool, str]:
-    """Generates and executes SMT2-LIB code using Z3 solver."""
-    smtlib_code = SMT_program_global(
+    ctx: Context | None = None,
+    translator: Z3Translator | None = None,
+    session: Z3Session | None = None,
+    budget: SolverBudget | None = None,
+) -> tuple[bool, SMTProgram]:
+    """Checks validity of the inference from premises to conclusion using Z3 solver.
+
+    Formulas are translated directly into Z3 expressions; the equivalent SMT2-LIB
+    program is returned for feedback and only rendered when used. If a `session`
+    is given, the check is run incrementally within that session. Otherwise uses
+    the translator's context, or else the current thread's Z3 context unless `ctx` is given.
+
+    If a validity cache is installed (see `validity_cache.set_validity_cache`), verdicts
+    are looked up there first; conclusive verdicts are added to the cache. Propositional
+    inferences are decided without SMT solving (see `propositional.set_propositional_fast_path`),
+    and so are inferences settled by the syntactic pre-solver (see `presolver.set_presolver`).
+
+    Checks are bounded by the session's budget, or else by `budget` (see `SolverBudget`);
+    checks that exceed their budget raise `SolverBudgetExceeded`."""
+    if session is not None:
+        return session.check_validity(
+            premises_formalized_nltk=premises_formalized_nltk,
+            conclusion_formalized_nltk=conclusion_formalized_nltk,
+            plchd_substitutions=plchd_substitutions,
+        )
+    smtlib_code = SMTProgram(
         premises_formalized_nltk=premises_formalized_nltk,
         conclusion_formalized_nltk=conclusion_formalized_nltk,
         plchd_substitutions=plchd_substitutions,
     )
-    solver = SimpleSolver()
-    ast = parse_smt2_string(smtlib_code)
-    solver.add(ast)
-    valid = (solver.check() == unsat)
-    return valid, smtlib_code
\ No newline at end of file
+    cache, key, valid = _cached_validity(
+        premises_formalized_nltk, conclusion_formalized_nltk, plchd_substitutions
+    )
+    if valid is not None:
+        return valid, smtlib_code
+
+    if translator is None:
+        translator = Z3Translator(ctx)
+    deadline = budget.deadline() if budget is not None else None
+    valid = _propositional_validity(
+        premises_formalized_nltk,
+        conclusion_formalized_nltk,
+        plchd_substitutions,
+        translator.ctx,
+        budget,
+        deadline,
+    )
+    if valid is not None:
+        if cache is not None:
+            cache.put(key, valid)
+        return valid, smtlib_code
+
+    # translation errors are raised before pre-solving; the translation is reused by the solver check
+    translated = _translate_inference(
+        premises_formalized_nltk, conclusion_formalized_nltk, plchd_substitutions, translator
+    )
+    valid = _presolved_validity(
+        premises_formalized_nltk, conclusion_formalized_nltk, plchd_substitutions, translator.ctx
+    )
+    if valid is not None:
+        if cache is not None:
+            cache.put(key, valid)
+        return valid, smtlib_code
+
+    result = _check_isolated(
+        premises_formalized_nltk,
+        conclusion_formalized_nltk,
+        plchd_substitutions,
+        translator,
+        budget,
+        deadline,
+        translated=translated,
+    )
+    if cache is not None and result != unknown:
+        cache.put(key, result == unsat)
+    return result == unsat, smtlib_code
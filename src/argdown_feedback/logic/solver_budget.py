@@ -0,0 +1,91 @@
+"""solver_budget.py
+
+Resource budgets of Z3 checks.
+
+A `SolverBudget` bounds every single check (time, rlimit, memory) as well as
+the total time of all checks made while verifying a request. Checks that run
+out of budget raise `SolverBudgetExceeded` instead of stalling the caller.
+"""
+
+import dataclasses
+import time
+from typing import Any
+
+# Z3's reasons for unknown results that are due to resource limits
+_BUDGET_REASONS = ("canceled", "timeout", "limit", "memory")
+
+
+class SolverBudgetExceeded(TimeoutError):
+    """Z3 check could not be decided within its resource budget."""
+
+
+@dataclasses.dataclass(frozen=True)
+class SolverBudget:
+    """Resource limits of Z3 checks.
+
+    `timeout_ms`, `rlimit` and `max_memory_mb` bound every single check, whereas
+    `request_timeout_ms` bounds the total time of all checks made until the
+    `deadline` (see `SolverBudget.deadline`). Unset limits are unbounded."""
+
+    timeout_ms: int | None = None
+    request_timeout_ms: int | None = None
+    rlimit: int | None = None
+    max_memory_mb: int | None = None
+
+    @classmethod
+    def from_config(cls, **kwargs: Any) -> "SolverBudget | None":
+        """Budget from (API) config options with the same names as the fields; None if unbounded."""
+        budget = cls(**{f.name: kwargs.get(f.name) for f in dataclasses.fields(cls)})
+        return budget if budget.is_bounded else None
+
+    @property
+    def is_bounded(self) -> bool:
+        return any(getattr(self, f.name) for f in dataclasses.fields(self))
+
+    def deadline(self) -> float | None:
+        """Point in time (`time.monotonic`) by which all checks of a request must be finished."""
+        if not self.request_timeout_ms:
+            return None
+        return time.monotonic() + self.request_timeout_ms / 1000
+
+    def check_timeout_ms(self, deadline: float | None = None) -> int | None:
+        """Time limit of the next check (per-check limit or remaining time until deadline), None if unbounded.
+
+        Raises SolverBudgetExceeded if the deadline has passed."""
+        timeout_ms = self.timeout_ms or None
+        if deadline is not None:
+            remaining_ms = int((deadline - time.monotonic()) * 1000)
+            if remaining_ms <= 0:
+                raise SolverBudgetExceeded(
+                    f"Z3 solver budget of {self.request_timeout_ms}ms per request is exhausted."
+                )
+            timeout_ms = min(timeout_ms, remaining_ms) if timeout_ms else remaining_ms
+        return timeout_ms
+
+    def configure(self, solver: Any, deadline: float | None = None) -> None:
+        """Applies the per-check limits (and remaining time until deadline) to a Z3 solver.
+
+        Raises SolverBudgetExceeded if the deadline has passed."""
+        timeout_ms = self.check_timeout_ms(deadline)
+        if timeout_ms:
+            solver.set("timeout", timeout_ms)
+        if self.rlimit:
+            solver.set("rlimit", self.rlimit)
+        if self.max_memory_mb:
+            solver.set("max_memory", self.max_memory_mb)
+
+    def check_exceeded(self, solver: Any) -> None:
+        """Raises SolverBudgetExceeded if the solver's last (unknown) result is due to resource limits."""
+        self.check_reason(solver.reason_unknown())
+
+    def check_reason(self, reason: str) -> None:
+        """Raises SolverBudgetExceeded if the reason of an unknown result is due to resource limits."""
+        if any(r in reason for r in _BUDGET_REASONS):
+            limits = ", ".join(
+                f"{f.name}={getattr(self, f.name)}"
+                for f in dataclasses.fields(self)
+                if getattr(self, f.name)
+            )
+            raise SolverBudgetExceeded(
+                f"Z3 solver could not decide the inference within its resource budget ({limits}): {reason}."
+            )
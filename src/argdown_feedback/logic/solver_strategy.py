@@ -0,0 +1,147 @@
+"""solver_strategy.py
+
+Configuration of the Z3 solvers used for isolated validity checks.
+
+Queries without quantifiers (see `propositional.classify_fragment`) are
+simplified, and equations eliminated, before SMT solving
+(`Then(simplify, solve-eqs, smt)`). Propositional queries are usually settled
+earlier by the truth-table fast path, so in the default pipeline this mostly
+concerns quantifier-free queries with predicates and identity. Quantified queries
+are solved with Z3's default configuration, i.e. model-based quantifier
+instantiation (MBQI), which also finds (finite) countermodels.
+
+Optionally, quantified queries that are not decided within `race_after_ms` are
+raced in two worker processes: MBQI against pure E-matching, which often
+refutes counterexample queries faster but cannot establish countermodels. The
+first conclusive answer is taken, and the other worker is terminated.
+"""
+
+import dataclasses
+import multiprocessing
+import queue
+from typing import Any
+
+from z3 import Context, SimpleSolver, Tactic, Then, parse_smt2_string, sat, unknown, unsat  # type: ignore
+
+from .propositional import Fragment
+from .solver_budget import SolverBudget
+
+# solver configurations raced against each other (by name, see `configured_solver`)
+PORTFOLIO = ("mbqi", "ematching")
+
+_RESULTS = {"sat": sat, "unsat": unsat, "unknown": unknown}
+
+
+@dataclasses.dataclass(frozen=True)
+class SolverStrategy:
+    """Settings of the solvers used for isolated checks.
+
+    With `select_tactics` disabled, quantifier-free queries are checked with Z3's
+    default solver, too. With `portfolio`, quantified queries that are not decided within
+    `race_after_ms` are raced in worker processes (see module docstring)."""
+
+    select_tactics: bool = True
+    portfolio: bool = False
+    race_after_ms: int = 500
+
+
+_strategy = SolverStrategy()
+
+
+def set_solver_strategy(settings: SolverStrategy) -> None:
+    """Configures the solver strategy used by all Z3 checks in this process."""
+    global _strategy
+    _strategy = settings
+
+
+def get_solver_strategy() -> SolverStrategy:
+    """Settings of the solver strategy used by Z3 checks in this process."""
+    return _strategy
+
+
+def configured_solver(configuration: str, ctx: Context) -> Any:
+    """Fresh Z3 solver in one of the configurations 'default', 'preprocessed', 'mbqi' or 'ematching'."""
+    if configuration == "preprocessed":
+        return Then(Tactic("simplify", ctx=ctx), Tactic("solve-eqs", ctx=ctx), Tactic("smt", ctx=ctx)).solver()
+    solver = SimpleSolver(ctx=ctx)
+    if configuration == "mbqi":
+        solver.set("mbqi", True)
+    elif configuration == "ematching":
+        solver.set("mbqi", False)
+    return solver
+
+
+def fragment_solver(fragment: Fragment, ctx: Context, strategy: SolverStrategy | None = None) -> Any:
+    """Fresh Z3 solver for queries of the fragment: preprocessing for queries
+    without quantifiers (if enabled), the default solver otherwise."""
+    strategy = strategy if strategy is not None else _strategy
+    if strategy.select_tactics and fragment != Fragment.FIRST_ORDER:
+        return configured_solver("preprocessed", ctx)
+    return configured_solver("default", ctx)
+
+
+def _race_worker(
+    smt2: str,
+    configuration: str,
+    budget: SolverBudget | None,
+    timeout_ms: int | None,
+    results: Any,
+) -> None:
+    ctx = Context()
+    solver = configured_solver(configuration, ctx)
+    solver.add(parse_smt2_string(smt2, ctx=ctx))
+    if budget is not None:
+        budget.configure(solver)
+    if timeout_ms:
+        solver.set("timeout", timeout_ms)
+    result = solver.check()
+    results.put((configuration, str(result), solver.reason_unknown() if result == unknown else ""))
+
+
+def race_portfolio(
+    smt2: str,
+    budget: SolverBudget | None = None,
+    timeout_ms: int | None = None,
+    configurations: tuple[str, ...] = PORTFOLIO,
+) -> tuple[Any, str]:
+    """Checks satisfiability of the SMT2-LIB assertions with all configurations in
+    parallel worker processes, returns the first conclusive result (or unknown) and
+    the reason of unknown results.
+
+    Workers are bounded by the budget's per-check limits and by `timeout_ms`."""
+    mp_context = multiprocessing.get_context("spawn")
+    results = mp_context.Queue()
+    workers = [
+        mp_context.Process(
+            target=_race_worker, args=(smt2, c, budget, timeout_ms, results), daemon=True
+        )
+        for c in configurations
+    ]
+    for worker in workers:
+        worker.start()
+    result, reasons = unknown, []
+    try:
+        pending = len(workers)
+        while pending:
+            try:
+                _, answer, reason = results.get(timeout=0.1)
+            except queue.Empty:
+                if any(w.is_alive() for w in workers):
+                    continue
+                # workers that crashed don't answer
+                try:
+                    _, answer, reason = results.get(timeout=1)
+                except queue.Empty:
+                    break
+            pending -= 1
+            if answer != "unknown":
+                result = _RESULTS[answer]
+                break
+            reasons.append(reason)
+    finally:
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+            worker.join()
+        results.close()
+    return result, "; ".join(reasons)
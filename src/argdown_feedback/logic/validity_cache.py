@@ -0,0 +1,210 @@
+"""validity_cache.py
+
+Bounded cache of Z3 validity verdicts, shared across requests (and, via an
+optional on-disk store, across processes such as MPJudge workers).
+
+Keys are canonical forms of the queried inference: premises are brought into
+canonical form (see `formula_dag`), deduplicated and sorted, and only the declared
+placeholders that actually occur in the formulas are taken into account.
+"""
+
+from collections import OrderedDict
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+from nltk.sem.logic import Expression  # type: ignore
+
+from argdown_feedback.logic.formula_dag import formula_node
+
+
+def canonical_form(expression: Expression, free_symbols: set[str] | None = None) -> str:
+    """Canonical string of an expression, identical for expressions that are equal
+    up to bound variable names and the order and grouping of commutative operands.
+
+    This is the fingerprint of the expression's node in the formula DAG (see
+    `formula_dag`); the names of free symbols are added to `free_symbols` (if given)."""
+    try:
+        node = formula_node(expression)
+    except ValueError:
+        # beyond first-order logic, fall back to the expression itself
+        if free_symbols is not None:
+            free_symbols.update(v.name for v in expression.free() | expression.constants() | expression.predicates())
+        return f"<{type(expression).__name__} {expression}>"
+    if free_symbols is not None:
+        free_symbols.update(node.symbols)
+    return node.fingerprint.hex()
+
+
+def validity_query_key(
+    premises_formalized_nltk: dict[str, Expression],
+    conclusion_formalized_nltk: dict[str, Expression],
+    plchd_substitutions: list[list[str]],
+) -> str:
+    """Cache key of a validity query: independent of premise order and labels,
+    of the canonical form of formulas, and of declarations that are not used."""
+    symbols: set[str] = set()
+    premises = sorted({canonical_form(e, symbols) for e in premises_formalized_nltk.values()})
+    conclusions = [canonical_form(e, symbols) for e in conclusion_formalized_nltk.values()]
+    declared = sorted(symbols.intersection(dict(plchd_substitutions)))
+    canonical = "\n".join(
+        ["premises:", *premises, "conclusions:", *conclusions, "declared:", " ".join(declared)]
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ValidityCache:
+    """
+    Thread-safe LRU cache of validity verdicts with hit/miss/eviction counters.
+
+    The in-memory cache holds at most `max_entries` verdicts. If `path` is given,
+    verdicts are also written to an SQLite store at that location, which can be
+    shared by several processes (e.g. MPJudge workers) and holds at most
+    `max_disk_entries` verdicts (least recently used ones are evicted first).
+
+    Caches are picklable; connections to the on-disk store are (re)opened lazily
+    in every thread and process.
+    """
+
+    _PRUNE_INTERVAL = 256  # number of writes between size checks of the on-disk store
+
+    def __init__(
+        self,
+        max_entries: int = 100_000,
+        path: str | None = None,
+        max_disk_entries: int = 1_000_000,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.path = path
+        self.max_disk_entries = max_disk_entries
+        self._init_state()
+
+    def _init_state(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, bool] = OrderedDict()
+        self._local = threading.local()
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __getstate__(self) -> dict:
+        return {
+            "max_entries": self.max_entries,
+            "path": self.path,
+            "max_disk_entries": self.max_disk_entries,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._init_state()
+
+    def _connection(self) -> sqlite3.Connection | None:
+        if self.path is None:
+            return None
+        # connections must not be shared across threads or inherited by forked processes
+        conn = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "pid", None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS validity "
+                "(key TEXT PRIMARY KEY, valid INTEGER NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def get(self, key: str) -> bool | None:
+        """Cached verdict for key, or None."""
+        with self._lock:
+            valid = self._entries.get(key)
+            if valid is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return valid
+        conn = self._connection()
+        if conn is not None:
+            row = conn.execute("SELECT valid FROM validity WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                conn.execute("UPDATE validity SET accessed = ? WHERE key = ?", (time.time(), key))
+                valid = bool(row[0])
+                with self._lock:
+                    self.hits += 1
+                    self._store(key, valid)
+                return valid
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, valid: bool) -> None:
+        """Cache verdict for key."""
+        with self._lock:
+            self._store(key, valid)
+            self._writes += 1
+            prune = self._writes % self._PRUNE_INTERVAL == 0
+        conn = self._connection()
+        if conn is not None:
+            conn.execute(
+                "INSERT OR REPLACE INTO validity (key, valid, accessed) VALUES (?, ?, ?)",
+                (key, int(valid), time.time()),
+            )
+            if prune:
+                self._prune(conn)
+
+    def _store(self, key: str, valid: bool) -> None:
+        # requires lock
+        self._entries[key] = valid
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        (count,) = conn.execute("SELECT COUNT(*) FROM validity").fetchone()
+        excess = count - self.max_disk_entries
+        if excess > 0:
+            conn.execute(
+                "DELETE FROM validity WHERE key IN "
+                "(SELECT key FROM validity ORDER BY accessed LIMIT ?)",
+                (excess,),
+            )
+            with self._lock:
+                self.evictions += excess
+
+    def clear(self) -> None:
+        """Remove all cached verdicts (including the on-disk store) and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+        conn = self._connection()
+        if conn is not None:
+            conn.execute("DELETE FROM validity")
+
+    def stats(self) -> dict[str, int]:
+        """Hit, miss and eviction counters, and number of verdicts held in memory."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+            }
+
+
+_validity_cache: ValidityCache | None = None
+
+
+def set_validity_cache(cache: ValidityCache | None) -> None:
+    """Install (or, with None, remove) the validity cache used by all Z3 checks in this process."""
+    global _validity_cache
+    _validity_cache = cache
+
+
+def get_validity_cache() -> ValidityCache | None:
+    """The validity cache used by Z3 checks in this process, if any (disabled by default)."""
+    return _validity_cache
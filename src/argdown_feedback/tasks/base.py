@@ -2,23 +2,44 @@
 
 from abc import ABC, abstractmethod
 import asyncio
+import atexit
 from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import copy
 import dataclasses
 import enum
-import functools
 import hashlib
+import importlib
 import logging
+from multiprocessing import resource_tracker, shared_memory
+import pickle
 import random
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator, MutableMapping
 from statistics import mean
 from textwrap import dedent
 from typing import Any, Awaitable, Callable, Sequence, TypedDict
 
 from bs4 import BeautifulSoup
+from nltk.sem.logic import Expression  # type: ignore
 from openai import AsyncOpenAI, BadRequestError, OpenAI
 from pyargdown import Argdown
 import tenacity
 
+from argdown_feedback.logic.fol_parser import FOLParser
+from argdown_feedback.logic.validity_cache import (
+    get_validity_cache,
+    set_validity_cache,
+    ValidityCache,
+)
+from argdown_feedback.verifiers.parse_cache import (
+    get_parse_cache,
+    set_parse_cache,
+    ParseCache,
+)
+from argdown_feedback.verifiers.processing_handler import ArgdownParser, XMLParser
 from argdown_feedback.verifiers.verification_request import (
     VerificationDType,
     VerificationRequest,
@@ -128,6 +149,111 @@ class Solution(ABC):
         """Cast a raw answer as a solution."""
 
 
+# Version of the compact wire format of evaluations (see `EvaluationPayload`)
+EVALUATION_PAYLOAD_VERSION = 1
+
+
+@dataclasses.dataclass(frozen=True)
+class _EncodedArtifact:
+    """Serialized artifact, as stored in an `EvaluationPayload`.
+
+    Codecs:
+        - "argdown": Argdown code snippet, rehydrated with `ArgdownParser.parse_snippet`
+        - "xml": XML code snippet, rehydrated with `XMLParser.parse_snippet`
+        - "expressions": dict of formula strings, rehydrated with `FOLParser.parse`
+        - "ref": key of another artifact referring to the very same object
+        - "raw": value is passed as is
+    """
+
+    codec: str
+    value: Any
+
+    def decode(self) -> Any:
+        if self.codec == "argdown":
+            return ArgdownParser.parse_snippet(self.value)
+        if self.codec == "xml":
+            return XMLParser.parse_snippet(self.value)
+        if self.codec == "expressions":
+            return {k: FOLParser.parse(v) for k, v in self.value.items()}
+        if self.codec == "raw":
+            return self.value
+        raise ValueError(f"Unknown artifact codec: {self.codec}")
+
+
+class LazyArtifacts(MutableMapping):
+    """
+    Evaluation artifacts that are rehydrated from their serialized form on first access.
+
+    Behaves like a plain dict of artifacts; parsing (e.g. of argdown graphs or
+    xml soups) is deferred until a scorer or feedback generator actually
+    touches the respective artifact.
+    """
+
+    def __init__(self, encoded: dict[str, _EncodedArtifact] | None = None):
+        self._data: dict[str, Any] = {
+            k: v.value if v.codec == "raw" else v for k, v in (encoded or {}).items()
+        }
+        # (rehydrated artifact, its serialized form) pairs
+        self._origins: list[tuple[Any, _EncodedArtifact]] = []
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._data[key]
+        if isinstance(value, _EncodedArtifact):
+            encoded = value
+            value = self[encoded.value] if encoded.codec == "ref" else encoded.decode()
+            self._data[key] = value
+            if encoded.codec != "ref":
+                self._origins.append((value, encoded))
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._data[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def encoded(self, key: str) -> _EncodedArtifact | None:
+        """Serialized form of an artifact that has not been loaded or replaced since."""
+        value = self._data[key]
+        if isinstance(value, _EncodedArtifact):
+            return value
+        for origin, encoded in self._origins:
+            if value is origin:
+                return encoded
+        return None
+
+    def __repr__(self) -> str:
+        items = ", ".join(
+            f"{k!r}: <{v.codec} (not loaded)>"
+            if isinstance(v, _EncodedArtifact)
+            else f"{k!r}: {v!r}"
+            for k, v in self._data.items()
+        )
+        return f"{type(self).__name__}({{{items}}})"
+
+
+@dataclasses.dataclass
+class EvaluationPayload:
+    """
+    Compact, picklable wire format of an Evaluation.
+
+    Used to ship evaluations from judge worker processes to the parent. Parsed
+    artifacts are replaced by their source code snippets (or other compact
+    serializations) and only rehydrated on access.
+    """
+
+    version: int
+    is_valid: bool
+    metrics: dict[str, Any]
+    artifacts: dict[str, _EncodedArtifact]
+
+
 @dataclasses.dataclass
 class Evaluation:
     """
@@ -148,6 +274,10 @@ class Evaluation:
     is_valid: bool
     artifacts: dict[str, Any]  # global artifacts
     metrics: dict[str, Any]
+    # (artifact, codec, code snippet) triples of parsed artifacts that can be rehydrated from source
+    _artifact_sources: list[tuple[Any, str, str]] = dataclasses.field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_verification_request(
@@ -240,11 +370,71 @@ class Evaluation:
         artifacts["all_expressions"] = all_expressions
         artifacts["all_declarations"] = all_declarations
 
-        return cls(
+        evaluation = cls(
             is_valid=request.is_valid(),
             artifacts=artifacts,
             metrics=metrics,
         )
+        for vdata in request.verification_data:
+            if vdata.data is not None and vdata.code_snippet is not None:
+                codec = "argdown" if vdata.dtype == VerificationDType.argdown else "xml"
+                evaluation._artifact_sources.append((vdata.data, codec, vdata.code_snippet))
+        return evaluation
+
+    def _encode_artifact(self, value: Any) -> _EncodedArtifact:
+        for source, codec, code_snippet in self._artifact_sources:
+            if value is source:
+                return _EncodedArtifact(codec, code_snippet)
+        if (
+            isinstance(value, dict)
+            and value
+            and all(isinstance(v, Expression) for v in value.values())
+        ):
+            return _EncodedArtifact("expressions", {k: str(v) for k, v in value.items()})
+        return _EncodedArtifact("raw", value)
+
+    def to_payload(self) -> EvaluationPayload:
+        """Serialize evaluation into compact wire format."""
+        encoded: dict[str, _EncodedArtifact] = {}
+        seen: dict[int, str] = {}
+        for key in self.artifacts:
+            if isinstance(self.artifacts, LazyArtifacts):
+                # pass on serialized form of artifacts received from a worker
+                known = self.artifacts.encoded(key)
+                if known is not None:
+                    if known.codec != "raw" and id(known) in seen:
+                        encoded[key] = _EncodedArtifact("ref", seen[id(known)])
+                    else:
+                        encoded[key] = known
+                        seen[id(known)] = key
+                    continue
+            value = self.artifacts[key]
+            if value is not None and id(value) in seen:
+                encoded[key] = _EncodedArtifact("ref", seen[id(value)])
+                continue
+            encoded[key] = self._encode_artifact(value)
+            if value is not None:
+                seen[id(value)] = key
+        return EvaluationPayload(
+            version=EVALUATION_PAYLOAD_VERSION,
+            is_valid=self.is_valid,
+            metrics=self.metrics,
+            artifacts=encoded,
+        )
+
+    @classmethod
+    def from_payload(cls, payload: EvaluationPayload) -> "Evaluation":
+        """Create an Evaluation from its wire format, artifacts are rehydrated lazily."""
+        if payload.version != EVALUATION_PAYLOAD_VERSION:
+            raise ValueError(
+                f"Unsupported evaluation payload version {payload.version} "
+                f"(expected {EVALUATION_PAYLOAD_VERSION})."
+            )
+        return cls(
+            is_valid=payload.is_valid,
+            artifacts=LazyArtifacts(payload.artifacts),  # type: ignore[arg-type]
+            metrics=payload.metrics,
+        )
 
 
 @dataclasses.dataclass
@@ -513,15 +703,241 @@ class Judge(HIRAbstractGenerator):
     ) -> Sequence[Evaluation]:
         pass
 
+    async def aclose(self) -> None:
+        """Releases any resources held by the judge."""
+
+
+# Heavy modules imported once by every judge worker process when it is started.
+JUDGE_WORKER_WARMUP_MODULES: tuple[str, ...] = (
+    "z3",
+    "nltk.sem.logic",
+    "bs4",
+    "pyargdown",
+    "argdown_feedback.verifiers.processing_handler",
+    "argdown_feedback.verifiers.core.content_check_handler",
+    "argdown_feedback.verifiers.core.arganno_handler",
+    "argdown_feedback.verifiers.core.argmap_handler",
+    "argdown_feedback.verifiers.core.infreco_handler",
+    "argdown_feedback.verifiers.core.logreco_handler",
+    "argdown_feedback.verifiers.coherence.arganno_argmap_handler",
+    "argdown_feedback.verifiers.coherence.arganno_infreco_handler",
+    "argdown_feedback.verifiers.coherence.argmap_infreco_handler",
+    "argdown_feedback.verifiers.coherence.argmap_logreco_handler",
+)
+
+# Worker-local LRU cache of unpickled judge round contexts (problem, original_solution, feedback),
+# keyed by round key; holds several rounds as rounds of different judges may interleave on shared pools
+_worker_round_context: OrderedDict[str, tuple[Any, Any, Any]] = OrderedDict()
+WORKER_ROUND_CONTEXT_CACHE_SIZE = 16
+
+
+def _warm_up_judge_worker(
+    modules: Sequence[str],
+    validity_cache: ValidityCache | None = None,
+    parse_cache: ParseCache | None = None,
+) -> None:
+    """Initializer of judge worker processes: pre-imports heavy dependencies
+    and installs the validity and parse caches of the parent process (if any)."""
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            logger.debug(f"Judge worker failed to pre-import {module}: {e}")
+    if validity_cache is not None:
+        set_validity_cache(validity_cache)
+    if parse_cache is not None:
+        set_parse_cache(parse_cache)
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """Attaches to a shared memory block owned (and unlinked) by the parent process."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # workers share the parent's resource tracker (see `JudgeWorkerPool.executor`),
+    # so re-registering the block on attach is a no-op
+    return shared_memory.SharedMemory(name=name)
+
+
+def _load_round_context(round_key: str, round_shm_name: str, round_size: int) -> tuple[Any, Any, Any]:
+    """Returns the round context for `round_key`, reading it from the round's
+    shared memory block only if this worker has not seen the round yet."""
+    context = _worker_round_context.get(round_key)
+    if context is not None:
+        _worker_round_context.move_to_end(round_key)
+        return context
+    shm = _attach_shared_memory(round_shm_name)
+    try:
+        context = pickle.loads(shm.buf[:round_size])
+    finally:
+        shm.close()
+    _worker_round_context[round_key] = context
+    while len(_worker_round_context) > WORKER_ROUND_CONTEXT_CACHE_SIZE:
+        _worker_round_context.popitem(last=False)
+    return context
+
+
+def _evaluate_in_worker(
+    evaluate_solution: Callable[..., "Evaluation"],
+    round_key: str,
+    round_shm_name: str,
+    round_size: int,
+    solution: Solution,
+) -> "EvaluationPayload":
+    """Evaluates a single solution in a judge worker process.
+
+    Only the round key and the name of the round's shared memory block are sent
+    with each solution; the round context is read and unpickled at most once per
+    worker and judge round. The evaluation is returned in its compact wire format."""
+    problem, original_solution, feedback = _load_round_context(round_key, round_shm_name, round_size)
+    evaluation = evaluate_solution(
+        solution,
+        problem=problem,
+        original_solution=original_solution,
+        feedback=feedback,
+    )
+    return evaluation.to_payload()
+
+
+class JudgeWorkerPool:
+    """
+    Long-lived process pool for evaluating solutions in MPJudges.
+
+    The pool is started lazily on first use, and its workers pre-import all heavy
+    dependencies (z3, nltk, bs4, pyargdown, verifier modules) once. Pools can be
+    shared across judges and HIR generator runs (see `JudgeWorkerPool.shared`),
+    and are released with `close` / `aclose` or by using the pool as (async)
+    context manager. A closed pool is restarted transparently when used again.
+
+    Workers use the validity cache installed in the parent process when the pool
+    is started (see `validity_cache.set_validity_cache`); caches with an on-disk
+    store thus share Z3 verdicts across all workers. Likewise, each worker gets
+    its own parse cache with the budget of the parent's parse cache, if any
+    (see `parse_cache.set_parse_cache`).
+    """
+
+    _shared_pools: dict[int, "JudgeWorkerPool"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        warmup_modules: Sequence[str] | None = None,
+    ):
+        self.max_workers = max_workers
+        self.warmup_modules = tuple(
+            warmup_modules if warmup_modules is not None else JUDGE_WORKER_WARMUP_MODULES
+        )
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, max_workers: int = 8) -> "JudgeWorkerPool":
+        """Returns the process-wide pool with the given number of workers."""
+        with cls._shared_lock:
+            pool = cls._shared_pools.get(max_workers)
+            if pool is None:
+                pool = cls(max_workers=max_workers)
+                cls._shared_pools[max_workers] = pool
+            return pool
+
+    @classmethod
+    def close_shared(cls) -> None:
+        """Shuts down all process-wide pools."""
+        with cls._shared_lock:
+            pools = list(cls._shared_pools.values())
+            cls._shared_pools.clear()
+        for pool in pools:
+            pool.close()
+
+    @property
+    def is_running(self) -> bool:
+        return self._executor is not None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """The underlying executor, started on first access."""
+        with self._lock:
+            if self._executor is None:
+                # workers inherit the parent's resource tracker for round shared memory blocks
+                resource_tracker.ensure_running()
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=_warm_up_judge_worker,
+                    initargs=(self.warmup_modules, get_validity_cache(), get_parse_cache()),
+                )
+            return self._executor
+
+    async def amap(self, fn: Callable[..., Any], *iterables: Sequence[Any]) -> list[Any]:
+        """Applies `fn` to the items of `iterables` in the worker processes, preserving order."""
+        loop = asyncio.get_running_loop()
+        executor = self.executor
+        futures = [loop.run_in_executor(executor, fn, *args) for args in zip(*iterables)]
+        try:
+            return list(await asyncio.gather(*futures))
+        except BrokenProcessPool:
+            # a crashed worker renders the executor unusable; restart on next use
+            self._discard(executor)
+            raise
+
+    def _discard(self, executor: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def close(self, wait: bool = True) -> None:
+        """Shuts down the worker processes."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    async def aclose(self) -> None:
+        """Asynchronously shuts down the worker processes."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+
+atexit.register(JudgeWorkerPool.close_shared)
+
 
 class MPJudge(Judge):
     """
     MPJudge implements parallel multiprocessing of solutions to improve efficiency.
+
+    Solutions are evaluated in a persistent `JudgeWorkerPool` (by default, the
+    process-wide pool with `max_workers` workers; pass `worker_pool` to use a
+    dedicated one). The judge round context (problem, original solution, feedback)
+    is pickled once per round into a shared memory block, and each solution is sent
+    to the workers with the round key only.
+
+    `aclose` shuts down dedicated pools only; process-wide pools keep running for
+    other judges and are released by `JudgeWorkerPool.close_shared` (at exit).
     """
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.max_workers = kwargs.get("max_workers", 8)
+        self._worker_pool: JudgeWorkerPool | None = kwargs.get("worker_pool")
+        self._owns_worker_pool = self._worker_pool is not None
+
+    @property
+    def worker_pool(self) -> JudgeWorkerPool:
+        if self._worker_pool is None:
+            self._worker_pool = JudgeWorkerPool.shared(self.max_workers)
+        return self._worker_pool
 
     @abstractmethod
     def _check_inputs(
@@ -560,31 +976,35 @@ class MPJudge(Judge):
             feedback=feedback,
         )
 
-        # multiprocessing with concurrent.futures.PoolExecutor
-
-        # prepare partial function
-        evaluate_solution = functools.partial(
-            self._evaluate_solution,
-            problem=problem,
-            original_solution=original_solution,
-            feedback=feedback,
-        )
-
-        # evaluate solutions in parallel
-        loop = asyncio.get_event_loop()
-
-        tasks = []
+        if not solutions:
+            return []
 
-        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-            for solution in solutions:
-                tasks.append(
-                    loop.run_in_executor(executor, evaluate_solution, solution)
-                )
+        # publish round context once, workers unpickle it once per round
+        round_payload = pickle.dumps((problem, original_solution, feedback))
+        round_key = hashlib.sha256(round_payload).hexdigest()
+        round_shm = shared_memory.SharedMemory(create=True, size=max(len(round_payload), 1))
+        try:
+            round_shm.buf[: len(round_payload)] = round_payload
+            n = len(solutions)
+            payloads = await self.worker_pool.amap(
+                _evaluate_in_worker,
+                [self._evaluate_solution] * n,
+                [round_key] * n,
+                [round_shm.name] * n,
+                [len(round_payload)] * n,
+                solutions,
+            )
+        finally:
+            round_shm.close()
+            round_shm.unlink()
 
-        # wait for all tasks to finish
-        evaluations = await asyncio.gather(*tasks)
+        return [Evaluation.from_payload(payload) for payload in payloads]
 
-        return evaluations
+    async def aclose(self) -> None:
+        """Shuts down the judge's dedicated worker pool (restarted lazily if the judge
+        is used again). Process-wide pools are left running."""
+        if self._worker_pool is not None and self._owns_worker_pool:
+            await self._worker_pool.aclose()
 
 
 class FeedbackGenerator(HIRAbstractGeneratorLLM):
@@ -1311,6 +1731,16 @@ class HIRPreferencePairGenerator(HIRAbstractGenerator):
 
         return pairs
 
+    async def aclose(self) -> None:
+        """Releases resources held by the judge, such as a dedicated worker pool."""
+        await self.judge.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
 
 class HIREvaluator(HIRAbstractGenerator):
     def __init__(
@@ -1368,3 +1798,13 @@ class HIREvaluator(HIRAbstractGenerator):
             else 0.0
         )
         return eval_result
+
+    async def aclose(self) -> None:
+        """Releases resources held by the judge, such as a dedicated worker pool."""
+        await self.judge.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
@@ -22,7 +22,7 @@ from argdown_feedback.tasks.base import (
     FeedbackGenerator,
 )
 
-from argdown_feedback.logic.logic import get_propositional_variables
+from argdown_feedback.logic.logic import formula_signature
 from argdown_feedback.logic.fol_to_nl import FOL2NLTranslator
 from argdown_feedback.verifiers.base import CompositeHandler
 from argdown_feedback.verifiers.core.infreco_handler import InfRecoCompositeHandler, NoPropInlineDataHandler
@@ -887,7 +887,7 @@ class PredicateLogicPreferencePairGenerator(ScoringVirtuePreferencePairGenerator
         all_expressions = evaluation.artifacts["all_expressions"]
         if not all_expressions:
             return 0
-        n_has_prop_vars = sum(bool(get_propositional_variables(expr)) for expr in all_expressions.values())
+        n_has_prop_vars = sum(bool(formula_signature(expr).propositional_variables) for expr in all_expressions.values())
         return 1 - (n_has_prop_vars / len(all_expressions))
 
 
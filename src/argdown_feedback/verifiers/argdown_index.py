@@ -0,0 +1,143 @@
+"""argdown_index.py
+
+Label lookups in parsed Argdown documents, shared by all handlers of a request.
+
+Handlers look up propositions, arguments, the premises and conclusions of
+arguments, and dialectical relations by label. Rather than scanning the
+document for every lookup, an `ArgdownIndex` is built once per verification
+data item (by `ArgdownParser`, or else on first use) and cached in the
+request's artifacts. The index also holds the inference graphs of the
+arguments (see `InferenceGraph`), which are built on first use.
+"""
+
+from functools import cached_property
+from typing import Any
+
+from pyargdown import Argdown, Argument, Conclusion, DialecticalRelation, Proposition
+
+from argdown_feedback.verifiers.verification_request import (
+    PrimaryVerificationData,
+    VerificationRequest,
+)
+
+# request artifact holding the indexes of parsed Argdown documents (by verification data id)
+ARGDOWN_INDEX_ARTIFACT = "argdown_index"
+
+
+class InferenceGraph:
+    """Inferences of an argument, as given by the inference data of its conclusions.
+
+    Each conclusion is inferred from the premises and conclusions listed under
+    `from_key` in its inference data. Derived label sets are computed on first
+    use, so that malformed inference data only affects the checks that rely on it."""
+
+    def __init__(self, argument: Argument, from_key: str = "from"):
+        self.argument = argument
+        self.from_key = from_key
+        pcs = argument.pcs or []
+        # position of the first premise or conclusion with a label
+        self.positions: dict[str | None, int] = {}
+        for position, pr in enumerate(pcs):
+            self.positions.setdefault(pr.label, position)
+        # first conclusion with a label
+        self.conclusions: dict[str | None, Conclusion] = {}
+        for pr in pcs:
+            if isinstance(pr, Conclusion):
+                self.conclusions.setdefault(pr.label, pr)
+        self._ancestors: dict[str, frozenset] = {}
+
+    def introduced_before(self, label: str, position: int) -> bool:
+        """Whether a premise or conclusion with the label precedes the given position in the argument."""
+        return self.positions.get(label, position) < position
+
+    @cached_property
+    def used_labels(self) -> set:
+        """Labels referred to in the inference data of any conclusion."""
+        used: set = set()
+        for c in self.argument.pcs or []:
+            if isinstance(c, Conclusion) and isinstance(c.inference_data, dict):
+                used.update(c.inference_data.get(self.from_key, []))
+        return used
+
+    def ancestors(self, label: str) -> frozenset:
+        """Labels used directly or indirectly in the inference to the conclusion with the label."""
+        if label not in self._ancestors:
+            reached: set = set()
+            stack = [label]
+            while stack:
+                c = self.conclusions.get(stack.pop())
+                if c is None:
+                    continue
+                for ref in c.inference_data.get(self.from_key, []):
+                    if ref not in reached:
+                        reached.add(ref)
+                        stack.append(ref)
+            self._ancestors[label] = frozenset(reached)
+        return self._ancestors[label]
+
+
+class ArgdownIndex:
+    """Elements of an Argdown document by label.
+
+    If several elements share a label, lookups return the first one (as scans of
+    the document with `next` do)."""
+
+    def __init__(self, argdown: Argdown):
+        self.argdown = argdown
+        self.propositions: dict[str | None, Proposition] = {}
+        for prop in argdown.propositions:
+            self.propositions.setdefault(prop.label, prop)
+        self.arguments: dict[str | None, Argument] = {}
+        for argument in argdown.arguments:
+            self.arguments.setdefault(argument.label, argument)
+        # premises and conclusions by argument (id) and label
+        self._pcs: dict[int, dict[str, Any]] = {}
+        for argument in argdown.arguments:
+            members: dict[str, Any] = {}
+            for pr in argument.pcs or []:
+                members.setdefault(pr.label, pr)
+            self._pcs[id(argument)] = members
+        self.relations: dict[tuple[str, str], list[DialecticalRelation]] = {}
+        for drel in argdown.dialectical_relations:
+            self.relations.setdefault((drel.source, drel.target), []).append(drel)
+        self._inference_graphs: dict[tuple[int, str], InferenceGraph] = {}
+
+    def pcs_labels(self, argument: Argument) -> set[str]:
+        """Labels of the premises and conclusions of the argument."""
+        return set(self._pcs.get(id(argument), ()))
+
+    def pcs_member(self, argument: Argument, label: str) -> Any:
+        """Premise or conclusion of the argument with the label, if any."""
+        try:
+            return self._pcs.get(id(argument), {}).get(label)
+        except TypeError:
+            # malformed (unhashable) label, e.g. from inline yaml data
+            return None
+
+    def pcs_proposition(self, argument: Argument, label: str) -> Proposition | None:
+        """Proposition of the premise or conclusion of the argument with the label, if any."""
+        pr = self.pcs_member(argument, label)
+        return self.propositions.get(pr.proposition_label) if pr is not None else None
+
+    def inference_graph(self, argument: Argument, from_key: str = "from") -> InferenceGraph:
+        """Inference graph of the argument (built on first use)."""
+        key = (id(argument), from_key)
+        if key not in self._inference_graphs:
+            self._inference_graphs[key] = InferenceGraph(argument, from_key)
+        return self._inference_graphs[key]
+
+    def dialectical_relations(self, source: str | None, target: str | None) -> list[DialecticalRelation]:
+        """Dialectical relations from source to target (cf. `Argdown.get_dialectical_relation`)."""
+        return self.relations.get((source, target), []) if source is not None and target is not None else []
+
+
+def argdown_index(vdata: PrimaryVerificationData, request: VerificationRequest) -> ArgdownIndex:
+    """Index of the parsed Argdown document of the verification data, cached in the request."""
+    if not isinstance(vdata.data, Argdown):
+        raise ValueError(f"Internal error: data of {vdata.id} is not a parsed Argdown document")
+    indexes = request.artifacts.setdefault(ARGDOWN_INDEX_ARTIFACT, {})
+    index = indexes.get(vdata.id)
+    if index is None or index.argdown is not vdata.data:
+        index = ArgdownIndex(vdata.data)
+        indexes[vdata.id] = index
+    return index
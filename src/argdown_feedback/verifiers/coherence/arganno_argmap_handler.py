@@ -14,6 +14,7 @@ from argdown_feedback.verifiers.verification_request import (
     VerificationResult,
     VDFilter,
 )
+from argdown_feedback.verifiers.argdown_index import argdown_index
 from argdown_feedback.verifiers.base import CompositeHandler
 from argdown_feedback.verifiers.coherence.coherence_handler import CoherenceHandler
 
@@ -64,11 +65,12 @@ class BaseArgannoArgmapCoherenceHandler(CoherenceHandler):
         all_annotation_ids = [
             a.get("id") for a in soup_anno.find_all("proposition") if a.get("id")  # type: ignore
         ]
+        argmap_labels = set(all_argmap_labels)
         argument_label_map: dict[str,str] = {}
         for a in soup_anno.find_all("proposition"):
             a_label = a.get("argument_label")  # type: ignore
             a_id = a.get("id")  # type: ignore
-            if a_label in all_argmap_labels:
+            if a_label in argmap_labels:
                 argument_label_map[str(a_id)] = str(a_label)
 
         return all_argmap_labels, all_annotation_ids, argument_label_map
@@ -84,12 +86,14 @@ class ArgannoArgmapElemCohereHandler(BaseArgannoArgmapCoherenceHandler):
         argdown_map: ArgdownMultiDiGraph = vdata1.data
         soup_anno: BeautifulSoup = vdata2.data
         all_argmap_labels, all_annotation_ids, argument_label_map = self.get_labels(argdown_map, soup_anno)
+        argmap_labels = set(all_argmap_labels)
+        annotation_ids = set(all_annotation_ids)
 
         msgs = []
 
         annos_illegal_label = [
             a for a in soup_anno.find_all("proposition")
-            if a.get("argument_label") not in all_argmap_labels  # type: ignore
+            if a.get("argument_label") not in argmap_labels  # type: ignore
         ]
         if annos_illegal_label:
             for a in annos_illegal_label:
@@ -106,7 +110,7 @@ class ArgannoArgmapElemCohereHandler(BaseArgannoArgmapCoherenceHandler):
                 )
                 continue
             for id_ref in id_refs:
-                if id_ref not in all_annotation_ids:
+                if id_ref not in annotation_ids:
                     msgs.append(
                         f"Illegal 'annotation_ids' reference of node with label '{node.label}': "
                         f"No proposition element with id='{id_ref}' in the annotation."
@@ -140,13 +144,15 @@ class ArgannoArgmapDRelCohereHandler(BaseArgannoArgmapCoherenceHandler):
         argdown_map: ArgdownMultiDiGraph = vdata1.data
         soup_anno: BeautifulSoup = vdata2.data
         _, all_annotation_ids, argument_label_map = self.get_labels(argdown_map, soup_anno)
+        annotation_ids = set(all_annotation_ids)
+        index = argdown_index(vdata1, ctx)
 
         msgs = []
         annotated_relations: list[dict] = []
         for a in soup_anno.find_all("proposition"):
             from_id = a.get("id")  # type: ignore
             for support in a.get("supports", []):  # type: ignore
-                if support in all_annotation_ids:
+                if support in annotation_ids:
                     annotated_relations.append(
                         {
                             "from_id": from_id,
@@ -155,7 +161,7 @@ class ArgannoArgmapDRelCohereHandler(BaseArgannoArgmapCoherenceHandler):
                         }
                     )
             for attacks in a.get("attacks", []):  # type: ignore
-                if attacks in all_annotation_ids:
+                if attacks in annotation_ids:
                     annotated_relations.append(
                         {
                             "from_id": from_id,
@@ -167,23 +173,22 @@ class ArgannoArgmapDRelCohereHandler(BaseArgannoArgmapCoherenceHandler):
 
         for ar in annotated_relations:
             if not any(
-                dr.source == argument_label_map.get(ar["from_id"])
-                and dr.target == argument_label_map.get(ar["to_id"])
-                and dr.valence == ar["valence"]
-                for dr in argdown_map.dialectical_relations
+                dr.valence == ar["valence"]
+                for dr in index.dialectical_relations(
+                    argument_label_map.get(ar["from_id"]), argument_label_map.get(ar["to_id"])
+                )
             ):
                 msgs.append(
                     f"Annotated {str(ar['valence'])} relation {ar['from_id']} -> {ar['to_id']} is not "
                     f"matched by any relation in the argument map."
                 )
 
+        annotated_triples = {
+            (argument_label_map.get(ar["from_id"]), argument_label_map.get(ar["to_id"]), ar["valence"])
+            for ar in annotated_relations
+        }
         for dr in argdown_map.dialectical_relations:
-            if not any(
-                dr.source == argument_label_map.get(ar["from_id"])
-                and dr.target == argument_label_map.get(ar["to_id"])
-                and dr.valence == ar["valence"]
-                for ar in annotated_relations
-            ):
+            if (dr.source, dr.target, dr.valence) not in annotated_triples:
                 msgs.append(
                     f"Dialectical {dr.valence.name} relation {dr.source} -> {dr.target} is not matched by any "
                     f"relation in the text annotation."
@@ -5,8 +5,6 @@ from bs4 import BeautifulSoup
 from pyargdown import (
     Argdown,
     ArgdownMultiDiGraph,
-    Argument,
-    Conclusion,
     Valence,
 )
 
@@ -17,38 +15,11 @@ from argdown_feedback.verifiers.verification_request import (
     VerificationDType,
     VerificationResult,
 )
+from argdown_feedback.verifiers.argdown_index import ArgdownIndex, argdown_index
 from argdown_feedback.verifiers.base import CompositeHandler
 from argdown_feedback.verifiers.coherence.coherence_handler import CoherenceHandler
 
 
-def _get_props_used_in_inference(
-    argument: Argument, pr_label: str, from_key: str = "from"
-) -> list[str]:
-    """Get all proposition labels used directly or indirectly in the inference
-    to a conclusion with label `pr_label`."""
-
-    if argument is None or not argument.pcs:
-        return []
-
-    used_labels = set()
-
-    def add_parent_labels(label: str):
-        c = next(
-            (c for c in argument.pcs if isinstance(c, Conclusion) and c.label == label),
-            None,
-        )
-        if c is None:
-            return []
-        parent_labels = c.inference_data.get(from_key, [])
-        used_labels.update(parent_labels)
-        for ref in parent_labels:
-            add_parent_labels(ref)
-
-    add_parent_labels(pr_label)
-
-    return list(used_labels)
-
-
 class BaseArgannoInfrecoCoherenceHandler(CoherenceHandler):
     """Base handler interface for evaluating coherence of Arganno and InfReco data."""
 
@@ -91,9 +62,14 @@ class BaseArgannoInfrecoCoherenceHandler(CoherenceHandler):
         )
     
     @staticmethod
-    def get_labels(argdown_reco: Argdown, soup_anno: BeautifulSoup) -> tuple[list[str], list, Dict[str, str], Dict[str, str], Dict[str, str]]:
-        """Get labels from argdown and annotation data."""
+    def get_labels(
+        argdown_reco: Argdown, soup_anno: BeautifulSoup, index: ArgdownIndex | None = None
+    ) -> tuple[list[str], list, Dict[str, str], Dict[str, str], Dict[str, str]]:
+        """Get labels from argdown and annotation data (using the index of `argdown_reco`, if given)."""
+        if index is None:
+            index = ArgdownIndex(argdown_reco)
         all_argument_labels = [arg.label for arg in argdown_reco.arguments if arg.label]
+        argument_labels = set(all_argument_labels)
         all_annotation_ids = [
             a.get("id")  # type: ignore
             for a in soup_anno.find_all("proposition")
@@ -112,15 +88,15 @@ class BaseArgannoInfrecoCoherenceHandler(CoherenceHandler):
             a_id = a.get("id")  # type: ignore
             a_ref_reco = a.get("ref_reco_label")  # type: ignore
             
-            if a_label in all_argument_labels and a_id is not None:
+            if a_label in argument_labels and a_id is not None:
                 argument_label_map[str(a_id)] = str(a_label)
                 if a_ref_reco is not None:
                     refreco_map[str(a_id)] = str(a_ref_reco)
                     
                     # Find proposition label
-                    argument = next((arg for arg in argdown_reco.arguments if arg.label == a_label), None)
+                    argument = index.arguments.get(a_label)
                     if argument and argument.pcs:
-                        pr = next((pr for pr in argument.pcs if pr.label == a_ref_reco), None)
+                        pr = index.pcs_member(argument, a_ref_reco)
                         if pr:
                             proposition_label_map[str(a_id)] = str(pr.proposition_label)
 
@@ -136,11 +112,15 @@ class ArgannoInfrecoElemCohereHandler(BaseArgannoInfrecoCoherenceHandler):
         assert isinstance(vdata2.data, BeautifulSoup), "Internal error: vdata2.data is not BeautifulSoup"
         argdown_reco: Argdown = vdata1.data
         soup_anno: BeautifulSoup = vdata2.data
+        index = argdown_index(vdata1, ctx)
         
         all_argument_labels, all_annotation_ids, argument_label_map, refreco_map, proposition_label_map = self.get_labels(
-            argdown_reco, soup_anno
+            argdown_reco, soup_anno, index
         )
 
+        argument_labels = set(all_argument_labels)
+        annotation_ids = set(all_annotation_ids)
+        mapped_argument_labels = set(argument_label_map.values())
         msgs = []
         
         # Check annotation elements against argdown
@@ -149,7 +129,7 @@ class ArgannoInfrecoElemCohereHandler(BaseArgannoInfrecoCoherenceHandler):
             a_id = a.get("id")  # type: ignore
             a_ref_reco = a.get("ref_reco_label")  # type: ignore
             
-            if a_label not in all_argument_labels:
+            if a_label not in argument_labels:
                 msgs.append(
                     f"Illegal 'argument_label' reference of proposition element with id={a_id}: "
                     f"No argument with label '{a_label}' in the Argdown snippet."
@@ -157,22 +137,16 @@ class ArgannoInfrecoElemCohereHandler(BaseArgannoInfrecoCoherenceHandler):
                 continue
                 
             if a_id is not None and a_label is not None and a_ref_reco is not None:
-                argument = next((arg for arg in argdown_reco.arguments if arg.label == a_label), None)
+                argument = index.arguments.get(a_label)
                 if argument and argument.pcs:
-                    if not any(a_ref_reco == pr.label for pr in argument.pcs):
+                    pr = index.pcs_member(argument, a_ref_reco)
+                    if pr is None:
                         msgs.append(
                             f"Illegal 'ref_reco_label' reference of proposition element with id={a_id}: "
                             f"No premise or conclusion with label '{a_ref_reco}' in argument '{a_label}'."
                         )
                     else:
-                        pr = next(
-                            pr for pr in argument.pcs if a_ref_reco == pr.label
-                        )
-                        proposition = next(
-                            prop
-                            for prop in argdown_reco.propositions
-                            if prop.label == pr.proposition_label
-                        )
+                        proposition = index.propositions[pr.proposition_label]
                         id_refs = proposition.data.get("annotation_ids", [])
                         if str(a_id) not in id_refs:
                             msgs.append(
@@ -183,18 +157,14 @@ class ArgannoInfrecoElemCohereHandler(BaseArgannoInfrecoCoherenceHandler):
 
         # Check argdown elements against annotation
         for argument in argdown_reco.arguments:
-            if argument.label not in argument_label_map.values():
+            if argument.label not in mapped_argument_labels:
                 msgs.append(
                     f"Free floating argument: Argument '{argument.label}' does not have any "
                     "corresponding elements in the annotation."
                 )
             
             for pr in argument.pcs:
-                proposition = next(
-                    prop
-                    for prop in argdown_reco.propositions
-                    if prop.label == pr.proposition_label
-                )
+                proposition = index.propositions[pr.proposition_label]
                 id_refs = proposition.data.get("annotation_ids")
                 if id_refs is None:
                     msgs.append(
@@ -203,7 +173,7 @@ class ArgannoInfrecoElemCohereHandler(BaseArgannoInfrecoCoherenceHandler):
                     )
                     continue
                 for id_ref in id_refs:
-                    if id_ref not in all_annotation_ids:
+                    if id_ref not in annotation_ids:
                         msgs.append(
                             f"Illegal 'annotation_ids' reference in proposition '{pr.label}' of argument '{argument.label}': "
                             f"No proposition element with id='{id_ref}' in the annotation."
@@ -245,11 +215,13 @@ class ArgannoInfrecoRelationCohereHandler(BaseArgannoInfrecoCoherenceHandler):
         assert isinstance(vdata2.data, BeautifulSoup), "Internal error: vdata2.data is not BeautifulSoup"
         argdown_reco: Argdown = vdata1.data
         soup_anno: BeautifulSoup = vdata2.data
+        index = argdown_index(vdata1, ctx)
         
         all_argument_labels, all_annotation_ids, argument_label_map, refreco_map, proposition_label_map = self.get_labels(
-            argdown_reco, soup_anno
+            argdown_reco, soup_anno, index
         )
 
+        annotation_ids = set(all_annotation_ids)
         msgs = []
         
         # Extract annotated relations
@@ -259,7 +231,7 @@ class ArgannoInfrecoRelationCohereHandler(BaseArgannoInfrecoCoherenceHandler):
         for a in soup_anno.find_all("proposition"):
             from_id = a.get("id")  # type: ignore
             for support in a.get("supports", []):  # type: ignore
-                if support in all_annotation_ids:
+                if support in annotation_ids:
                     annotated_support_relations.append(
                         {
                             "from_id": str(from_id),
@@ -267,7 +239,7 @@ class ArgannoInfrecoRelationCohereHandler(BaseArgannoInfrecoCoherenceHandler):
                         }
                     )
             for attack in a.get("attacks", []):  # type: ignore
-                if attack in all_annotation_ids:
+                if attack in annotation_ids:
                     annotated_attack_relations.append(
                         {
                             "from_id": str(from_id),
@@ -277,8 +249,7 @@ class ArgannoInfrecoRelationCohereHandler(BaseArgannoInfrecoCoherenceHandler):
 
         # Helper function for dialectical relations
         def _drel_fn(x, y):
-            drels = argdown_reco.get_dialectical_relation(x, y)
-            return drels if drels is not None else []
+            return index.dialectical_relations(x, y)
 
         # Check support relations
         for ar in annotated_support_relations:
@@ -315,17 +286,14 @@ class ArgannoInfrecoRelationCohereHandler(BaseArgannoInfrecoCoherenceHandler):
                     )
                 continue
                 
-            argument = next(
-                (arg for arg in argdown_reco.arguments if arg.label == arglabel_from),
-                None
-            )
+            argument = index.arguments.get(arglabel_from)
             ref_reco_from = refreco_map.get(ar["from_id"])
             ref_reco_to = refreco_map.get(ar["to_id"])
             
             if argument is None or ref_reco_from is None or ref_reco_to is None:
                 continue
                 
-            if ref_reco_from not in _get_props_used_in_inference(argument, ref_reco_to, self.from_key):
+            if ref_reco_from not in index.inference_graph(argument, self.from_key).ancestors(ref_reco_to):
                 msgs.append(
                     f"Annotated support relation {ar['from_id']} -> {ar['to_id']} is not "
                     f"matched by the inferential relations in the argument '{argument.label}'."
@@ -12,6 +12,7 @@ from pyargdown import (
 )
 
 from argdown_feedback.logic import dialectics
+from argdown_feedback.verifiers.argdown_index import argdown_index
 from argdown_feedback.verifiers.verification_request import (
     VerificationRequest,
     PrimaryVerificationData,
@@ -79,19 +80,21 @@ class ArgmapInfrecoElemCohereHandler(BaseArgmapInfrecoCoherenceHandler):
         argdown_map: Argdown = vdata1.data
         argdown_reco: Argdown = vdata2.data
 
+        map_index = argdown_index(vdata1, ctx)
+        reco_index = argdown_index(vdata2, ctx)
+
         msgs = []
         map_labels = list(set(a.label for a in argdown_map.arguments))
         reco_labels = list(set(a.label for a in argdown_reco.arguments))
         for label in map_labels:
-            if label not in reco_labels:
+            if label not in reco_index.arguments:
                 msgs.append(f"Argument <{label}> in map is not reconstructed (argument label mismatch).")
         for label in reco_labels:
-            if label not in map_labels:
+            if label not in map_index.arguments:
                 msgs.append(f"Reconstructed argument <{label}> is not in the map (argument label mismatch).")            
         map_prop_labels = list(set(p.label for p in argdown_map.propositions))
-        reco_prop_labels = list(set(p.label for p in argdown_reco.propositions))
         for label in map_prop_labels:
-            if label not in reco_prop_labels:
+            if label not in reco_index.propositions:
                 msgs.append(f"Claim [{label}] in argument map has no corresponding proposition in reconstructions (proposition label mismatch).")
 
         is_valid = False if msgs else True
@@ -112,6 +115,8 @@ class ArgmapInfrecoRelationCohereHandler(BaseArgmapInfrecoCoherenceHandler):
         assert isinstance(vdata2.data, ArgdownMultiDiGraph), "Internal error: vdata2.data is not ArgdownMultiDiGraph"
         argdown_map: Argdown = vdata1.data
         argdown_reco: Argdown = vdata2.data
+        map_index = argdown_index(vdata1, ctx)
+        reco_index = argdown_index(vdata2, ctx)
 
         msgs = []
         for drel in argdown_map.dialectical_relations:
@@ -120,26 +125,14 @@ class ArgmapInfrecoRelationCohereHandler(BaseArgmapInfrecoCoherenceHandler):
             # get matched source nodes in reco
             source_m: Argument | Proposition | None
             target_m: Argument | Proposition | None
-            if any(a.label==drel.source for a in argdown_map.arguments):
-                source_m =  next( 
-                    (a for a in argdown_reco.arguments if a.label==drel.source),
-                    None
-                )  
+            if drel.source in map_index.arguments:
+                source_m = reco_index.arguments.get(drel.source)
             else:
-                source_m = next(
-                    (p for p in argdown_reco.propositions if p.label==drel.source),
-                    None
-                )
-            if any(a.label==drel.target for a in argdown_map.arguments):
-                target_m = next(
-                    (a for a in argdown_reco.arguments if a.label==drel.target),
-                    None
-                )
+                source_m = reco_index.propositions.get(drel.source)
+            if drel.target in map_index.arguments:
+                target_m = reco_index.arguments.get(drel.target)
             else:
-                target_m = next(
-                    (p for p in argdown_reco.propositions if p.label==drel.target),
-                    None
-                )
+                target_m = reco_index.propositions.get(drel.target)
             #print("drel:", drel)
             #print(f"source_m: {source_m}, target_m: {target_m}")
             if source_m is None or target_m is None:
@@ -151,8 +144,8 @@ class ArgmapInfrecoRelationCohereHandler(BaseArgmapInfrecoCoherenceHandler):
                 if drel.valence == Valence.SUPPORT:
                     if any(
                         dialectics.are_identical(
-                            argdown_reco.get_proposition(pr.proposition_label),
-                            argdown_reco.get_proposition(source_m.pcs[-1].proposition_label)
+                            reco_index.propositions.get(pr.proposition_label),
+                            reco_index.propositions.get(source_m.pcs[-1].proposition_label)
                         )
                         for pr in target_m.pcs
                         if not isinstance(pr, Conclusion)
@@ -166,8 +159,8 @@ class ArgmapInfrecoRelationCohereHandler(BaseArgmapInfrecoCoherenceHandler):
                 elif drel.valence == Valence.ATTACK:
                     if any(
                         dialectics.are_contradictory(
-                            argdown_reco.get_proposition(pr.proposition_label),
-                            argdown_reco.get_proposition(source_m.pcs[-1].proposition_label),
+                            reco_index.propositions.get(pr.proposition_label),
+                            reco_index.propositions.get(source_m.pcs[-1].proposition_label),
                             argdown_reco
                         )
                         for pr in target_m.pcs
@@ -185,7 +178,7 @@ class ArgmapInfrecoRelationCohereHandler(BaseArgmapInfrecoCoherenceHandler):
                 if drel.valence == Valence.SUPPORT:
                     if any(
                         dialectics.are_identical(
-                            argdown_reco.get_proposition(pr.proposition_label),
+                            reco_index.propositions.get(pr.proposition_label),
                             source_m,
                         )
                         for pr in target_m.pcs
@@ -200,7 +193,7 @@ class ArgmapInfrecoRelationCohereHandler(BaseArgmapInfrecoCoherenceHandler):
                 elif drel.valence == Valence.ATTACK:
                     if any(
                         dialectics.are_contradictory(
-                            argdown_reco.get_proposition(pr.proposition_label),
+                            reco_index.propositions.get(pr.proposition_label),
                             source_m,
                             argdown_reco
                         )
@@ -218,7 +211,7 @@ class ArgmapInfrecoRelationCohereHandler(BaseArgmapInfrecoCoherenceHandler):
                     continue
                 if drel.valence == Valence.SUPPORT:
                     if dialectics.are_identical(
-                        argdown_reco.get_proposition(source_m.pcs[-1].proposition_label),
+                        reco_index.propositions.get(source_m.pcs[-1].proposition_label),
                         target_m,
                     ):
                         continue
@@ -229,7 +222,7 @@ class ArgmapInfrecoRelationCohereHandler(BaseArgmapInfrecoCoherenceHandler):
                     )
                 if drel.valence == Valence.ATTACK:
                     if dialectics.are_contradictory(
-                        argdown_reco.get_proposition(source_m.pcs[-1].proposition_label),
+                        reco_index.propositions.get(source_m.pcs[-1].proposition_label),
                         target_m,
                         argdown_reco
                     ):
@@ -9,6 +9,7 @@ from pyargdown import (
 )
 
 from argdown_feedback.logic import dialectics
+from argdown_feedback.verifiers.argdown_index import argdown_index
 from argdown_feedback.verifiers.coherence.argmap_infreco_handler import (
     BaseArgmapInfrecoCoherenceHandler,
 )
@@ -60,15 +61,17 @@ class ArgmapLogrecoElemCohereHandler(BaseArgmapLogrecoCoherenceHandler):
         argdown_reco: Argdown = vdata2.data
         map_alabels, reco_alabels, map_prop_labels, reco_prop_labels = self.get_labels(argdown_map, argdown_reco)
 
+        map_alabel_set, reco_alabel_set, reco_prop_label_set = set(map_alabels), set(reco_alabels), set(reco_prop_labels)
+
         msgs = []
         for label in map_alabels:
-            if label not in reco_alabels:
+            if label not in reco_alabel_set:
                 msgs.append(f"Argument <{label}> in map is not reconstructed (argument label mismatch).")
         for label in reco_alabels:
-            if label not in map_alabels:
+            if label not in map_alabel_set:
                 msgs.append(f"Reconstructed argument <{label}> is not in the map (argument label mismatch).")            
         for label in map_prop_labels:
-            if label not in reco_prop_labels:
+            if label not in reco_prop_label_set:
                 msgs.append(f"Claim [{label}] in argument map has no corresponding proposition in reconstructions (proposition label mismatch).")
 
         is_valid = False if msgs else True
@@ -90,15 +93,17 @@ class ArgmapLogrecoRelationCohereHandler(BaseArgmapLogrecoCoherenceHandler):
         argdown_map: Argdown = vdata1.data
         argdown_reco: Argdown = vdata2.data
         map_alabels, reco_alabels, map_prop_labels, reco_prop_labels = self.get_labels(argdown_map, argdown_reco)
+        map_labels = set(map_alabels + map_prop_labels)
+        reco_labels = set(reco_alabels + reco_prop_labels)
+        reco_index = argdown_index(vdata2, ctx)
 
         msgs = []
 
         for drel in argdown_map.dialectical_relations:
-            if drel.source not in reco_alabels+reco_prop_labels or drel.target not in reco_alabels+reco_prop_labels:
+            if drel.source not in reco_labels or drel.target not in reco_labels:
                 continue
             if DialecticalType.SKETCHED in drel.dialectics:
-                rel_matches = argdown_reco.get_dialectical_relation(drel.source, drel.target)
-                rel_matches = [] if rel_matches is None else rel_matches
+                rel_matches = reco_index.dialectical_relations(drel.source, drel.target)
 
                 if any(
                     rm.valence == drel.valence
@@ -120,7 +125,7 @@ class ArgmapLogrecoRelationCohereHandler(BaseArgmapLogrecoCoherenceHandler):
 
 
         for drel in argdown_reco.dialectical_relations:
-            if drel.source not in map_alabels+map_prop_labels or drel.target not in map_alabels+map_prop_labels:
+            if drel.source not in map_labels or drel.target not in map_labels:
                 continue
             if DialecticalType.GROUNDED in drel.dialectics:
                 if drel.valence == Valence.SUPPORT:
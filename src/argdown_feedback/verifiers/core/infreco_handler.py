@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Optional
+from typing import Callable, Optional
 import logging
 
 from pyargdown import (
@@ -16,6 +16,7 @@ from argdown_feedback.verifiers.verification_request import (
     VerificationDType,
     VerificationResult,
 )
+from argdown_feedback.verifiers.argdown_index import argdown_index
 from argdown_feedback.verifiers.base import BaseHandler, CompositeHandler
 
 
@@ -410,6 +411,7 @@ class PropRefsExistHandler(InfRecoHandler):
         if not isinstance(argdown, ArgdownMultiDiGraph):
             raise ValueError("Internal error: Argdown is not a MultiDiGraph")
         
+        index = argdown_index(vdata, ctx)
         msgs = []
         for argument in argdown.arguments:
             arg_label = f"<{argument.label}>" if argument.label else "<unlabeled argument>"
@@ -417,13 +419,14 @@ class PropRefsExistHandler(InfRecoHandler):
             if not argument.pcs:
                 continue
                 
+            inference_graph = index.inference_graph(argument, self.from_key)
             for enum, c in enumerate(argument.pcs):
                 if isinstance(c, Conclusion) and isinstance(c.inference_data, dict):
                     inf_data = c.inference_data
                     from_list = inf_data.get(self.from_key, [])
                     if isinstance(from_list, list):
                         for ref in from_list:
-                            if str(ref) not in [p.label for p in argument.pcs[:enum]]:
+                            if not inference_graph.introduced_before(str(ref), enum):
                                 msgs.append(
                                     f"In {arg_label}: Item '{ref}' in inference information of conclusion {c.label} does "
                                     "not refer to a previously introduced premise or conclusion."
@@ -455,6 +458,7 @@ class UsesAllPropsHandler(InfRecoHandler):
         if not isinstance(argdown, ArgdownMultiDiGraph):
             raise ValueError("Internal error: Argdown is not a MultiDiGraph")
         
+        index = argdown_index(vdata, ctx)
         msgs = []
         for argument in argdown.arguments:
             arg_label = f"<{argument.label}>" if argument.label else "<unlabeled argument>"
@@ -462,10 +466,7 @@ class UsesAllPropsHandler(InfRecoHandler):
             if not argument.pcs:
                 continue
                 
-            used_labels = set()
-            for c in argument.pcs:
-                if isinstance(c, Conclusion) and isinstance(c.inference_data, dict):
-                    used_labels.update(c.inference_data.get(self.from_key, []))
+            used_labels = index.inference_graph(argument, self.from_key).used_labels
             
             unused_props = [
                 f"({p.label})" for p in argument.pcs[:-1] if p.label not in used_labels
@@ -612,6 +613,204 @@ class NoArgInlineDataHandler(InfRecoHandler):
         )
 
 
+class InfRecoFacts:
+    """What the standard InfReco handlers check in an Argdown document, collected in a single traversal.
+
+    Inference data is inspected for each of the given `from_keys`. Errors that the
+    `UsesAllPropsHandler` would raise on malformed inference data are stored (by key)
+    and re-raised when the corresponding check is requested.
+    """
+
+    def __init__(self, argdown, from_keys: set[str]):
+        if not isinstance(argdown, ArgdownMultiDiGraph):
+            raise ValueError("Internal error: Argdown is not a MultiDiGraph")
+
+        self.n_arguments = len(argdown.arguments)
+        self.lacking_pcs: list[str] = []
+        self.starting_with_conclusion: list[str] = []
+        self.not_ending_with_conclusion: list[str] = []
+        self.with_multiple_gists: list[str] = []
+        self.with_duplicate_labels: list[str] = []
+        self.unlabeled: list[str] = []
+        self.lacking_gist: list[str] = []
+        self.inference_data_msgs: dict[str, list[str]] = {key: [] for key in from_keys}
+        self.prop_refs_msgs: dict[str, list[str]] = {key: [] for key in from_keys}
+        self.unused_props_msgs: dict[str, list[str]] = {key: [] for key in from_keys}
+        self.unused_props_errors: dict[str, Exception] = {}
+        self.has_arg_data = False
+
+        pcs_props = []
+        for idx, argument in enumerate(argdown.arguments):
+            arg_label = f"<{argument.label}>" if argument.label else "<unlabeled argument>"
+            pcs = argument.pcs or []
+            if not pcs:
+                self.lacking_pcs.append(f"<{argument.label}>" if argument.label else f"Argument #{idx+1}")
+            else:
+                if isinstance(pcs[0], Conclusion):
+                    self.starting_with_conclusion.append(arg_label)
+                if not isinstance(pcs[-1], Conclusion):
+                    self.not_ending_with_conclusion.append(arg_label)
+                self._add_pcs(pcs, arg_label, from_keys)
+            if len(argument.gists) > 1:
+                self.with_multiple_gists.append(arg_label)
+            if ArgdownParser.is_unlabeled(argument):
+                self.unlabeled.append(f"Argument #{idx+1}")
+            if not argument.gists:
+                self.lacking_gist.append(arg_label)
+            if argument.data:
+                self.has_arg_data = True
+            pcs_props.extend(p.proposition_label for p in pcs)
+
+        all_props = []
+        self.has_prop_data = False
+        for prop in argdown.propositions:
+            if prop.label is not None:
+                all_props.append(prop.label)
+            if prop.data:
+                self.has_prop_data = True
+        self.outside_props = [f"[{lb}]" for lb in set(all_props) - set(pcs_props)]
+
+        self.has_ungrounded_relations = any(
+            set(d.dialectics) != {DialecticalType.GROUNDED}
+            for d in argdown.dialectical_relations
+        )
+
+    def _add_pcs(self, pcs: list, arg_label: str, from_keys: set[str]) -> None:
+        """Collect the facts about the premise-conclusion structure of an argument."""
+        pcs_labels = []
+        previous_labels: set[str] = set()
+        label_counts: dict[str, int] = {}
+        used_labels: dict[str, set] = {key: set() for key in from_keys}
+        for pr in pcs:
+            if isinstance(pr, Conclusion):
+                inf_data = pr.inference_data
+                for key in from_keys:
+                    self._add_inference_data(pr, inf_data, key, arg_label, previous_labels)
+                    if isinstance(inf_data, dict) and key not in self.unused_props_errors:
+                        try:
+                            used_labels[key].update(inf_data.get(key, []))
+                        except Exception as e:
+                            self.unused_props_errors[key] = e
+            pcs_labels.append(pr.label)
+            previous_labels.add(pr.label)
+            label_counts[pr.label] = label_counts.get(pr.label, 0) + 1
+
+        duplicates = list(set([label for label in pcs_labels if label_counts[label] > 1]))
+        if duplicates:
+            self.with_duplicate_labels.append(f"{arg_label} (duplicates: {', '.join([f'({lbl})' for lbl in duplicates])})")
+
+        for key in from_keys:
+            if key in self.unused_props_errors:
+                continue
+            unused_props = [f"({p.label})" for p in pcs[:-1] if p.label not in used_labels[key]]
+            if unused_props:
+                self.unused_props_msgs[key].append(
+                    f"In {arg_label}: Some propositions are not explicitly used in any inferences: {', '.join(unused_props)}."
+                )
+
+    def _add_inference_data(self, c: Conclusion, inf_data, key: str, arg_label: str, previous_labels: set) -> None:
+        """Collect the facts about the inference data of a conclusion (preceded by `previous_labels`)."""
+        if not inf_data or not isinstance(inf_data, dict):
+            self.inference_data_msgs[key].append(
+                f"In {arg_label}: Inference to conclusion {c.label} lacks properly formatted yaml inference information."
+            )
+        else:
+            from_list = inf_data.get(key)
+            if from_list is None:
+                self.inference_data_msgs[key].append(
+                    f"In {arg_label}: Inference to conclusion {c.label} inference information lacks '{key}' key."
+                )
+            elif not isinstance(from_list, list):
+                self.inference_data_msgs[key].append(
+                    f"In {arg_label}: Inference to conclusion {c.label} inference information '{key}' value is not a list."
+                )
+            elif len(from_list) == 0:
+                self.inference_data_msgs[key].append(
+                    f"In {arg_label}: Inference to conclusion {c.label} inference information '{key}' value is empty."
+                )
+        if isinstance(inf_data, dict):
+            from_list = inf_data.get(key, [])
+            if isinstance(from_list, list):
+                for ref in from_list:
+                    if str(ref) not in previous_labels:
+                        self.prop_refs_msgs[key].append(
+                            f"In {arg_label}: Item '{ref}' in inference information of conclusion {c.label} does "
+                            "not refer to a previously introduced premise or conclusion."
+                        )
+
+    def unused_props(self, key: str) -> list[str]:
+        if key in self.unused_props_errors:
+            raise self.unused_props_errors[key]
+        return self.unused_props_msgs[key]
+
+
+def _listed(prefix: str, items: list[str]) -> tuple[bool, str | None]:
+    return (False, prefix + ", ".join(items)) if items else (True, None)
+
+
+def _joined(msgs: list[str]) -> tuple[bool, str | None]:
+    return (False, " ".join(msgs)) if msgs else (True, None)
+
+
+def _has_unique_argument(facts: InfRecoFacts) -> tuple[bool, str | None]:
+    if facts.n_arguments > 1:
+        return False, "More than one argument found in the argdown data."
+    if facts.n_arguments == 0:
+        return False, "No arguments found in the argdown data."
+    return True, None
+
+
+# validity and message of the result of each standard handler (or None for no result), by handler class
+FUSED_INFRECO_CHECKS: dict[type, Callable[[InfRecoFacts, InfRecoHandler], tuple[bool, str | None] | None]] = {
+    HasArgumentsHandler: lambda facts, h: (
+        (True, None) if facts.n_arguments else (False, "No arguments found in the argdown data.")
+    ),
+    HasUniqueArgumentHandler: lambda facts, h: _has_unique_argument(facts),
+    HasAtLeastNArgumentsHandler: lambda facts, h: (
+        (False, f"Not enough arguments (found {facts.n_arguments}, expected ≥{h.N}).")  # type: ignore[attr-defined]
+        if facts.n_arguments < h.N  # type: ignore[attr-defined]
+        else (True, None)
+    ),
+    HasPCSHandler: lambda facts, h: (
+        _listed("The following arguments lack premise conclusion structure: ", facts.lacking_pcs)
+        if facts.n_arguments
+        else None
+    ),
+    StartsWithPremiseHandler: lambda facts, h: _listed(
+        "The following arguments do not start with a premise: ", facts.starting_with_conclusion
+    ),
+    EndsWithConclusionHandler: lambda facts, h: _listed(
+        "The following arguments do end with a conclusion: ", facts.not_ending_with_conclusion
+    ),
+    NotMultipleGistsHandler: lambda facts, h: _listed(
+        "The following arguments have alternative gists (and are declared multiple times): ",
+        facts.with_multiple_gists,
+    ),
+    NoDuplicatePCSLabelsHandler: lambda facts, h: _listed(
+        "The following arguments have duplicate premise/conclusion labels: ", facts.with_duplicate_labels
+    ),
+    HasLabelHandler: lambda facts, h: _listed("The following arguments lack labels: ", facts.unlabeled),
+    HasGistHandler: lambda facts, h: _listed("The following arguments lack gists: ", facts.lacking_gist),
+    HasInferenceDataHandler: lambda facts, h: _joined(facts.inference_data_msgs[h.from_key]),
+    PropRefsExistHandler: lambda facts, h: _joined(facts.prop_refs_msgs[h.from_key]),
+    UsesAllPropsHandler: lambda facts, h: _joined(facts.unused_props(h.from_key)),
+    NoExtraPropositionsHandler: lambda facts, h: (
+        (False, f"Argdown snippet contains propositions not used in any argument: {', '.join(facts.outside_props)}.")
+        if facts.outside_props
+        else (True, None)
+    ),
+    OnlyGroundedDialecticalRelationsHandler: lambda facts, h: (
+        (False, "Argdown snippet defines dialectical relations.") if facts.has_ungrounded_relations else (True, None)
+    ),
+    NoPropInlineDataHandler: lambda facts, h: (
+        (False, "Some propositions contain yaml inline data.") if facts.has_prop_data else (True, None)
+    ),
+    NoArgInlineDataHandler: lambda facts, h: (
+        (False, "Some arguments contain yaml inline data.") if facts.has_arg_data else (True, None)
+    ),
+}
+
+
 class InfRecoCompositeHandler(CompositeHandler[InfRecoHandler]):
     """A composite handler that groups all informal reconstruction verification handlers together."""
     
@@ -622,8 +821,17 @@ class InfRecoCompositeHandler(CompositeHandler[InfRecoHandler]):
         handlers: list[InfRecoHandler] | None = None,
         from_key: str = "from",
         filter: Optional[VDFilter] = None,
+        fused: bool = False,
     ):
+        """A composite handler that groups all informal reconstruction verification handlers together.
+
+        fused: bool = False
+            If True, the standard handlers (see `FUSED_INFRECO_CHECKS`) don't evaluate the
+            documents one after another; instead, all their checks are computed in a single
+            traversal of each document (see `InfRecoFacts`). Results are the same.
+        """
         super().__init__(name, logger, handlers)
+        self.fused = fused
         
         # Initialize with default handlers if none provided
         if not handlers:
@@ -653,4 +861,51 @@ class InfRecoCompositeHandler(CompositeHandler[InfRecoHandler]):
                 OnlyGroundedDialecticalRelationsHandler(name="InfReco.OnlyGroundedDialecticalRelationsHandler", filter=filter),
                 NoPropInlineDataHandler(name="InfReco.NoPropInlineDataHandler", filter=filter),
                 NoArgInlineDataHandler(name="InfReco.NoArgInlineDataHandler", filter=filter),
-            ]
\ No newline at end of file
+            ]
+
+    def handle(self, request: VerificationRequest) -> VerificationRequest:
+        if not self.fused:
+            return super().handle(request)
+
+        from_keys = {h.from_key for h in self.handlers if type(h) in FUSED_INFRECO_CHECKS}
+        facts: dict[str, InfRecoFacts | Exception] = {}
+
+        def get_facts(vdata: PrimaryVerificationData) -> InfRecoFacts:
+            if vdata.id not in facts:
+                try:
+                    facts[vdata.id] = InfRecoFacts(vdata.data, from_keys)
+                except Exception as e:
+                    facts[vdata.id] = e
+            if isinstance(facts[vdata.id], Exception):
+                raise facts[vdata.id]
+            return facts[vdata.id]  # type: ignore[return-value]
+
+        for handler in self.handlers:
+            if not request.continue_processing:
+                break
+            check = FUSED_INFRECO_CHECKS.get(type(handler))
+            if check is None or handler._next_handler is not None:
+                request = handler.process(request)
+                continue
+            # same as `handler.process(request)`
+            handler.logger.debug(f"Executing processing handler: {handler.name}")
+            request.executed_handlers.append(handler.name)
+            try:
+                for vdata in request.verification_data:
+                    if vdata.data is None or not handler.is_applicable(vdata, request):
+                        continue
+                    outcome = check(get_facts(vdata), handler)
+                    if outcome is not None:
+                        request.add_result_record(
+                            VerificationResult(
+                                verifier_id=handler.name,
+                                verification_data_references=[vdata.id],
+                                is_valid=outcome[0],
+                                message=outcome[1],
+                            )
+                        )
+            except Exception as e:
+                handler.logger.error(f"Error in processing handler {handler.name}: {str(e)}", exc_info=True)
+                request.add_result(handler.name, [], False, f"Processing error: {str(e)}")
+
+        return request
@@ -1,7 +1,9 @@
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional
 import logging
 
 from nltk.sem.logic import Expression, NegatedExpression  # type: ignore
+from z3 import Context  # type: ignore
 from pyargdown import (
     ArgdownMultiDiGraph,
     Conclusion,
@@ -16,11 +18,116 @@ from argdown_feedback.verifiers.verification_request import (
     VerificationDType,
     VerificationResult,
 )
+from argdown_feedback.verifiers.argdown_index import argdown_index
 from argdown_feedback.verifiers.base import CompositeHandler
 from argdown_feedback.verifiers.core.infreco_handler import InfRecoHandler
 from argdown_feedback.logic.fol_parser import FOLParser
-from argdown_feedback.logic.smtlib import check_validity_z3
+from argdown_feedback.logic.logic import formula_signature
+from argdown_feedback.logic.smtlib import check_validity_z3, SMTProgram, Z3Session
+from argdown_feedback.logic.solver_budget import SolverBudget, SolverBudgetExceeded
+from argdown_feedback.logic.formula_dag import formula_node, negation
+
+# request artifact holding the Z3 solver sessions of the logreco handlers (by verification data id)
+SOLVER_SESSIONS_ARTIFACT = "logreco_solver_sessions"
+# request artifact holding the query plans of the logreco handlers (by verification data id)
+QUERY_PLANS_ARTIFACT = "logreco_query_plans"
+# request artifact holding the deadline of all Z3 checks of the logreco handlers (see `SolverBudget`)
+SOLVER_DEADLINE_ARTIFACT = "logreco_solver_deadline"
+# status reported in the details of results with checks that exceeded the solver budget
+SOLVER_TIMEOUT_STATUS = "timeout"
+
+
+class ValidityQueryPlan:
+    """Validity checks of all logreco handlers for one document, each solved only once.
+
+    Queries are normalized to the set of formulas that must be jointly unsatisfiable
+    (the premises and the negated conclusion), so that checks which are the same up
+    to premise order, labels, contraposition (e.g., A |= -B and B |= -A) or the
+    canonical form of the formulas (see `formula_dag`) share a single answer.
+    Handlers render their own messages (and SMT2-LIB programs) from these shared
+    answers.
+    """
+
+    def __init__(self, session: Z3Session):
+        self.session = session
+        # normalized query -> verdict, or error raised when solving the query
+        self._answers: dict[tuple, bool | Exception] = {}
+        self.n_queries = 0
+        self.n_solved = 0
+
+    @staticmethod
+    def query_key(
+        premises_formalized_nltk: Dict[str, Expression],
+        conclusion_formalized_nltk: Dict[str, Expression],
+        plchd_substitutions: list[list[str]],
+    ) -> tuple | None:
+        """Normalized query, or None for queries that can't be normalized."""
+        if len(conclusion_formalized_nltk) != 1:
+            return None
+        try:
+            formulas = {formula_node(e) for e in premises_formalized_nltk.values()}
+            formulas.add(negation(formula_node(next(iter(conclusion_formalized_nltk.values())))))
+        except ValueError:
+            return None
+        symbols = frozenset().union(*(node.symbols for node in formulas))
+        declared = symbols.intersection(dict(plchd_substitutions))
+        return frozenset(formulas), declared
 
+    def check_validity(
+        self,
+        premises_formalized_nltk: Dict[str, Expression],
+        conclusion_formalized_nltk: Dict[str, Expression],
+        plchd_substitutions: list[list[str]],
+    ) -> tuple[bool, SMTProgram]:
+        """Checks validity of the inference (cf. `check_validity_z3`), solving equivalent queries once."""
+        self.n_queries += 1
+        key = self.query_key(premises_formalized_nltk, conclusion_formalized_nltk, plchd_substitutions)
+        answer = self._answers.get(key) if key is not None else None
+        if answer is None:
+            self.n_solved += 1
+            try:
+                answer, _ = check_validity_z3(
+                    premises_formalized_nltk=premises_formalized_nltk,
+                    conclusion_formalized_nltk=conclusion_formalized_nltk,
+                    plchd_substitutions=plchd_substitutions,
+                    session=self.session,
+                )
+            except Exception as e:
+                answer = e
+            if key is not None:
+                self._answers[key] = answer
+        if isinstance(answer, Exception):
+            raise answer
+        return answer, SMTProgram(
+            premises_formalized_nltk=premises_formalized_nltk,
+            conclusion_formalized_nltk=conclusion_formalized_nltk,
+            plchd_substitutions=plchd_substitutions,
+        )
+
+    def dispensable_premises(
+        self,
+        premises_formalized_nltk: Dict[str, Expression],
+        conclusion_formalized_nltk: Dict[str, Expression],
+        plchd_substitutions: list[list[str]],
+    ) -> dict[str, SMTProgram]:
+        """Premises that are not required to infer the conclusion (cf. `Z3Session.dispensable_premises`).
+
+        If the premises are known not to entail the conclusion, neither does any subset.
+        Otherwise, answers to the leave-one-out queries are added to the plan."""
+        full_key = self.query_key(premises_formalized_nltk, conclusion_formalized_nltk, plchd_substitutions)
+        if self._answers.get(full_key) is False:
+            return {}
+        dispensable = self.session.dispensable_premises(
+            premises_formalized_nltk=premises_formalized_nltk,
+            conclusion_formalized_nltk=conclusion_formalized_nltk,
+            plchd_substitutions=plchd_substitutions,
+        )
+        for k in premises_formalized_nltk:
+            subset = {j: e for j, e in premises_formalized_nltk.items() if j != k}
+            key = self.query_key(subset, conclusion_formalized_nltk, plchd_substitutions)
+            if key is not None:
+                self._answers.setdefault(key, k in dispensable)
+        return dispensable
 
 
 class BaseLogRecoHandler(InfRecoHandler):
@@ -34,12 +141,16 @@ class BaseLogRecoHandler(InfRecoHandler):
         formalization_key: str = "formalization",
         declarations_key: str = "declarations",
         filter: Optional[VDFilter] = None,
+        solver_budget: Optional[SolverBudget] = None,
+        max_workers: Optional[int] = None,
     ):
         super().__init__(name, logger, from_key, filter)
         self.from_key = from_key
         self.formalization_key = formalization_key
         self.declarations_key = declarations_key
         self.filter = filter if filter else lambda vdata: True
+        self.solver_budget = solver_budget
+        self.max_workers = max_workers
         
     def cached_formalizations(
         self, vdata_id: str, request: VerificationRequest
@@ -65,6 +176,76 @@ class BaseLogRecoHandler(InfRecoHandler):
             return None, None
         return vr_details.get("all_expressions"), vr_details.get("all_declarations")
 
+    def solver_session(
+        self, vdata_id: str, request: VerificationRequest, shard: Optional[Hashable] = None
+    ) -> Z3Session:
+        """Return the Z3 solver session shared by all logreco handlers for the given data
+        (or for a shard of the data that is checked concurrently, see `map_arguments`)."""
+        sessions = request.artifacts.setdefault(SOLVER_SESSIONS_ARTIFACT, {})
+        key = vdata_id if shard is None else (vdata_id, shard)
+        session = sessions.get(key)
+        if session is None:
+            deadline = None
+            if self.solver_budget is not None:
+                # one deadline for all checks made while processing the request
+                deadline = request.artifacts.setdefault(
+                    SOLVER_DEADLINE_ARTIFACT, self.solver_budget.deadline()
+                )
+            # shards are checked in worker threads and need a Z3 context of their own
+            ctx = Context() if shard is not None else None
+            session = Z3Session(ctx=ctx, budget=self.solver_budget, deadline=deadline)
+            sessions[key] = session
+        return session
+
+    def query_plan(
+        self, vdata_id: str, request: VerificationRequest, shard: Optional[Hashable] = None
+    ) -> ValidityQueryPlan:
+        """Return the query plan shared by all logreco handlers for the given data (or shard)."""
+        session = self.solver_session(vdata_id, request, shard)
+        plans = request.artifacts.setdefault(QUERY_PLANS_ARTIFACT, {})
+        key = vdata_id if shard is None else (vdata_id, shard)
+        plan = plans.get(key)
+        if plan is None or plan.session is not session:
+            plan = ValidityQueryPlan(session)
+            plans[key] = plan
+        return plan
+
+    def map_arguments(
+        self,
+        vdata_id: str,
+        request: VerificationRequest,
+        arguments: list[Any],
+        check: Callable[[Any, ValidityQueryPlan], tuple[list[str], bool]],
+    ) -> tuple[list[str], bool]:
+        """Applies `check` to every argument, returns all messages (in the order of the
+        arguments) and whether some check exceeded the solver budget.
+
+        With `max_workers` > 1, arguments are checked concurrently in a thread pool
+        (Z3 releases the GIL while solving). Every argument then has a query plan and
+        Z3 context of its own, which the logreco handlers share. Otherwise, all
+        arguments are checked one by one with the query plan of the document."""
+        if self.max_workers is None or self.max_workers <= 1 or len(arguments) <= 1:
+            plan = self.query_plan(vdata_id, request)
+            results = [check(argument, plan) for argument in arguments]
+        else:
+            plans = [self.query_plan(vdata_id, request, shard=i) for i in range(len(arguments))]
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                results = list(executor.map(check, arguments, plans))
+        msgs = [msg for argument_msgs, _ in results for msg in argument_msgs]
+        return msgs, any(timed_out for _, timed_out in results)
+
+    def verification_result(
+        self, vdata: PrimaryVerificationData, msgs: list[str], timed_out: bool = False
+    ) -> VerificationResult:
+        """Result of the checks, with solver status if some check exceeded the solver budget."""
+        return VerificationResult(
+            verifier_id=self.name,
+            verification_data_references=[vdata.id],
+            is_valid=len(msgs) == 0,
+            message=" ".join(msgs) if msgs else None,
+            details={"solver_status": SOLVER_TIMEOUT_STATUS} if timed_out else {},
+        )
+
 
 class WellFormedFormulasHandler(BaseLogRecoHandler):
     """Parses and checks first-order logic formulas in argdown code snippets.
@@ -97,15 +278,14 @@ class WellFormedFormulasHandler(BaseLogRecoHandler):
             raise ValueError("Internal error: vdata.data is not a ArgdownMultiDiGraph")
 
         argdown = vdata.data
+        index = argdown_index(vdata, ctx)
         all_expressions: Dict[str, Expression] = {}  # proposition_label to Expression
         all_declarations: Dict[str, str] = {}
         msgs: list[str] = []
 
         for argument in argdown.arguments:
             for pr in argument.pcs:
-                prop = next(
-                    p for p in argdown.propositions if p.label == pr.proposition_label
-                )
+                prop = index.propositions[pr.proposition_label]
                 if not prop.data:
                     msgs.append(
                         f"Proposition ({pr.label}) in argument <{argument.label}> lacks inline yaml data with formalization info."
@@ -150,28 +330,26 @@ class WellFormedFormulasHandler(BaseLogRecoHandler):
                         all_expressions[pr.proposition_label] = expr
 
                         if declarations and isinstance(declarations, dict):
-                            for k, _ in declarations.items():
-                                if k not in [str(v) for v in expr.variables() | expr.predicates() | expr.constants()]:  # very hacky check here
-                                    msgs.append(
-                                        f"Variable '{k}' declared with proposition ({pr.label}) in argument <{argument.label}> is not used "
-                                        f"in the corresponding formalization '{formalization}'."
-                                    )
+                            symbols = formula_signature(expr).symbols
+                            for k in [k for k in declarations if k not in symbols]:
+                                msgs.append(
+                                    f"Variable '{k}' declared with proposition ({pr.label}) in argument <{argument.label}> is not used "
+                                    f"in the corresponding formalization '{formalization}'."
+                                )
         # Check if all free variables have been declared
+        used_symbols: set[str] = set()
         for prop_label, expr in all_expressions.items():
-            for v in expr.variables() | expr.predicates() | expr.constants():
-                if str(v) not in all_declarations:
-                    msgs.append(
-                        f"Variable '{v}' in formalization '{str(expr)}' of proposition [{prop_label}] is not declared anywhere."
-                    )
-        # Check if all declared variables are used in the formalization
-        for k, v in all_declarations.items():
-            if not any(
-                k in [str(v) for v in expr.variables() | expr.predicates() | expr.constants()]
-                for expr in all_expressions.values()
-            ):
+            symbols = formula_signature(expr).symbols
+            used_symbols |= symbols
+            for v in sorted(symbols - all_declarations.keys()):
                 msgs.append(
-                    f"Variable '{k}' declared is not used in any formalization."
+                    f"Variable '{v}' in formalization '{str(expr)}' of proposition [{prop_label}] is not declared anywhere."
                 )
+        # Check if all declared variables are used in the formalization
+        for k in [k for k in all_declarations if k not in used_symbols]:
+            msgs.append(
+                f"Variable '{k}' declared is not used in any formalization."
+            )
 
         vresult = VerificationResult(
             verifier_id=self.name,
@@ -206,10 +384,11 @@ class GlobalDeductiveValidityHandler(BaseLogRecoHandler):
         if not all_expressions or not all_declarations:
             return None
 
-        msgs = []        
-        for argument in argdown.arguments:
+        def check(argument, plan: ValidityQueryPlan) -> tuple[list[str], bool]:
+            msgs: list[str] = []
+            timed_out = False
             if not argument.pcs:
-                continue
+                return msgs, timed_out
                 
             arg_label = f"<{argument.label}>" if argument.label else "<unlabeled argument>"
             
@@ -231,10 +410,10 @@ class GlobalDeductiveValidityHandler(BaseLogRecoHandler):
                 msgs.append(
                     f"In {arg_label}: Failed to evaluate global deductive validity due to missing or flawed formalizations."
                 )
-                continue
+                return msgs, timed_out
 
             try:
-                deductively_valid, smtcode = check_validity_z3(
+                deductively_valid, smtcode = plan.check_validity(
                     premises_formalized_nltk=expr_premises,
                     conclusion_formalized_nltk=expr_conclusion,
                     plchd_substitutions=[[k,v] for k,v in all_declarations.items()],
@@ -244,25 +423,18 @@ class GlobalDeductiveValidityHandler(BaseLogRecoHandler):
                         f"In {arg_label}: According to the provided formalizations, the argument is not deductively valid. "
                         f"SMT2LIB program used to check validity:\n {smtcode}\n"
                     )
+            except SolverBudgetExceeded as e:
+                timed_out = True
+                msgs.append(f"In {arg_label}: Failed to evaluate global deductive validity: {str(e)}")
             except Exception as e:
                 msgs.append(
                     f"In {arg_label}: Failed to evaluate global deductive validity with SMT2LIB/z3: {str(e)}."
                 )
+            return msgs, timed_out
+
+        msgs, timed_out = self.map_arguments(vdata.id, ctx, argdown.arguments, check)
         
-        if msgs:
-            return VerificationResult(
-                verifier_id=self.name,
-                verification_data_references=[vdata.id],
-                is_valid=False,
-                message=" ".join(msgs),
-            )
-            
-        return VerificationResult(
-            verifier_id=self.name,
-            verification_data_references=[vdata.id],
-            is_valid=True,
-            message=None,
-        )
+        return self.verification_result(vdata, msgs, timed_out)
 
 
 class LocalDeductiveValidityHandler(BaseLogRecoHandler):
@@ -280,11 +452,13 @@ class LocalDeductiveValidityHandler(BaseLogRecoHandler):
         # Skip if there are formalization errors
         if not all_expressions or not all_declarations:
             return None
+        index = argdown_index(vdata, ctx)
 
-        msgs = []        
-        for argument in argdown.arguments:
+        def check(argument, plan: ValidityQueryPlan) -> tuple[list[str], bool]:
+            msgs: list[str] = []
+            timed_out = False
             if not argument.pcs:
-                continue
+                return msgs, timed_out
                 
             arg_label = f"<{argument.label}>" if argument.label else "<unlabeled argument>"
             
@@ -292,10 +466,8 @@ class LocalDeductiveValidityHandler(BaseLogRecoHandler):
                 if isinstance(c, Conclusion):
                     expr_premises = {}
                     for label in c.inference_data.get(self.from_key, []):
-                        proposition_label = next(
-                            (pr.proposition_label for pr in argument.pcs if pr.label == label),
-                            None,
-                        )
+                        pr = index.pcs_member(argument, label)
+                        proposition_label = pr.proposition_label if pr is not None else None
                         expr = all_expressions.get(proposition_label) if proposition_label is not None else None
                         if expr:
                             expr_premises[label] = expr
@@ -312,7 +484,7 @@ class LocalDeductiveValidityHandler(BaseLogRecoHandler):
                         )
                     else:
                         try:
-                            deductively_valid, smtcode = check_validity_z3(
+                            deductively_valid, smtcode = plan.check_validity(
                                 premises_formalized_nltk=expr_premises,
                                 conclusion_formalized_nltk=expr_conclusion,
                                 plchd_substitutions=[[k,v] for k,v in all_declarations.items()],
@@ -323,26 +495,21 @@ class LocalDeductiveValidityHandler(BaseLogRecoHandler):
                                     f"the sub-inference to conclusion ({c.label}) is not deductively valid. "
                                     f"SMT2LIB program used to check validity of this subargument:\n {smtcode}\n"
                                 )
+                        except SolverBudgetExceeded as e:
+                            timed_out = True
+                            msgs.append(
+                                f"In {arg_label}: Failed to evaluate deductive validity of sub-inference to ({c.label}): {str(e)}"
+                            )
                         except Exception as e:
                             msgs.append(
                                 f"In {arg_label}: Failed to evaluate deductive validity of sub-inference to ({c.label}) "
                                 f"with SMT2LIB/z3: {str(e)}."
                             )
+            return msgs, timed_out
+
+        msgs, timed_out = self.map_arguments(vdata.id, ctx, argdown.arguments, check)
         
-        if msgs:
-            return VerificationResult(
-                verifier_id=self.name,
-                verification_data_references=[vdata.id],
-                is_valid=False,
-                message=" ".join(msgs),
-            )
-            
-        return VerificationResult(
-            verifier_id=self.name,
-            verification_data_references=[vdata.id],
-            is_valid=True,
-            message=None,
-        )
+        return self.verification_result(vdata, msgs, timed_out)
 
 
 class AllPremisesRelevantHandler(BaseLogRecoHandler):
@@ -360,17 +527,14 @@ class AllPremisesRelevantHandler(BaseLogRecoHandler):
         if not all_expressions or not all_declarations:
             return None
 
-        msgs = []        
-        for argument in argdown.arguments:
+        def check(argument, plan: ValidityQueryPlan) -> tuple[list[str], bool]:
+            msgs: list[str] = []
+            timed_out = False
             if not argument.pcs:
-                continue
+                return msgs, timed_out
                 
             arg_label = f"<{argument.label}>" if argument.label else "<unlabeled argument>"
             
-            # Skip if there are formalization errors
-            if not all_expressions:
-                continue
-            
             expr_premises: Dict[str, Expression] = {}
             for pr in argument.pcs:
                 if not isinstance(pr, Conclusion):
@@ -389,45 +553,57 @@ class AllPremisesRelevantHandler(BaseLogRecoHandler):
                 msgs.append(
                     f"In {arg_label}: Failed to evaluate logical relevance of premises due to missing or flawed formalizations."
                 )
-                continue
+                return msgs, timed_out
 
             if len(expr_premises) == 1:
-                continue  # implicitly assuming the conclusion is not a tautology
+                return msgs, timed_out  # implicitly assuming the conclusion is not a tautology
+
+            dispensable = None
+            try:
+                dispensable = plan.dispensable_premises(
+                    premises_formalized_nltk=expr_premises,
+                    conclusion_formalized_nltk=expr_conclusion,
+                    plchd_substitutions=[[k,v] for k,v in all_declarations.items()],
+                )
+            except SolverBudgetExceeded as e:
+                timed_out = True
+                msgs.append(f"In {arg_label}: Failed to evaluate logical relevance of premises: {str(e)}")
+                return msgs, timed_out
+            except Exception:
+                pass  # check premises one by one, so that failures are reported for each premise
 
             for k in expr_premises.keys():
-                subset = expr_premises.copy()
-                subset.pop(k)
-                try:
-                    deductively_valid, smtcode = check_validity_z3(
-                        premises_formalized_nltk=subset,
-                        conclusion_formalized_nltk=expr_conclusion,
-                        plchd_substitutions=[[k,v] for k,v in all_declarations.items()],
-                    )
-                    
-                    if deductively_valid:
+                if dispensable is not None:
+                    deductively_valid, smtcode = k in dispensable, dispensable.get(k)
+                else:
+                    subset = expr_premises.copy()
+                    subset.pop(k)
+                    try:
+                        deductively_valid, smtcode = plan.check_validity(
+                            premises_formalized_nltk=subset,
+                            conclusion_formalized_nltk=expr_conclusion,
+                            plchd_substitutions=[[k,v] for k,v in all_declarations.items()],
+                        )
+                    except SolverBudgetExceeded as e:
+                        timed_out = True
+                        msgs.append(f"In {arg_label}: Failed to evaluate relevance of premise ({k}): {str(e)}")
+                        continue
+                    except Exception as e:
                         msgs.append(
-                            f"In {arg_label}: According to the provided formalizations, premise ({k}) is not required "
-                            f"to logically infer the final conclusion. SMT2LIB program used to check validity:\n {smtcode}\n"
+                            f"In {arg_label}: Failed to evaluate relevance of premise ({k}) with SMT2LIB/z3: {str(e)}."
                         )
-                except Exception as e:
+                        continue
+
+                if deductively_valid:
                     msgs.append(
-                        f"In {arg_label}: Failed to evaluate relevance of premise ({k}) with SMT2LIB/z3: {str(e)}."
+                        f"In {arg_label}: According to the provided formalizations, premise ({k}) is not required "
+                        f"to logically infer the final conclusion. SMT2LIB program used to check validity:\n {smtcode}\n"
                     )
+            return msgs, timed_out
+
+        msgs, timed_out = self.map_arguments(vdata.id, ctx, argdown.arguments, check)
         
-        if msgs:
-            return VerificationResult(
-                verifier_id=self.name,
-                verification_data_references=[vdata.id],
-                is_valid=False,
-                message=" ".join(msgs),
-            )
-            
-        return VerificationResult(
-            verifier_id=self.name,
-            verification_data_references=[vdata.id],
-            is_valid=True,
-            message=None,
-        )
+        return self.verification_result(vdata, msgs, timed_out)
 
 
 class PremisesConsistentHandler(BaseLogRecoHandler):
@@ -439,17 +615,17 @@ class PremisesConsistentHandler(BaseLogRecoHandler):
             return None
         if not isinstance(argdown, ArgdownMultiDiGraph):
             raise ValueError("Internal error: Argdown is not a MultiDiGraph")
-        
-        msgs = []
 
         all_expressions, all_declarations = self.cached_formalizations(vdata.id, ctx)
         # Skip if there are formalization errors
         if not all_expressions or not all_declarations:
             return None
-        
-        for argument in argdown.arguments:
+
+        def check(argument, plan: ValidityQueryPlan) -> tuple[list[str], bool]:
+            msgs: list[str] = []
+            timed_out = False
             if not argument.pcs:
-                continue
+                return msgs, timed_out
                 
             arg_label = f"<{argument.label}>" if argument.label else "<unlabeled argument>"
             
@@ -461,14 +637,14 @@ class PremisesConsistentHandler(BaseLogRecoHandler):
                         expr_premises[pr.label] = expr
 
             if not expr_premises:
-                continue
+                return msgs, timed_out
 
             try:
                 _key = next(iter(expr_premises))
                 _concl = NegatedExpression(expr_premises[_key])
                 expr_conclusion: Dict[str, Expression] = {f"{_key}_neg": _concl}
                 
-                deductively_valid, smtcode = check_validity_z3(
+                deductively_valid, smtcode = plan.check_validity(
                     premises_formalized_nltk=expr_premises,
                     conclusion_formalized_nltk=expr_conclusion,
                     plchd_substitutions=[[k,v] for k,v in all_declarations.items()],
@@ -477,25 +653,18 @@ class PremisesConsistentHandler(BaseLogRecoHandler):
                     msgs.append(
                         f"In {arg_label}: According to the provided formalizations, the argument's premises are NOT logically consistent."
                     )
+            except SolverBudgetExceeded as e:
+                timed_out = True
+                msgs.append(f"In {arg_label}: Failed to evaluate premises' consistency: {str(e)}")
             except Exception as e:
                 msgs.append(
                     f"In {arg_label}: Failed to evaluate premises' consistency with SMT2LIB/z3: {str(e)}."
                 )
+            return msgs, timed_out
+
+        msgs, timed_out = self.map_arguments(vdata.id, ctx, argdown.arguments, check)
         
-        if msgs:
-            return VerificationResult(
-                verifier_id=self.name,
-                verification_data_references=[vdata.id],
-                is_valid=False,
-                message=" ".join(msgs),
-            )
-            
-        return VerificationResult(
-            verifier_id=self.name,
-            verification_data_references=[vdata.id],
-            is_valid=True,
-            message=None,
-        )
+        return self.verification_result(vdata, msgs, timed_out)
 
 
 class FormallyGroundedRelationsHandler(BaseLogRecoHandler):
@@ -521,9 +690,22 @@ class FormallyGroundedRelationsHandler(BaseLogRecoHandler):
         # Skip if there are formalization errors
         if not all_expressions or not all_declarations:
             return None
-        
+
+        plan = self.query_plan(vdata.id, ctx)
+        # all relations are checked with the same declarations, and every formula
+        # (and its negation) is translated only once
+        plchd_substitutions = [[k, v] for k, v in all_declarations.items()]
+        plan.session.declare(plchd_substitutions, list(all_expressions.values()))
+        negations: Dict[str, Expression] = {}
+
+        def negated(label: str) -> Expression:
+            if label not in negations:
+                negations[label] = NegatedExpression(all_expressions[label])
+            return negations[label]
+
         # Check each dialectical relation
         msgs = []
+        timed_out = False
         for drel in argdown.dialectical_relations:
             if (
                 drel.source not in all_expressions
@@ -534,10 +716,10 @@ class FormallyGroundedRelationsHandler(BaseLogRecoHandler):
             if DialecticalType.AXIOMATIC in drel.dialectics:
                 if drel.valence == Valence.SUPPORT:
                     try:
-                        deductively_valid, smtcode = check_validity_z3(
+                        deductively_valid, smtcode = plan.check_validity(
                             premises_formalized_nltk={"1": all_expressions[drel.source]},
                             conclusion_formalized_nltk={"2": all_expressions[drel.target]},
-                            plchd_substitutions=[[k,v] for k,v in all_declarations.items()],
+                            plchd_substitutions=plchd_substitutions,
                         )
                         if not deductively_valid:
                             msgs.append(
@@ -545,15 +727,18 @@ class FormallyGroundedRelationsHandler(BaseLogRecoHandler):
                                 f"not entail the supported proposition '{drel.target}'. (SMTLIB program used to check "
                                 f"entailment:\n {smtcode})"
                             )
+                    except SolverBudgetExceeded as e:
+                        timed_out = True
+                        msgs.append(f"Failed to check support relation {drel.source} -> {drel.target}: {str(e)}")
                     except Exception as e:
                         msgs.append(f"Failed to check support relation {drel.source} -> {drel.target}: {str(e)}")
                         
                 elif drel.valence == Valence.ATTACK:
                     try:
-                        deductively_valid, smtcode = check_validity_z3(
+                        deductively_valid, smtcode = plan.check_validity(
                             premises_formalized_nltk={"1": all_expressions[drel.source]},
-                            conclusion_formalized_nltk={"2": NegatedExpression(all_expressions[drel.target])},
-                            plchd_substitutions=[[k,v] for k,v in all_declarations.items()],
+                            conclusion_formalized_nltk={"2": negated(drel.target)},
+                            plchd_substitutions=plchd_substitutions,
                         )
                         if not deductively_valid:
                             msgs.append(
@@ -561,20 +746,23 @@ class FormallyGroundedRelationsHandler(BaseLogRecoHandler):
                                 f"entail the negation of the attacked proposition '{drel.target}'. (SMTLIB program used to check "
                                 f"contradiction:\n {smtcode})"
                             )
+                    except SolverBudgetExceeded as e:
+                        timed_out = True
+                        msgs.append(f"Failed to check attack relation {drel.source} -> {drel.target}: {str(e)}")
                     except Exception as e:
                         msgs.append(f"Failed to check attack relation {drel.source} -> {drel.target}: {str(e)}")
                         
                 elif drel.valence == Valence.CONTRADICT:
                     try:
-                        deductively_valid_1, smtcode_1 = check_validity_z3(
+                        deductively_valid_1, smtcode_1 = plan.check_validity(
                             premises_formalized_nltk={"1": all_expressions[drel.source]},
-                            conclusion_formalized_nltk={"2": NegatedExpression(all_expressions[drel.target])},
-                            plchd_substitutions=[[k,v] for k,v in all_declarations.items()],
+                            conclusion_formalized_nltk={"2": negated(drel.target)},
+                            plchd_substitutions=plchd_substitutions,
                         )
-                        deductively_valid_2, smtcode_2 = check_validity_z3(
+                        deductively_valid_2, smtcode_2 = plan.check_validity(
                             premises_formalized_nltk={"1": all_expressions[drel.target]},
-                            conclusion_formalized_nltk={"2": NegatedExpression(all_expressions[drel.source])},
-                            plchd_substitutions=[[k,v] for k,v in all_declarations.items()],
+                            conclusion_formalized_nltk={"2": negated(drel.source)},
+                            plchd_substitutions=plchd_substitutions,
                         )
                         deductively_valid = deductively_valid_1 and deductively_valid_2
                         if not deductively_valid:
@@ -583,27 +771,25 @@ class FormallyGroundedRelationsHandler(BaseLogRecoHandler):
                                 f"the negation of the proposition '{drel.target}', despite both being declared as "
                                 f"contradictory. (SMTLIB programs used to check contradiction:\n{smtcode_1}\n-----\n{smtcode_2})"
                             )
+                    except SolverBudgetExceeded as e:
+                        timed_out = True
+                        msgs.append(f"Failed to check contradiction relation {drel.source} <-> {drel.target}: {str(e)}")
                     except Exception as e:
                         msgs.append(f"Failed to check contradiction relation {drel.source} <-> {drel.target}: {str(e)}")
         
-        if msgs:
-            return VerificationResult(
-                verifier_id=self.name,
-                verification_data_references=[vdata.id],
-                is_valid=False,
-                message=" ".join(msgs),
-            )
-            
-        return VerificationResult(
-            verifier_id=self.name,
-            verification_data_references=[vdata.id],
-            is_valid=True,
-            message=None,
-        )
+        return self.verification_result(vdata, msgs, timed_out)
 
 
 class LogRecoCompositeHandler(CompositeHandler[BaseLogRecoHandler]):
-    """A composite handler that groups all logical reconstruction verification handlers together."""
+    """A composite handler that groups all logical reconstruction verification handlers together.
+
+    The Z3 checks of all handlers are bounded by the solver budget given by `timeout_ms`
+    (per check), `request_timeout_ms` (all checks of a request), `rlimit` and `max_memory_mb`
+    (per check); see `SolverBudget`. By default, checks are unbounded.
+
+    With `max_workers` > 1, the arguments of a document are checked concurrently by
+    that many worker threads (see `BaseLogRecoHandler.map_arguments`); messages are
+    reported in the same order as with serial checks."""
     
     def __init__(
         self,
@@ -614,8 +800,19 @@ class LogRecoCompositeHandler(CompositeHandler[BaseLogRecoHandler]):
         formalization_key: str = "formalization",
         declarations_key: str = "declarations",
         filter: Optional[VDFilter] = None,
+        timeout_ms: Optional[int] = None,
+        request_timeout_ms: Optional[int] = None,
+        rlimit: Optional[int] = None,
+        max_memory_mb: Optional[int] = None,
+        max_workers: Optional[int] = None,
     ):
         super().__init__(name, logger, handlers)
+        solver_budget = SolverBudget.from_config(
+            timeout_ms=timeout_ms,
+            request_timeout_ms=request_timeout_ms,
+            rlimit=rlimit,
+            max_memory_mb=max_memory_mb,
+        )
             
         # Initialize with default handlers if none provided
         if not handlers:
@@ -636,6 +833,8 @@ class LogRecoCompositeHandler(CompositeHandler[BaseLogRecoHandler]):
                     formalization_key=formalization_key,
                     declarations_key=declarations_key,
                     filter=filter,
+                    solver_budget=solver_budget,
+                    max_workers=max_workers,
                 ),
                 LocalDeductiveValidityHandler(
                     name="LogReco.LocalDeductiveValidityHandler",
@@ -643,6 +842,8 @@ class LogRecoCompositeHandler(CompositeHandler[BaseLogRecoHandler]):
                     formalization_key=formalization_key,
                     declarations_key=declarations_key,
                     filter=filter,
+                    solver_budget=solver_budget,
+                    max_workers=max_workers,
                 ),
                 
                 # Logical analysis handlers
@@ -652,6 +853,8 @@ class LogRecoCompositeHandler(CompositeHandler[BaseLogRecoHandler]):
                     formalization_key=formalization_key,
                     declarations_key=declarations_key,
                     filter=filter,
+                    solver_budget=solver_budget,
+                    max_workers=max_workers,
                 ),
                 PremisesConsistentHandler(
                     name="LogReco.PremisesConsistentHandler",
@@ -659,6 +862,8 @@ class LogRecoCompositeHandler(CompositeHandler[BaseLogRecoHandler]):
                     formalization_key=formalization_key,
                     declarations_key=declarations_key,
                     filter=filter,
+                    solver_budget=solver_budget,
+                    max_workers=max_workers,
                 ),
                 
                 # Dialectical relation handlers
@@ -668,5 +873,18 @@ class LogRecoCompositeHandler(CompositeHandler[BaseLogRecoHandler]):
                     formalization_key=formalization_key,
                     declarations_key=declarations_key,
                     filter=filter,
+                    solver_budget=solver_budget,
+                    max_workers=max_workers,
                 ),
             ]
+
+    def handle(self, request: VerificationRequest) -> VerificationRequest:
+        """Process request through all logreco handlers, which share one solver session and
+        query plan per document (so that equivalent checks are solved only once)."""
+        try:
+            return super().handle(request)
+        finally:
+            # sessions are bound to the current thread's Z3 context and must not outlive the request's processing
+            request.artifacts.pop(SOLVER_SESSIONS_ARTIFACT, None)
+            request.artifacts.pop(QUERY_PLANS_ARTIFACT, None)
+            request.artifacts.pop(SOLVER_DEADLINE_ARTIFACT, None)
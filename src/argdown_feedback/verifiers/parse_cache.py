@@ -0,0 +1,152 @@
+"""parse_cache.py
+
+Bounded cache of parsed Argdown and XML snippets, shared across requests.
+
+The same snippets are parsed over and over again: across revisions of a
+solution, by several judges, when artifacts are rehydrated, and by repeated API
+calls. Once a cache is installed (see `set_parse_cache`), `ArgdownParser` and
+`XMLParser` look up parse results (and parse errors) by a hash of the snippet
+they would parse. Cached objects are never handed out; every lookup returns a
+fresh copy, so handlers that modify parsed data do not affect the cache.
+"""
+
+from collections import OrderedDict
+import copy
+import hashlib
+import threading
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+# type and arguments of a parse error, from which a fresh exception is raised on every lookup
+ParseError = tuple[type[Exception], tuple[Any, ...]]
+
+
+def _recreatable(error: ParseError) -> bool:
+    error_type, args = error
+    try:
+        error_type(*args)
+    except Exception:
+        return False
+    return True
+
+
+class ParseCache:
+    """
+    Thread-safe LRU cache of parse results with hit/miss/eviction counters.
+
+    The cache holds at most `max_entries` results, and the snippets of all cached
+    results amount to at most `max_snippet_bytes` (as a proxy of the memory used
+    by parsed objects, which is roughly proportional to the size of the snippet).
+
+    Caches are picklable; unpickled caches (e.g. in MPJudge workers) start empty.
+    """
+
+    def __init__(self, max_entries: int = 1_000, max_snippet_bytes: int = 10_000_000):
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        if max_snippet_bytes < 1:
+            raise ValueError("max_snippet_bytes must be positive")
+        self.max_entries = max_entries
+        self.max_snippet_bytes = max_snippet_bytes
+        self._init_state()
+
+    def _init_state(self) -> None:
+        self._lock = threading.Lock()
+        # key -> (parsed object or None, parse error or None, snippet size)
+        self._entries: OrderedDict[str, tuple[Any, ParseError | None, int]] = OrderedDict()
+        self._snippet_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __getstate__(self) -> dict:
+        return {"max_entries": self.max_entries, "max_snippet_bytes": self.max_snippet_bytes}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._init_state()
+
+    @staticmethod
+    def key(kind: str, snippet: str) -> str:
+        """Cache key of a snippet parsed as `kind` (e.g. "argdown" or "xml")."""
+        return hashlib.sha256(f"{kind}\0{snippet}".encode("utf-8")).hexdigest()
+
+    def parse(self, kind: str, snippet: str, parse_fn: Callable[[str], T]) -> T:
+        """Copy of the cached result of `parse_fn(snippet)`; parses the snippet on cache miss.
+
+        Parse errors are cached by type and arguments, and raised as fresh exceptions
+        on every lookup (exceptions that cannot be recreated that way are not cached)."""
+        key = self.key(kind, snippet)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if entry is None:
+            try:
+                entry = (parse_fn(snippet), None, len(snippet.encode("utf-8")))
+            except Exception as e:
+                error: ParseError = (type(e), e.args)
+                if not _recreatable(error):
+                    raise
+                entry = (None, error, len(snippet.encode("utf-8")))
+            with self._lock:
+                self._store(key, entry)
+        parsed, error, _ = entry
+        if error is not None:
+            # never re-raise a cached instance: its traceback would keep callers' frames alive
+            error_type, args = error
+            raise error_type(*args)
+        return copy.deepcopy(parsed)
+
+    def _store(self, key: str, entry: tuple[Any, ParseError | None, int]) -> None:
+        # requires lock
+        if entry[2] > self.max_snippet_bytes:
+            # snippets larger than the entire budget are not cached
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._snippet_bytes -= previous[2]
+        self._entries[key] = entry
+        self._snippet_bytes += entry[2]
+        while len(self._entries) > self.max_entries or self._snippet_bytes > self.max_snippet_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._snippet_bytes -= evicted[2]
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all cached results and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._snippet_bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, int | float]:
+        """Hit, miss and eviction counters, hit rate, and number and snippet size of cached results."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "snippet_bytes": self._snippet_bytes,
+            }
+
+
+_parse_cache: ParseCache | None = None
+
+
+def set_parse_cache(cache: ParseCache | None) -> None:
+    """Install (or, with None, remove) the parse cache used by all parsers in this process."""
+    global _parse_cache
+    _parse_cache = cache
+
+
+def get_parse_cache() -> ParseCache | None:
+    """The parse cache used by parsers in this process, if any (disabled by default)."""
+    return _parse_cache
@@ -1,20 +1,34 @@
 from typing import Optional, List
 import logging
+import re
 import uuid
 import yaml  # type: ignore[import]
 
+from bs4 import BeautifulSoup
+from pyargdown import Argdown
+
 from .verification_request import (
     VerificationRequest,
     PrimaryVerificationData,
     VerificationDType,
 )
 from .base import BaseHandler, CompositeHandler
+from .argdown_index import argdown_index
+from .parse_cache import get_parse_cache
 
 _CODE_MARKERS = {
     VerificationDType.argdown: "```argdown",
     VerificationDType.xml: "```xml",
 }
 _MULTI_VALUED_ATTRIBUTES = {"*": {"supports", "attacks"}}
+# code metadata that consists in a single key=value pair of plain tokens, e.g. `filename=map.ad`
+_KEY_VALUE_HEADER = re.compile(r"([A-Za-z0-9_][A-Za-z0-9_./-]*)=([A-Za-z0-9_][A-Za-z0-9_./-]*)")
+
+
+def _is_plain_yaml_string(token: str) -> bool:
+    """Whether yaml loads the token as a string (rather than, e.g., as number, bool, or date)."""
+    resolvers = yaml.SafeLoader.yaml_implicit_resolvers.get(token[0], [])
+    return not any(regexp.match(token) for _, regexp in resolvers)
 
 
 class ProcessingHandler(BaseHandler):
@@ -37,51 +51,79 @@ class FencedCodeBlockExtractor(ProcessingHandler):
         ]
 
     def handle(self, request: VerificationRequest) -> VerificationRequest:
-        """Extract fenced code blocks of specified languages."""
+        """Extract fenced code blocks of specified languages.
+
+        Blocks are added language by language (in the order of `supported_languages`),
+        and in document order for each language."""
         input_text = request.inputs
         if isinstance(input_text, list):
             input_text = "\n\n".join(input_text)
 
-        # Process each supported language
-        extracted_blocks = 0
+        blocks = self._scan(input_text, [_CODE_MARKERS[language] for language in self.supported_languages])
 
+        extracted_blocks = 0
         for language in self.supported_languages:
             code_marker = _CODE_MARKERS[language]
-            close_marker = "\n```"
-
-            needs_to_be_parsed = input_text
-            while code_marker in needs_to_be_parsed:
-                splits = needs_to_be_parsed.split(code_marker, 1)[1].split(close_marker, 1)
-                if len(splits) <= 1:
-                    break
-                snippet = code_marker + splits[0] + close_marker
-                needs_to_be_parsed = splits[1]
-
-                # try to parse yaml code metadata after code marker
-                lines = splits[0].split("\n")
-                try:
-                    metadata = yaml.safe_load(lines[0].strip().replace("=", ": ")) if lines else None
-                except (IndexError, yaml.YAMLError) as e:
-                    self.logger.debug(f"No metadata found in code snippet {lines[0] if lines else ''} ({e})")
-                    metadata = None
-
+            for start, end in blocks[code_marker]:
+                snippet = input_text[start:end]
                 request.verification_data.append(
                     PrimaryVerificationData(
                         id=f"{language.value}_{str(uuid.uuid4())}",
                         dtype=language,
                         data=None,
                         code_snippet=snippet,
-                        metadata=metadata,
+                        metadata=self._parse_metadata(snippet[len(code_marker):snippet.find("\n")]),
                     )
                 )
                 extracted_blocks += 1
-            del needs_to_be_parsed
 
             if extracted_blocks == 0:
                 self.logger.debug(f"No {language.value} code blocks found to extract")
 
         return request
 
+    @staticmethod
+    def _scan(input_text: str, code_markers: List[str]) -> dict[str, list[tuple[int, int]]]:
+        """Start and end positions of the fenced code blocks opened by each of the code markers.
+
+        A block runs from its code marker to the next close marker, and the next block
+        starts after that. Blocks opened by different code markers are found independently
+        (and may overlap), but in a single pass over all backtick fences in the text."""
+        close_marker = "\n```"
+        blocks: dict[str, list[tuple[int, int]]] = {code_marker: [] for code_marker in code_markers}
+        # position where the next block may start (or, for open blocks, its close marker)
+        cursors = {code_marker: 0 for code_marker in blocks}
+        open_blocks: dict[str, int] = {}
+        fence = input_text.find("```")
+        while fence != -1:
+            for code_marker, start in list(open_blocks.items()):
+                # close marker starts with the newline before the fence
+                if fence - 1 >= cursors[code_marker] and input_text[fence - 1] == "\n":
+                    end = fence - 1 + len(close_marker)
+                    blocks[code_marker].append((start, end))
+                    del open_blocks[code_marker]
+                    cursors[code_marker] = end
+            for code_marker, cursor in list(cursors.items()):
+                if code_marker not in open_blocks and fence >= cursor and input_text.startswith(code_marker, fence):
+                    open_blocks[code_marker] = fence
+                    cursors[code_marker] = fence + len(code_marker)
+            fence = input_text.find("```", fence + 1)
+        return blocks
+
+    def _parse_metadata(self, header: str) -> Optional[dict]:
+        """Parse yaml code metadata after code marker (with a fast path for a single key=value pair)."""
+        header = header.strip()
+        if not header:
+            return None
+        match = _KEY_VALUE_HEADER.fullmatch(header)
+        if match and all(_is_plain_yaml_string(token) for token in match.groups()):
+            return {match.group(1): match.group(2)}
+        try:
+            return yaml.safe_load(header.replace("=", ": "))
+        except yaml.YAMLError as e:
+            self.logger.debug(f"No metadata found in code snippet {header} ({e})")
+            return None
+
 
 class ArgdownParser(ProcessingHandler):
     """Handler that parses all Argdown code snippets into an ArgdownMultiDiGraph."""
@@ -91,9 +133,30 @@ class ArgdownParser(ProcessingHandler):
     ):
         super().__init__(name, logger)
 
+    @staticmethod
+    def parse_snippet(code_snippet: str) -> Argdown:
+        """Parse a fenced Argdown code snippet (code markers are removed before parsing).
+        Uses the parse cache, if installed (see `parse_cache.set_parse_cache`)."""
+        from pyargdown import parse_argdown
+
+        code_snippet = code_snippet.strip("\n ")
+        code_marker = _CODE_MARKERS[VerificationDType.argdown]
+        close_marker = "\n```"
+        # remove code markers from code snippet before parsing
+        if "\n" in code_snippet and code_snippet.startswith(code_marker):
+            # remove the first line from the code snippet
+            code_snippet = code_snippet.split("\n", 1)[1]
+        if "\n" in code_snippet and code_snippet.endswith(close_marker):
+            # remove the last line from the code snippet
+            code_snippet = code_snippet.rsplit("\n", 1)[0]
+
+        cache = get_parse_cache()
+        if cache is not None:
+            return cache.parse(VerificationDType.argdown.value, code_snippet, parse_argdown)
+        return parse_argdown(code_snippet)
+
     def handle(self, request: VerificationRequest) -> VerificationRequest:
         """Parse Argdown code snippets."""
-        from pyargdown import parse_argdown
 
         for vdata in request.verification_data:
             if vdata.dtype != VerificationDType.argdown:
@@ -106,20 +169,11 @@ class ArgdownParser(ProcessingHandler):
                 self.logger.debug(f"Code snippet for {vdata.id} is None. Skipping.")
                 continue
 
-            code_snippet = vdata.code_snippet.strip("\n ")
-            code_marker = _CODE_MARKERS[vdata.dtype]
-            close_marker = "\n```"
-            # remove code markers from code snippet before parsing
-            if "\n" in code_snippet and code_snippet.startswith(code_marker):
-                # remove the first line from the code snippet
-                code_snippet = code_snippet.split("\n", 1)[1]
-            if "\n" in code_snippet and code_snippet.endswith(close_marker):
-                # remove the last line from the code snippet
-                code_snippet = code_snippet.rsplit("\n", 1)[0]
-
             try:
-                argdown = parse_argdown(code_snippet)
+                argdown = self.parse_snippet(vdata.code_snippet)
                 vdata.data = argdown
+                # index labels once for all subsequent handlers
+                argdown_index(vdata, request)
             except Exception as e:
                 metadata_text = f" {vdata.metadata}" if vdata.metadata else ""
                 request.add_result(
@@ -140,9 +194,30 @@ class XMLParser(ProcessingHandler):
     ):
         super().__init__(name, logger)
 
+    @staticmethod
+    def parse_snippet(code_snippet: str) -> BeautifulSoup:
+        """Parse a fenced XML code snippet (code markers are removed before parsing).
+        Uses the parse cache, if installed (see `parse_cache.set_parse_cache`)."""
+        code_marker = _CODE_MARKERS[VerificationDType.xml]
+        # remove metadata from code snippet
+        if "\n" in code_snippet and code_snippet.startswith(code_marker) and code_snippet.endswith("```"):
+            # remove the first and last line 
+            code_snippet = "\n".join(code_snippet.split("\n")[1:-1])
+        cache = get_parse_cache()
+        if cache is not None:
+            return cache.parse(VerificationDType.xml.value, code_snippet, XMLParser._parse_xml)
+        return XMLParser._parse_xml(code_snippet)
+
+    @staticmethod
+    def _parse_xml(code_snippet: str) -> BeautifulSoup:
+        return BeautifulSoup(
+            code_snippet,
+            "html.parser",
+            multi_valued_attributes=_MULTI_VALUED_ATTRIBUTES,
+        )
+
     def handle(self, request: VerificationRequest) -> VerificationRequest:
         """Parse XML code blocks."""
-        from bs4 import BeautifulSoup
 
         for vdata in request.verification_data:
             if vdata.dtype != VerificationDType.xml:
@@ -155,19 +230,8 @@ class XMLParser(ProcessingHandler):
                 self.logger.debug(f"Code snippet for {vdata.id} is None. Skipping.")
                 continue
 
-            code_snippet = vdata.code_snippet
-            code_marker = _CODE_MARKERS[vdata.dtype]
-            # remove metadata from code snippet
-            if "\n" in code_snippet and code_snippet.startswith(code_marker) and code_snippet.endswith("```"):
-                # remove the first and last line 
-                code_snippet = "\n".join(code_snippet.split("\n")[1:-1])
             try:
-                
-                soup = BeautifulSoup(
-                    code_snippet,
-                    "html.parser",
-                    multi_valued_attributes=_MULTI_VALUED_ATTRIBUTES,
-                )
+                soup = self.parse_snippet(vdata.code_snippet)
                 vdata.data = soup
             except Exception as e:
                 metadata_text = f" {vdata.metadata}" if vdata.metadata else ""
@@ -0,0 +1,55 @@
+"""Stress test: concurrent logreco verifications share no Z3 state."""
+
+import asyncio
+import time
+
+import pytest
+
+from argdown_feedback.api.client.backends.inprocess import InProcessBackend
+from argdown_feedback.api.shared.models import VerificationRequest
+
+
+def _summary(response):
+    return (
+        response.is_valid,
+        [(r.verifier_id, r.is_valid, r.message) for r in response.results],
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_logreco_verifications_are_deterministic(
+    valid_logreco_text,
+    deductively_invalid_text,
+    inconsistent_premises_text,
+    irrelevant_premise_text,
+):
+    """Fire many concurrent logreco requests and compare with sequential results."""
+    inputs = [
+        valid_logreco_text,
+        deductively_invalid_text,
+        inconsistent_premises_text,
+        irrelevant_premise_text,
+    ]
+    backend = InProcessBackend(max_workers=8)
+    try:
+        expected = [
+            _summary(backend.verify_sync("logreco", VerificationRequest(inputs=text)))
+            for text in inputs
+        ]
+        assert [e[0] for e in expected] == [True, False, False, False]
+
+        n_rounds = 16
+        requests = [
+            VerificationRequest(inputs=text) for _ in range(n_rounds) for text in inputs
+        ]
+        start = time.time()
+        responses = await asyncio.gather(
+            *[backend.verify_async("logreco", request) for request in requests]
+        )
+        total_time = time.time() - start
+        print(f"{len(requests)} concurrent logreco requests: {total_time:.2f}s")
+
+        for i, response in enumerate(responses):
+            assert _summary(response) == expected[i % len(inputs)]
+    finally:
+        backend.close()
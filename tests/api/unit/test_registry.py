@@ -77,6 +77,15 @@ class TestCreateVerifierHandler:
         assert hasattr(handler, 'process')
         # Config is used internally but may not be stored as attributes
 
+    def test_create_logreco_handler_with_solver_budget(self):
+        """Test creating logreco-family handlers with solver budget."""
+        config = {"timeout_ms": 1000, "request_timeout_ms": 10000, "rlimit": 10**7, "max_memory_mb": 512}
+        for name in ["logreco", "arganno_logreco", "argmap_logreco", "arganno_argmap_logreco"]:
+            assert verifier_registry.validate_config_options(name, config) == []
+        handler = verifier_registry.create_handler("logreco", **config)
+        assert handler is not None
+        assert hasattr(handler, 'process')
+
     def test_create_handler_invalid_name(self):
         """Test creating handler with invalid name raises error."""
         with pytest.raises(VerifierNotFoundError):
@@ -0,0 +1,26 @@
+from contextlib import contextmanager
+
+from argdown_feedback.logic.fol_parser import FOLParser
+
+
+def fol_query(premises, conclusion, placeholders, labels=None):
+    """Arguments of `check_validity_z3` for an inference given as formula strings.
+
+    Premises are labelled "1", "2", ... (or by `labels`), the conclusion gets the
+    next number, and all `placeholders` are declared."""
+    labels = labels or [str(i + 1) for i in range(len(premises))]
+    premises_nltk = {k: FOLParser.parse(p) for k, p in zip(labels, premises)}
+    conclusion_nltk = {str(len(premises) + 1): FOLParser.parse(conclusion)}
+    plchd_substitutions = [[k, f"placeholder {k}"] for k in placeholders]
+    return premises_nltk, conclusion_nltk, plchd_substitutions
+
+
+@contextmanager
+def swapped_settings(get_settings, set_settings, settings):
+    """Installs process-wide `settings` (e.g. of the pre-solver) and restores the previous ones."""
+    previous = get_settings()
+    set_settings(settings)
+    try:
+        yield
+    finally:
+        set_settings(previous)
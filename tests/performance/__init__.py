@@ -0,0 +1 @@
+"""Performance benchmarks for core components."""
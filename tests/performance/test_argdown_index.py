@@ -0,0 +1,66 @@
+import random
+import time
+
+from pyargdown import parse_argdown
+
+from argdown_feedback.verifiers.argdown_index import ArgdownIndex
+
+
+def _synthetic_map(n_nodes: int, seed: int = 42) -> str:
+    """Argument map with alternating claims and arguments, each related to a random earlier node."""
+    rng = random.Random(seed)
+    labels = [f"[C{i}]" if i % 2 == 0 else f"<A{i}>" for i in range(n_nodes)]
+    lines = [f"{label}: Node {i}." for i, label in enumerate(labels)]
+    for i, label in enumerate(labels[1:], start=1):
+        lines += ["", labels[rng.randrange(i)], f"    {rng.choice(['<+', '<-'])} {label}"]
+    return "\n".join(lines)
+
+
+def _scan_lookups(argdown, drels):
+    """Previous implementation: scan the document for every source and target of a relation."""
+    resolved = []
+    for drel in drels:
+        nodes = []
+        for label in (drel.source, drel.target):
+            if any(a.label == label for a in argdown.arguments):
+                nodes.append(next((a for a in argdown.arguments if a.label == label), None))
+            else:
+                nodes.append(next((p for p in argdown.propositions if p.label == label), None))
+        rels = argdown.get_dialectical_relation(drel.source, drel.target) or []
+        resolved.append((*nodes, len(rels)))
+    return resolved
+
+
+def _index_lookups(argdown, drels):
+    index = ArgdownIndex(argdown)
+    resolved = []
+    for drel in drels:
+        nodes = []
+        for label in (drel.source, drel.target):
+            if label in index.arguments:
+                nodes.append(index.arguments.get(label))
+            else:
+                nodes.append(index.propositions.get(label))
+        resolved.append((*nodes, len(index.dialectical_relations(drel.source, drel.target))))
+    return resolved
+
+
+def test_benchmark_argdown_index_scaling():
+    """Label lookups by scanning the document vs. via the shared index (incl. building it), by map size."""
+    for n_nodes in (10, 100, 300, 1000):
+        argdown = parse_argdown(_synthetic_map(n_nodes))
+        drels = argdown.dialectical_relations
+
+        start = time.perf_counter()
+        expected = _scan_lookups(argdown, drels)
+        scan_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        resolved = _index_lookups(argdown, drels)
+        index_time = time.perf_counter() - start
+
+        assert resolved == expected
+        print(
+            f"{n_nodes:4d} nodes, {len(drels):4d} relations: "
+            f"scans {scan_time * 1000:.1f}ms, index {index_time * 1000:.1f}ms"
+        )
@@ -0,0 +1,75 @@
+import pickle
+import textwrap
+import time
+
+import pytest
+
+from argdown_feedback.tasks.base import Evaluation
+from argdown_feedback.tasks.core.logreco import (
+    LogicalReco,
+    LogRecoJudge,
+    LogRecoProblemGenerator,
+)
+
+
+def _chain_reco(n_steps: int) -> LogicalReco:
+    lines = [
+        "```argdown",
+        "<Chain>: A long chain of modus ponens.",
+        "",
+        '(1) P0 holds. {formalization: "p0", declarations: {"p0": "P0 holds."}}',
+    ]
+    label = 1
+    for i in range(1, n_steps + 1):
+        lines.append(
+            f'({label + 1}) If P{i - 1} then P{i}. '
+            f'{{formalization: "p{i - 1} -> p{i}", declarations: {{"p{i}": "P{i} holds."}}}}'
+        )
+        lines.append(f'-- {{from: ["{label}", "{label + 1}"]}} --')
+        lines.append(f'({label + 2}) P{i} holds. {{formalization: "p{i}"}}')
+        label += 2
+    lines.append("```")
+    return LogicalReco(argdown_snippet="\n".join(lines))
+
+
+@pytest.mark.asyncio
+async def test_benchmark_evaluation_payload():
+    """Compare bytes transferred and wall time per judge round: full evaluations vs. wire format."""
+    problem = await LogRecoProblemGenerator().arun(
+        textwrap.dedent("""
+        We should stop eating meat. Animals suffer.
+        """)
+    )
+    solutions = [_chain_reco(n) for n in (2, 8, 16, 32)]
+    evaluations = [
+        LogRecoJudge._evaluate_solution(solution, problem=problem)
+        for solution in solutions
+    ]
+
+    start = time.perf_counter()
+    full = [pickle.dumps(e) for e in evaluations]
+    _ = [pickle.loads(b) for b in full]
+    full_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compact = [pickle.dumps(e.to_payload()) for e in evaluations]
+    _ = [Evaluation.from_payload(pickle.loads(b)) for b in compact]
+    compact_time = time.perf_counter() - start
+
+    full_bytes = sum(len(b) for b in full)
+    compact_bytes = sum(len(b) for b in compact)
+    print(
+        f"Full evaluations: {full_bytes} bytes, {full_time * 1000:.1f}ms; "
+        f"wire format: {compact_bytes} bytes, {compact_time * 1000:.1f}ms"
+    )
+    assert compact_bytes < full_bytes
+
+    # wall time of a full judge round (using the judge's worker pool)
+    judge = LogRecoJudge()
+    try:
+        start = time.perf_counter()
+        round_evaluations = await judge.arun(problem, solutions)
+        print(f"Judge round with {len(solutions)} solutions: {time.perf_counter() - start:.2f}s")
+    finally:
+        await judge.aclose()
+    assert [e.is_valid for e in round_evaluations] == [e.is_valid for e in evaluations]
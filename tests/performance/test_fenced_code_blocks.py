@@ -0,0 +1,48 @@
+import random
+import time
+
+from argdown_feedback.verifiers.processing_handler import FencedCodeBlockExtractor
+from argdown_feedback.verifiers.verification_request import VerificationDType, VerificationRequest
+
+from ..test_verifiers_processing_handler import _extract_reference
+
+
+def _reasoning_trace(n_bytes: int, seed: int = 42) -> str:
+    """Long answer with reasoning, inline code, and drafts of argument maps and annotations."""
+    rng = random.Random(seed)
+    parts = []
+    size = 0
+    while size < n_bytes:
+        r = rng.random()
+        if r < 0.05:
+            part = f"```argdown filename=map{len(parts)}.ad\n[C1]: Claim.\n    <+ <A1>: Reason.\n```"
+        elif r < 0.08:
+            part = '```xml {"version": 2}\n<proposition id="1">Claim.</proposition>\n```'
+        elif r < 0.1:
+            part = "```python\nprint('no argdown here')\n```"
+        else:
+            part = "Let me think about this step by step. " * rng.randint(1, 10) + "Use `inline code` here."
+        parts.append(part)
+        size += len(part) + 2
+    return "\n\n".join(parts)
+
+
+def test_benchmark_fenced_code_block_extractor():
+    """Extraction of code blocks from long answers, single pass vs. previous implementation."""
+    languages = [VerificationDType.argdown, VerificationDType.xml]
+    for n_kb in (50, 100, 200):
+        input_text = _reasoning_trace(n_kb * 1000)
+
+        start = time.perf_counter()
+        expected = _extract_reference(input_text, languages)
+        reference_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        request = FencedCodeBlockExtractor().process(VerificationRequest(inputs=input_text, source=None))
+        scan_time = time.perf_counter() - start
+
+        assert [(v.dtype, v.code_snippet, v.metadata) for v in request.verification_data] == expected
+        print(
+            f"{n_kb:3d} KB, {len(expected)} blocks: previous implementation {reference_time * 1000:.1f}ms, "
+            f"single pass (incl. verification data) {scan_time * 1000:.1f}ms"
+        )
@@ -0,0 +1,50 @@
+import time
+
+from pyargdown import parse_argdown
+
+from argdown_feedback.verifiers.core.infreco_handler import InfRecoCompositeHandler
+from argdown_feedback.verifiers.verification_request import (
+    PrimaryVerificationData,
+    VerificationDType,
+    VerificationRequest,
+)
+
+
+def _argument(i: int, n_premises: int) -> str:
+    """Argument with a chain of sub-inferences, each from one premise and the previous conclusion."""
+    lines = [f"<Argument {i}>: Gist of argument {i}.", "", f"(1) Premise 1 of argument {i}."]
+    for j in range(2, 2 * n_premises, 2):
+        lines += [
+            f"({j}) Premise {j} of argument {i}.",
+            f'-- {{from: ["{j - 1}", "{j}"]}} --',
+            f"({j + 1}) Conclusion {j + 1} of argument {i}.",
+        ]
+    return "\n".join(lines + [""])
+
+
+def _request(argdown) -> VerificationRequest:
+    vdata = PrimaryVerificationData(id="reco", dtype=VerificationDType.argdown, data=argdown)
+    return VerificationRequest(inputs="test", verification_data=[vdata])
+
+
+def _results(argdown, fused: bool, n_iterations: int):
+    handler = InfRecoCompositeHandler(fused=fused)
+    start = time.perf_counter()
+    for _ in range(n_iterations):
+        request = handler.process(_request(argdown))
+    duration = (time.perf_counter() - start) / n_iterations
+    return duration, [(r.verifier_id, r.is_valid, r.message) for r in request.results]
+
+
+def test_benchmark_fused_infreco_latency():
+    """Per-document latency of the InfReco checks, one handler after another vs. fused, by document size."""
+    n_iterations = 20
+    for n_arguments, n_premises in ((1, 3), (1, 20), (5, 10), (20, 10), (50, 20)):
+        argdown = parse_argdown("\n".join(_argument(i, n_premises) for i in range(n_arguments)))
+        handlers_time, expected = _results(argdown, False, n_iterations)
+        fused_time, results = _results(argdown, True, n_iterations)
+        assert results == expected
+        print(
+            f"{n_arguments:2d} arguments x {n_premises:2d} premises: "
+            f"handlers {handlers_time * 1000:.2f}ms, fused {fused_time * 1000:.2f}ms"
+        )
@@ -0,0 +1,54 @@
+import time
+
+from argdown_feedback.logic.fol_parser import parse_formula
+from argdown_feedback.logic.logic import Syntax
+from argdown_feedback.logic.logic_renderer import (
+    LatexLogicRenderingMachine,
+    _rendering_memo,
+    render_expression,
+)
+from tests.test_logic_renderer import _postprocess_reference
+
+
+def _nested_formula(depth):
+    formula = "F(a)"
+    for i in range(depth):
+        formula = f"(all x{i}.(F(x{i}) -> G(x{i})) {'&' if i % 2 else '->'} {formula})"
+    return formula
+
+
+def test_benchmark_rendering_by_nesting_depth():
+    """Parenthesis stripping (former vs. single pass) and rendering (cold vs. memoized), by depth."""
+    lrm = LatexLogicRenderingMachine()
+    n_repetitions = 20
+    for depth in (10, 25, 50, 75, 95):
+        expression = parse_formula(_nested_formula(depth))
+        # the former stripping gets quadratic when the outer parentheses are removable
+        rendered = "(" + render_expression(expression, Syntax.LATEX) + ")"
+
+        start = time.perf_counter()
+        for _ in range(n_repetitions):
+            expected = _postprocess_reference(rendered)
+        reference_time = (time.perf_counter() - start) / n_repetitions
+        start = time.perf_counter()
+        for _ in range(n_repetitions):
+            stripped = lrm.postprocess(rendered)
+        postprocess_time = (time.perf_counter() - start) / n_repetitions
+        assert stripped == expected
+
+        cold_time = 0.0
+        for _ in range(n_repetitions):
+            _rendering_memo.clear()
+            start = time.perf_counter()
+            renderings = [render_expression(expression, syntax) for syntax in (Syntax.Z3, Syntax.LATEX)]
+            cold_time += (time.perf_counter() - start) / n_repetitions
+        start = time.perf_counter()
+        for _ in range(n_repetitions):
+            assert [render_expression(expression, syntax) for syntax in (Syntax.Z3, Syntax.LATEX)] == renderings
+        memoized_time = (time.perf_counter() - start) / n_repetitions
+
+        print(
+            f"depth {depth:3d} ({len(rendered)} chars): stripping {reference_time * 1000:.2f}ms -> "
+            f"{postprocess_time * 1000:.3f}ms; rendering cold {cold_time * 1000:.2f}ms, "
+            f"memoized {memoized_time * 1000:.3f}ms"
+        )
@@ -0,0 +1,57 @@
+import time
+
+from pyargdown import parse_argdown
+
+from argdown_feedback.verifiers.core.logreco_handler import LogRecoCompositeHandler
+from argdown_feedback.verifiers.verification_request import (
+    PrimaryVerificationData,
+    VerificationDType,
+    VerificationRequest,
+)
+
+
+def _chain_argument(i: int, length: int = 6) -> str:
+    """Argument that fails to infer R(a_n,a_0) from a transitive R-chain (MBQI needs a while to find the countermodel)."""
+    chain = [f"a{i}x{j}" for j in range(length)]
+    lines = [
+        f"<Chain {i}>: Chain {i}.",
+        "",
+        f"(P1) Relation {i} is transitive. "
+        f'{{formalization: "all x y z.((R{i}(x,y) & R{i}(y,z)) -> R{i}(x,z))", declarations: {{"R{i}": "relation {i}"}}}}',
+    ]
+    for j, (a, b) in enumerate(zip(chain, chain[1:])):
+        lines.append(
+            f'(P{j + 2}) Link {j} of chain {i}. {{formalization: "R{i}({a},{b})", declarations: {{"{a}": "{a}"}}}}'
+        )
+    premises = ", ".join(f'"P{j + 1}"' for j in range(length))
+    lines += [
+        f"-- {{from: [{premises}]}} --",
+        f'(C{length + 1}) Chain {i} is closed. {{formalization: "R{i}({chain[-1]},{chain[0]})", declarations: {{"{chain[-1]}": "{chain[-1]}"}}}}',
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def _request(n_arguments: int) -> VerificationRequest:
+    argdown = parse_argdown("\n".join(_chain_argument(i) for i in range(n_arguments)))
+    vdata = PrimaryVerificationData(id="chains", dtype=VerificationDType.argdown, data=argdown)
+    return VerificationRequest(inputs="test", verification_data=[vdata])
+
+
+def _results(n_arguments: int, max_workers: int | None):
+    start = time.perf_counter()
+    request = LogRecoCompositeHandler(max_workers=max_workers).process(_request(n_arguments))
+    duration = time.perf_counter() - start
+    return duration, [(r.verifier_id, r.is_valid, r.message) for r in request.results]
+
+
+def test_benchmark_parallel_logreco_scaling():
+    """Serial vs. parallel logreco checks, by number of arguments in the document."""
+    for n_arguments in (1, 2, 4, 8, 15):
+        serial_time, expected = _results(n_arguments, None)
+        timings = []
+        for max_workers in (2, 4):
+            parallel_time, results = _results(n_arguments, max_workers)
+            assert results == expected
+            timings.append(f"{max_workers} workers {parallel_time * 1000:.0f}ms")
+        print(f"{n_arguments:2d} arguments: serial {serial_time * 1000:.0f}ms, " + ", ".join(timings))
@@ -0,0 +1,42 @@
+import time
+
+from argdown_feedback.verifiers.parse_cache import ParseCache, get_parse_cache, set_parse_cache
+from argdown_feedback.verifiers.processing_handler import ArgdownParser, XMLParser
+
+from .test_argdown_index import _synthetic_map
+
+
+def _xml_annotation(n_propositions: int) -> str:
+    return "\n".join(
+        f'<proposition id="{i}" supports="{i - 1}">Proposition {i}.</proposition>' for i in range(1, n_propositions + 1)
+    )
+
+
+def _timed(parse, snippet: str, repetitions: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        parse(snippet)
+    return time.perf_counter() - start
+
+
+def test_benchmark_parse_cache():
+    """Repeated parsing of the same snippets, with and without parse cache."""
+    previous = get_parse_cache()
+    try:
+        for n_nodes in (10, 100, 500):
+            for name, parse, snippet in (
+                ("argdown", ArgdownParser.parse_snippet, _synthetic_map(n_nodes)),
+                ("xml", XMLParser.parse_snippet, _xml_annotation(n_nodes)),
+            ):
+                set_parse_cache(None)
+                uncached = _timed(parse, snippet, 10)
+                cache = ParseCache()
+                set_parse_cache(cache)
+                cached = _timed(parse, snippet, 10)
+                assert cache.stats()["hits"] == 9
+                print(
+                    f"{name:7s} {n_nodes:3d} nodes: uncached {uncached * 100:.1f}ms, "
+                    f"cached {cached * 100:.1f}ms per parse"
+                )
+    finally:
+        set_parse_cache(previous)
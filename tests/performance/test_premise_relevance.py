@@ -0,0 +1,63 @@
+import time
+
+from argdown_feedback.logic.fol_parser import FOLParser
+from argdown_feedback.logic.smtlib import Z3Session, check_validity_z3
+
+
+def _chain_argument(n_premises: int, n_irrelevant: int):
+    """F0(a), all x.(F0(x) -> F1(x)), ... entails Fn(a); plus irrelevant premises."""
+    n_chain = n_premises - n_irrelevant
+    premises = ["F0(a)"] + [f"all x.(F{i - 1}(x) -> F{i}(x))" for i in range(1, n_chain)]
+    premises += [f"all x.(G{i}(x) -> F0(x))" for i in range(n_irrelevant)]
+    conclusion = f"F{n_chain - 1}(a)"
+    placeholders = ["a"] + [f"F{i}" for i in range(n_chain)] + [f"G{i}" for i in range(n_irrelevant)]
+    return (
+        {str(i + 1): FOLParser.parse(p) for i, p in enumerate(premises)},
+        {str(len(premises) + 1): FOLParser.parse(conclusion)},
+        [[k, k] for k in placeholders],
+    )
+
+
+def _per_premise_checks(premises, conclusion, plchd_substitutions, session=None):
+    """Previous implementation: one validity check per premise."""
+    return [
+        k
+        for k in premises
+        if check_validity_z3(
+            {j: e for j, e in premises.items() if j != k},
+            conclusion,
+            plchd_substitutions,
+            session=session,
+        )[0]
+    ]
+
+
+def test_benchmark_premise_relevance_scaling():
+    """Per-premise validity checks vs. unsat-core based relevance check, by number of premises."""
+    n_iterations = 10
+    for n_premises in (2, 4, 8, 12, 15):
+        for n_irrelevant in (0, n_premises // 2):
+            argument = _chain_argument(n_premises, n_irrelevant)
+
+            start = time.perf_counter()
+            for _ in range(n_iterations):
+                before = _per_premise_checks(*argument)
+            isolated_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for _ in range(n_iterations):
+                incremental = _per_premise_checks(*argument, session=Z3Session())
+            incremental_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for _ in range(n_iterations):
+                after = list(Z3Session().dispensable_premises(*argument))
+            core_time = time.perf_counter() - start
+
+            print(
+                f"{n_premises:2d} premises ({n_irrelevant} irrelevant): "
+                f"isolated checks {isolated_time * 1000 / n_iterations:.1f}ms, "
+                f"incremental checks {incremental_time * 1000 / n_iterations:.1f}ms, "
+                f"unsat cores {core_time * 1000 / n_iterations:.1f}ms"
+            )
+            assert before == incremental == after
@@ -0,0 +1,62 @@
+import random
+import time
+
+from argdown_feedback.logic.fol_parser import FOLParser
+from argdown_feedback.logic.propositional import (
+    PropositionalFastPath,
+    get_propositional_fast_path,
+    set_propositional_fast_path,
+)
+from argdown_feedback.logic.smtlib import check_validity_z3
+
+
+def _random_inference(n_atoms: int, rng: random.Random):
+    atoms = [f"p{i}" for i in range(n_atoms)]
+
+    def formula(depth):
+        if depth == 0 or rng.random() < 0.2:
+            atom = rng.choice(atoms)
+            return f"-{atom}" if rng.random() < 0.3 else atom
+        op = rng.choice(["&", "|", "->", "<->"])
+        return f"({formula(depth - 1)} {op} {formula(depth - 1)})"
+
+    premises = [formula(3) for _ in range(rng.randint(2, 6))]
+    if rng.random() < 0.5:
+        premises.append(f"({premises[0]} -> {atoms[0]})")
+        conclusion = atoms[0]
+    else:
+        conclusion = formula(2)
+    return (
+        {str(i + 1): FOLParser.parse(p) for i, p in enumerate(premises)},
+        {str(len(premises) + 1): FOLParser.parse(conclusion)},
+        [[a, a] for a in atoms],
+    )
+
+
+def test_benchmark_propositional_fast_path_by_atoms():
+    """Z3 checks vs. truth tables (resp. SAT tactic above threshold), by number of atoms."""
+    rng = random.Random(42)
+    n_inferences = 100
+    previous = get_propositional_fast_path()
+    try:
+        for n_atoms in (2, 4, 8, 12, 16, 20, 24):
+            inferences = [_random_inference(n_atoms, rng) for _ in range(n_inferences)]
+
+            set_propositional_fast_path(PropositionalFastPath(enabled=False))
+            start = time.perf_counter()
+            expected = [check_validity_z3(*inference)[0] for inference in inferences]
+            z3_time = time.perf_counter() - start
+
+            set_propositional_fast_path(PropositionalFastPath())
+            start = time.perf_counter()
+            verdicts = [check_validity_z3(*inference)[0] for inference in inferences]
+            fast_time = time.perf_counter() - start
+
+            print(
+                f"{n_atoms:2d} atoms: Z3 {z3_time * 1000 / n_inferences:.2f}ms, "
+                f"fast path {fast_time * 1000 / n_inferences:.2f}ms per check "
+                f"({sum(expected)} of {n_inferences} valid)"
+            )
+            assert verdicts == expected
+    finally:
+        set_propositional_fast_path(previous)
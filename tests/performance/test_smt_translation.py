@@ -0,0 +1,114 @@
+import re
+import time
+
+from nltk.sem.logic import NegatedExpression  # type: ignore
+from z3 import parse_smt2_string, SimpleSolver, unsat  # type: ignore
+
+from argdown_feedback.logic.fol_parser import FOLParser
+from argdown_feedback.logic.smtlib import (
+    SMT_program_global,
+    Z3Session,
+    Z3Translator,
+    check_validity_z3,
+    get_z3_context,
+)
+
+from tests.test_verifiers_logreco_handler import (  # noqa: F401
+    valid_logreco_text,
+    deductively_invalid_text,
+    inconsistent_premises_text,
+    irrelevant_premise_text,
+)
+
+_FORMALIZATION = re.compile(r'formalization: "([^"]*)"')
+_DECLARATIONS = re.compile(r'"([^"]+)": "[^"]*"')
+
+
+def _inference(argdown_text: str):
+    """Premises, conclusion and declarations of a single-argument reconstruction."""
+    formulas = [FOLParser.parse(f) for f in _FORMALIZATION.findall(argdown_text)]
+    declarations = [
+        [k, k]
+        for line in argdown_text.splitlines()
+        if "declarations:" in line
+        for k in _DECLARATIONS.findall(line.split("declarations:", 1)[1])
+    ]
+    premises = {str(i + 1): f for i, f in enumerate(formulas[:-1])}
+    conclusion = {str(len(formulas)): formulas[-1]}
+    return premises, conclusion, declarations
+
+
+def _document_checks(premises, conclusion, declarations):
+    """Validity checks run by the logreco handlers for a single-argument document:
+    global validity, relevance of every premise, consistency of premises."""
+    checks = [(premises, conclusion, declarations)]
+    if len(premises) > 1:
+        for k in premises:
+            checks.append(({j: e for j, e in premises.items() if j != k}, conclusion, declarations))
+    key = next(iter(premises))
+    checks.append((premises, {f"{key}_neg": NegatedExpression(premises[key])}, declarations))
+    return checks
+
+
+def _check_validity_smtlib(premises, conclusion, plchd_substitutions):
+    """Previous implementation: render SMT2-LIB program and reparse it."""
+    ctx = get_z3_context()
+    smtlib_code = SMT_program_global(
+        premises_formalized_nltk=premises,
+        conclusion_formalized_nltk=conclusion,
+        plchd_substitutions=plchd_substitutions,
+    )
+    solver = SimpleSolver(ctx=ctx)
+    solver.add(parse_smt2_string(smtlib_code, ctx=ctx))
+    return solver.check() == unsat, smtlib_code
+
+
+def test_benchmark_direct_translation(
+    valid_logreco_text,
+    deductively_invalid_text,
+    inconsistent_premises_text,
+    irrelevant_premise_text,
+):
+    """Compare SMT2-LIB round-trip with direct translation on the logreco fixtures."""
+    documents = [
+        _document_checks(*_inference(text))
+        for text in (
+            valid_logreco_text,
+            deductively_invalid_text,
+            inconsistent_premises_text,
+            irrelevant_premise_text,
+        )
+    ]
+    n_checks = sum(len(checks) for checks in documents)
+    n_iterations = 100
+
+    start = time.perf_counter()
+    for _ in range(n_iterations):
+        before = [
+            [_check_validity_smtlib(*check)[0] for check in checks]
+            for checks in documents
+        ]
+    smtlib_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(n_iterations):
+        after = []
+        for checks in documents:
+            translator = Z3Translator()  # one translator per document, as in the handlers
+            after.append([check_validity_z3(*check, translator=translator)[0] for check in checks])
+    direct_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(n_iterations):
+        incremental = []
+        for checks in documents:
+            session = Z3Session()  # one solver session per document, as in LogRecoCompositeHandler
+            incremental.append([check_validity_z3(*check, session=session)[0] for check in checks])
+    session_time = time.perf_counter() - start
+
+    print(
+        f"{n_iterations * n_checks} validity checks: "
+        f"SMT2-LIB round-trip {smtlib_time:.2f}s, direct translation {direct_time:.2f}s, "
+        f"incremental session {session_time:.2f}s"
+    )
+    assert before == after == incremental
@@ -0,0 +1,102 @@
+import time
+
+from argdown_feedback.logic.fol_parser import FOLParser
+from argdown_feedback.logic.presolver import Presolver, get_presolver, set_presolver
+from argdown_feedback.logic.propositional import (
+    Fragment,
+    PropositionalFastPath,
+    classify_fragment,
+    get_propositional_fast_path,
+    set_propositional_fast_path,
+)
+from argdown_feedback.logic.smtlib import check_validity_z3
+from argdown_feedback.logic.solver_strategy import SolverStrategy, get_solver_strategy, set_solver_strategy
+
+# inferences with formalizations as used in the logreco test suites, labelled by fragment
+CORPUS = {
+    Fragment.PROPOSITIONAL: [
+        (["p", "p -> q"], "q"),
+        (["r -> q", "-q"], "-r"),
+        (["p -> -q", "q"], "-p"),
+        (["p & q"], "p"),
+        (["p or p"], "p"),
+        (["p & -p"], "q"),
+        (["r", "r -> q", "q -> s"], "s"),
+        (["r -> -p", "p"], "r"),
+    ],
+    Fragment.QUANTIFIER_FREE: [
+        (["F(a)", "F(a) -> G(a)"], "G(a)"),
+        (["-G(a)", "F(a) -> G(a)"], "-F(a)"),
+        (["F(a) | G(a)", "-F(a)"], "G(a)"),
+        (["M(s) -> D(s)", "M(s)"], "D(s)"),
+        (["R(b,a)", "R(b,a) -> C(w,d)"], "C(w,d)"),
+        (["F(a) -> G(a)", "G(a)"], "F(a)"),
+        (["p -> F(r)", "p"], "F(r)"),
+    ],
+    Fragment.FIRST_ORDER: [
+        (["all x.(F(x) -> G(x))", "F(a)"], "G(a)"),
+        (["all x.(M(x) -> D(x))", "M(s)"], "D(s)"),
+        (["all x.(F(x) -> G(x))", "all x.(G(x) -> H(x))"], "all x.(F(x) -> H(x))"),
+        (["all x.(F(x) -> G(x))", "all x.(G(x) -> H(x))", "all x.(H(x) -> J(x))"], "all x.(F(x) -> J(x))"),
+        (["all x.(F(x) -> G(x))"], "all x.(G(x) -> F(x))"),
+        (["all x.(A(x) -> F(x))", "all x.(A(x) -> -H(x))"], "all x.(F(x) -> -H(x))"),
+        (["exists x.(F(x) & -G(x))"], "-all x.(F(x) -> G(x))"),
+        (["all x.(F(x) | -F(x))"], "exists x.F(x)"),
+        (["all x.(R(x,a))"], "R(b,a)"),
+        (["all x y.(R(x,y) -> R(y,x))", "R(a,b)"], "R(b,a)"),
+        (["all x y z.((R(x,y) & R(y,z)) -> R(x,z))", "R(a,b)", "R(b,c)"], "R(a,c)"),
+        (["all x y z.((R(x,y) & R(y,z)) -> R(x,z))", "R(a,b)", "R(b,c)"], "R(c,a)"),
+        (["all x.exists y.R(x,y)", "all x y.(R(x,y) -> R(y,x))"], "all x.exists y.(R(x,y) & R(y,x))"),
+        (["all x.exists y.R(x,y)"], "exists y.all x.R(x,y)"),
+        (["exists y.all x.R(x,y)"], "all x.exists y.R(x,y)"),
+    ],
+}
+
+
+def _queries(inferences):
+    queries = []
+    for premises, conclusion in inferences:
+        premises_nltk = {str(i + 1): FOLParser.parse(p) for i, p in enumerate(premises)}
+        conclusion_nltk = {str(len(premises) + 1): FOLParser.parse(conclusion)}
+        symbols = set().union(*(e.free() | e.constants() | e.predicates() for e in [*premises_nltk.values(), *conclusion_nltk.values()]))
+        queries.append((premises_nltk, conclusion_nltk, [[s.name, s.name] for s in symbols]))
+    return queries
+
+
+def _latency(queries, repetitions=20):
+    start = time.perf_counter()
+    verdicts = []
+    for _ in range(repetitions):
+        verdicts = [check_validity_z3(*query)[0] for query in queries]
+    return (time.perf_counter() - start) * 1000 / (repetitions * len(queries)), verdicts
+
+
+def test_benchmark_solver_strategy_by_fragment():
+    """Latency per check by fragment, with Z3's default solver vs. preprocessing of
+    queries without quantifiers (solver only, and with propositional fast path and
+    pre-solver); quantified queries use the default solver either way."""
+    previous = get_propositional_fast_path(), get_presolver(), get_solver_strategy()
+    try:
+        for fragment, inferences in CORPUS.items():
+            queries = _queries(inferences)
+            assert all(
+                classify_fragment([*q[0].values(), *q[1].values()]) == fragment for q in queries
+            )
+            timings = []
+            for enabled in (False, True):
+                set_propositional_fast_path(PropositionalFastPath(enabled=enabled))
+                set_presolver(Presolver(enabled=enabled))
+                set_solver_strategy(SolverStrategy(select_tactics=False))
+                before, expected = _latency(queries)
+                set_solver_strategy(SolverStrategy())
+                after, verdicts = _latency(queries)
+                assert verdicts == expected
+                timings.append(f"{before:.2f}ms -> {after:.2f}ms")
+            print(
+                f"{fragment.value} ({len(queries)} queries): solver only {timings[0]}, "
+                f"with fast path and pre-solver {timings[1]} per check"
+            )
+    finally:
+        set_propositional_fast_path(previous[0])
+        set_presolver(previous[1])
+        set_solver_strategy(previous[2])
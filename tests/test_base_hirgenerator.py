@@ -1,3 +1,4 @@
+import os
 import pprint
 from typing import Sequence
 import pytest
@@ -13,6 +14,8 @@ from argdown_feedback.tasks.base import (
     ProblemGenerator,
     SolutionGenerator,
     Judge,
+    JudgeWorkerPool,
+    MPJudge,
     FeedbackGenerator,
     VirtuePreferencePairGenerator,
     HIRPreferencePairGenerator,
@@ -226,6 +229,34 @@ class NumberJudge(Judge):
         return evaluations
 
 
+class NumberMPJudge(MPJudge):
+    def _check_inputs(
+        self,
+        problem: Problem,
+        solutions: Sequence[Solution],
+        original_solution: Solution | None = None,
+        feedback: Feedback | None = None,
+    ) -> None:
+        assert isinstance(problem, NumberProblem), "problem must be a NumberProblem"
+
+    @staticmethod
+    def _evaluate_solution(
+        solution: Solution,
+        problem: Problem | None = None,
+        original_solution: Solution | None = None,
+        feedback: Feedback | None = None,
+    ) -> Evaluation:
+        assert isinstance(problem, NumberProblem), "problem must be a NumberProblem"
+        assert isinstance(solution, NumberSolution), "solution must be a NumberSolution"
+        is_valid = solution.answer in ["y", "n"]
+        is_correct = is_valid and (solution.answer == "y") == (problem.number % 2 == 0)
+        return Evaluation(
+            is_valid=is_valid,
+            artifacts={"is_correct": is_correct, "pid": os.getpid()},
+            metrics={},
+        )
+
+
 class EmptyFeedbackGenerator(FeedbackGenerator):
     async def arun(
         self,
@@ -549,3 +580,69 @@ async def test_correct_after_magic():
     pprint.pprint(pairs)
     assert not pairs  # all solutions are valid, no pref pairs for training
 
+
+
+@pytest.mark.asyncio
+async def test_mp_judge_reuses_worker_pool():
+    async with JudgeWorkerPool(max_workers=2) as pool:
+        judge = NumberMPJudge(worker_pool=pool)
+        evaluations = await judge.arun(
+            NumberProblem(2), [NumberSolution("y"), NumberSolution("n"), NumberSolution("x")]
+        )
+        assert [e.is_valid for e in evaluations] == [True, True, False]
+        assert [e.artifacts["is_correct"] for e in evaluations] == [True, False, False]
+        pids = {e.artifacts["pid"] for e in evaluations}
+        assert os.getpid() not in pids
+
+        # second round (different problem) is served by the same warm workers
+        evaluations = await judge.arun(NumberProblem(3), [NumberSolution("n")])
+        assert evaluations[0].artifacts["is_correct"]
+        pids.add(evaluations[0].artifacts["pid"])
+        assert len(pids) <= 2  # no workers have been respawned
+        assert pool.is_running
+
+    assert not pool.is_running
+
+
+@pytest.mark.asyncio
+async def test_mp_judge_shared_pool_lifecycle():
+    judge1 = NumberMPJudge(max_workers=2)
+    judge2 = NumberMPJudge(max_workers=2)
+    assert judge1.worker_pool is judge2.worker_pool
+
+    hirp_gen = HIRPreferencePairGenerator(
+        problem_generator=NumberProblemGenerator(),
+        solution_generator=FirstCorrectGen(n_solutions=3),
+        judge=judge1,
+    )
+    async with hirp_gen:
+        await hirp_gen.arun(2)
+        assert judge1.worker_pool.is_running
+    # the process-wide pool outlives the generator and keeps serving other judges
+    assert judge2.worker_pool.is_running
+
+    evaluations = await judge2.arun(NumberProblem(2), [NumberSolution("y")])
+    assert evaluations[0].is_valid
+    await judge2.aclose()
+    assert judge1.worker_pool.is_running
+
+
+@pytest.mark.asyncio
+async def test_mp_judge_close_leaves_shared_pool_running():
+    judge1 = NumberMPJudge(max_workers=2)
+    judge2 = NumberMPJudge(max_workers=2)
+    await judge1.arun(NumberProblem(2), [NumberSolution("y")])
+    await judge1.aclose()
+
+    assert judge2.worker_pool.is_running
+    evaluations = await judge2.arun(NumberProblem(3), [NumberSolution("n"), NumberSolution("y")])
+    assert [e.artifacts["is_correct"] for e in evaluations] == [True, False]
+    assert os.getpid() not in {e.artifacts["pid"] for e in evaluations}
+
+    # dedicated pools are shut down with their judge
+    pool = JudgeWorkerPool(max_workers=1)
+    judge3 = NumberMPJudge(worker_pool=pool)
+    await judge3.arun(NumberProblem(2), [NumberSolution("y")])
+    await judge3.aclose()
+    assert not pool.is_running
+    assert judge2.worker_pool.is_running
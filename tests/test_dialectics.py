@@ -0,0 +1,132 @@
+import random
+from types import SimpleNamespace
+
+import pytest
+from pyargdown import Valence
+
+from argdown_feedback.logic.dialectics import (
+    NEGATION_SCHEMES,
+    are_contradictory,
+    are_identical,
+    indirectly_attacks,
+    indirectly_supports,
+)
+
+
+class ArgumentMap:
+    """Argument map with the interface used by `dialectics`."""
+
+    def __init__(self, labels, relations, texts=None):
+        texts = texts or {}
+        self.propositions = [SimpleNamespace(label=label, texts=texts.get(label, [])) for label in labels]
+        self.dialectical_relations = [
+            SimpleNamespace(source=s, target=t, valence=v) for s, t, v in relations
+        ]
+
+    def get_dialectical_relation(self, source, target):
+        rels = [r for r in self.dialectical_relations if r.source == source and r.target == target]
+        return rels or None
+
+
+def _indirectly_related_reference(from_label, to_label, argdown_map, support):
+    """Reference implementation: scan all intermediate propositions."""
+    if from_label == to_label:
+        return support
+    rels_direct = argdown_map.get_dialectical_relation(from_label, to_label) or []
+    if any(rd.valence == (Valence.SUPPORT if support else Valence.ATTACK) for rd in rels_direct):
+        return True
+    for prop in argdown_map.propositions:
+        if prop.label is None or prop.label == from_label or prop.label == to_label:
+            continue
+        rels1 = argdown_map.get_dialectical_relation(from_label, prop.label) or []
+        rels2 = argdown_map.get_dialectical_relation(prop.label, to_label) or []
+        for rel1 in rels1:
+            for rel2 in rels2:
+                # support of support and attack of attack is support, otherwise attack
+                same_valence = (rel1.valence == Valence.SUPPORT) == (rel2.valence == Valence.SUPPORT)
+                if same_valence == support:
+                    return True
+    return False
+
+
+def _random_map(rng, n_props, n_args, n_relations):
+    labels = [f"p{i}" for i in range(n_props)] + [None]
+    nodes = [f"p{i}" for i in range(n_props)] + [f"a{i}" for i in range(n_args)]
+    valences = [Valence.SUPPORT, Valence.ATTACK, Valence.CONTRADICT]
+    relations = [
+        (rng.choice(nodes), rng.choice(nodes), rng.choice(valences)) for _ in range(n_relations)
+    ]
+    return ArgumentMap(labels, relations), nodes
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_indirect_relations_match_reference(seed):
+    rng = random.Random(seed)
+    argdown_map, nodes = _random_map(rng, rng.randint(1, 8), rng.randint(0, 4), rng.randint(0, 25))
+    for source in nodes:
+        for target in nodes:
+            assert indirectly_supports(source, target, argdown_map) == _indirectly_related_reference(
+                source, target, argdown_map, support=True
+            )
+            assert indirectly_attacks(source, target, argdown_map) == _indirectly_related_reference(
+                source, target, argdown_map, support=False
+            )
+
+
+def test_indirect_relations():
+    argdown_map = ArgumentMap(
+        ["A", "B", "C", "D"],
+        [
+            ("A", "B", Valence.SUPPORT),
+            ("B", "C", Valence.ATTACK),
+            ("C", "D", Valence.CONTRADICT),
+            ("arg", "A", Valence.SUPPORT),
+        ],
+    )
+    assert indirectly_supports("A", "A", argdown_map)
+    assert indirectly_supports("arg", "B", argdown_map)
+    assert indirectly_supports("B", "D", argdown_map)
+    assert not indirectly_supports("arg", "C", argdown_map)
+    assert indirectly_attacks("A", "C", argdown_map)
+    assert indirectly_attacks("B", "C", argdown_map)
+    # contradictions count as attacks only via intermediate propositions
+    assert not indirectly_attacks("C", "D", argdown_map)
+    assert not indirectly_attacks("A", "D", argdown_map)
+    assert not indirectly_attacks("A", "A", argdown_map)
+
+
+def _are_contradictory_reference(prop1, prop2, argdown):
+    """Reference implementation: render negations and scan all relations."""
+    if prop1.label == prop2.label:
+        return False
+    if argdown is not None and any(
+        drel.source in [prop1.label, prop2.label]
+        and drel.target in [prop1.label, prop2.label]
+        and drel.source != drel.target
+        and drel.valence in [Valence.ATTACK, Valence.CONTRADICT]
+        for drel in argdown.dialectical_relations
+    ):
+        return True
+    negations_prop1 = [scheme.format(text=text) for scheme in NEGATION_SCHEMES for text in prop1.texts]
+    negations_prop2 = [scheme.format(text=text) for scheme in NEGATION_SCHEMES for text in prop2.texts]
+    return any(text in negations_prop2 for text in prop1.texts) or any(text in negations_prop1 for text in prop2.texts)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_contradictory_propositions_match_reference(seed):
+    rng = random.Random(seed)
+    sentences = ["It rains.", "Not: It rains.", "NOT It rains.", "Not Not: It rains.", "It snows.", "NOT: It snows."]
+    labels = [f"p{i}" for i in range(rng.randint(1, 8))]
+    texts = {label: rng.sample(sentences, rng.randint(1, 2)) for label in labels}
+    valences = [Valence.SUPPORT, Valence.ATTACK, Valence.CONTRADICT]
+    relations = [(rng.choice(labels), rng.choice(labels), rng.choice(valences)) for _ in range(rng.randint(0, 10))]
+    argdown = ArgumentMap(labels, relations, texts)
+    # proposition of another document, with the same label as an indexed one
+    other = SimpleNamespace(label="p0", texts=["NOT: It snows."])
+    for prop1 in [*argdown.propositions, other]:
+        for prop2 in [*argdown.propositions, other]:
+            for doc in (argdown, None):
+                assert are_contradictory(prop1, prop2, doc) == _are_contradictory_reference(prop1, prop2, doc)
+            assert are_identical(prop1, prop2) == (
+                prop1.label == prop2.label or any(text in prop2.texts for text in prop1.texts)
+            )
@@ -0,0 +1,178 @@
+import random
+
+from nltk.sem.logic import (  # type: ignore
+    AbstractVariableExpression,
+    ApplicationExpression,
+    BinaryExpression,
+    Expression,
+    LogicalExpressionException,
+    NegatedExpression,
+    VariableBinderExpression,
+)
+import pytest
+
+from argdown_feedback.logic.fol_parser import FOLParser, parse_formula
+
+
+QUANTIFIERS = ["all", "forall", "exists", "some", "exist"]
+CONNECTIVES = ["&", "^", "and", "|", "or", "->", "=>", "implies", "<->", "<=>", "iff"]
+NEGATIONS = ["-", "!", "not"]
+VARIABLES = ["x", "y", "z1", "e", "e2", "P", "F2"]
+CONSTANTS = ["a", "b", "john", "Fa", "p", "q", "R", "G"]
+# everything the tokenizer has to deal with, including lambda terms and stray characters
+VOCABULARY = (
+    QUANTIFIERS + CONNECTIVES + NEGATIONS + VARIABLES + CONSTANTS
+    + ["=", "==", "!=", "(", ")", ",", ".", "\\", "iota", "<", ">", "<-", "<=", "-->", "a<b"]
+)
+
+
+def _random_formula(rng, depth=3):
+    """Random formula of the first-order fragment, with random token aliases and spacing."""
+    sep = rng.choice(["", " ", "  ", "\t"])
+    if depth == 0 or rng.random() < 0.2:
+        kind = rng.random()
+        if kind < 0.3:
+            return rng.choice(CONSTANTS + VARIABLES)
+        if kind < 0.8:
+            arguments = [rng.choice(CONSTANTS[:3] + VARIABLES[:3]) for _ in range(rng.randint(1, 3))]
+            return f"{rng.choice(['F', 'G', 'R', 'Fa', 'john'])}({','.join(arguments)})"
+        return f"{rng.choice(CONSTANTS[:3] + VARIABLES[:3])}{sep}{rng.choice(['=', '==', '!='])}{sep}{rng.choice(CONSTANTS[:3] + VARIABLES[:3])}"
+    kind = rng.random()
+    if kind < 0.2:
+        negation = rng.choice(NEGATIONS)
+        return f"{negation}{' ' if negation == 'not' else sep}{_random_formula(rng, depth - 1)}"
+    if kind < 0.4:
+        variables = " ".join(rng.sample(VARIABLES[:4], rng.randint(1, 2)))
+        dot = rng.choice([".", ". ", " "])
+        return f"{rng.choice(QUANTIFIERS)} {variables}{dot}{_random_formula(rng, depth - 1)}"
+    connective = rng.choice(CONNECTIVES)
+    if connective.isalpha():
+        sep = " "
+    formula = f"{_random_formula(rng, depth - 1)}{sep}{connective}{sep}{_random_formula(rng, depth - 1)}"
+    return f"({formula})" if rng.random() < 0.6 else formula
+
+
+def _random_tokens(rng):
+    """Random (mostly ill-formed) sequence of tokens."""
+    return "".join(
+        rng.choice(VOCABULARY) + rng.choice(["", " ", "\n"]) for _ in range(rng.randint(0, 8))
+    )
+
+
+def _mutate(rng, formula):
+    """Formula with a character deleted, duplicated or inserted."""
+    i = rng.randrange(len(formula) + 1)
+    kind = rng.random()
+    if kind < 0.4:
+        return formula[:i] + formula[i + 1:]
+    if kind < 0.6:
+        return formula[:i] + formula[i:i + 1] * 2 + formula[i + 1:]
+    return formula[:i] + rng.choice(VOCABULARY + [" "]) + formula[i:]
+
+
+def fuzzed_formulas(n, seed=42):
+    rng = random.Random(seed)
+    corpus = []
+    for i in range(n):
+        kind = i % 4
+        if kind < 2:
+            corpus.append(_random_formula(rng))
+        elif kind == 2:
+            corpus.append(_mutate(rng, _random_formula(rng)))
+        else:
+            corpus.append(_random_tokens(rng))
+    return corpus
+
+
+def _structure(expr):
+    """Nested tuples of node types and variable names (exact, unlike alpha-equivalence `==`)."""
+    if isinstance(expr, AbstractVariableExpression):
+        return type(expr).__name__, expr.variable.name
+    if isinstance(expr, NegatedExpression):
+        return type(expr).__name__, _structure(expr.term)
+    if isinstance(expr, BinaryExpression):
+        return type(expr).__name__, _structure(expr.first), _structure(expr.second)
+    if isinstance(expr, ApplicationExpression):
+        return type(expr).__name__, _structure(expr.function), _structure(expr.argument)
+    if isinstance(expr, VariableBinderExpression):
+        return type(expr).__name__, expr.variable.name, _structure(expr.term)
+    raise AssertionError(f"unexpected node {expr!r}")
+
+
+def _nltk_parse(formula):
+    try:
+        return Expression.fromstring(formula), None
+    except LogicalExpressionException as e:
+        return None, str(e)
+
+
+@pytest.mark.parametrize(
+    "formula",
+    [
+        "all x.(F(x) -> G(x))",
+        "all x y.R(x,y) & p",
+        "all x F(x)",
+        "-a = b",
+        "a != b = c",
+        "a | b & c -> d <-> e",
+        "a -> b -> c",
+        "P(x)(y)",
+        "(F)(a)",
+        "F(-a, all x.G(x))",
+        "exists x.x = a",
+        "a<b & c>d",
+        "not p and q",
+        "\\x.F(x)",
+        "iota x.F(x)",
+        "(" * 300 + "p" + ")" * 300,
+        " & ".join(["p"] * 300),
+        # errors
+        "",
+        "F(",
+        "all",
+        "all x",
+        "all x.",
+        "all a b.F(a)",
+        "all F(a)",
+        "(a",
+        "a)",
+        "P(a,)",
+        "P(a & b)",
+        "x(a)",
+        "(x)(a)",
+        "a &",
+        "-",
+        ".",
+    ],
+)
+def test_parse_formula_matches_nltk(formula):
+    expected, error = _nltk_parse(formula)
+    if error is not None:
+        with pytest.raises(LogicalExpressionException) as e:
+            parse_formula(formula)
+        assert str(e.value) == error
+    else:
+        assert _structure(parse_formula(formula)) == _structure(expected)
+
+
+def test_parse_formula_matches_nltk_on_fuzzed_formulas():
+    n_errors = 0
+    for formula in fuzzed_formulas(4000):
+        expected, error = _nltk_parse(formula)
+        try:
+            result = parse_formula(formula)
+        except LogicalExpressionException as e:
+            assert str(e) == error, formula
+            n_errors += 1
+            continue
+        assert error is None, formula
+        assert _structure(result) == _structure(expected), formula
+        assert str(result) == str(expected)
+    # both well-formed and ill-formed formulas have been compared
+    assert 1000 < n_errors < 3000
+
+
+def test_fol_parser_raises_value_errors():
+    assert FOLParser.parse("all x.(F(x) -> G(x))") == Expression.fromstring("all x.(F(x) -> G(x))")
+    with pytest.raises(ValueError, match="Invalid formula: F\\(a,\\)"):
+        FOLParser.parse("F(a,)")
@@ -0,0 +1,114 @@
+import pickle
+
+from nltk.sem.logic import LogicalExpressionException  # type: ignore
+import pytest
+
+from argdown_feedback.logic.fol_parser import parse_formula
+from argdown_feedback.logic.formula_dag import formula_node, negation, to_expression
+from argdown_feedback.logic.logic import formula_signature
+from argdown_feedback.logic.smtlib import check_validity_z3
+
+from .test_fol_parser import fuzzed_formulas
+
+
+def _node(formula):
+    return formula_node(parse_formula(formula))
+
+
+@pytest.mark.parametrize(
+    "first,second",
+    [
+        ("all x.(F(x) -> exists y.R(x,y))", "all z.(F(z) -> exists x.R(z,x))"),
+        ("p & q", "q & p"),
+        ("(p & q) & r", "p & (q & r)"),
+        ("p | (r | q)", "(q | p) | r"),
+        ("p <-> q", "q <-> p"),
+        ("a = b", "b = a"),
+        ("a != b", "-(b = a)"),
+        ("all x y.R(x,y)", "all y.all x.R(y,x)"),
+        ("all P.P(a)", "all Q.Q(a)"),
+    ],
+)
+def test_equal_formulas_share_a_node(first, second):
+    assert _node(first) is _node(second)
+    assert _node(first).fingerprint == _node(second).fingerprint
+
+
+@pytest.mark.parametrize(
+    "first,second",
+    [
+        ("p -> q", "q -> p"),
+        ("all x.exists y.R(x,y)", "exists y.all x.R(x,y)"),
+        ("all x.R(x,a)", "all x.R(a,x)"),
+        ("all x.F(x)", "exists x.F(x)"),
+        ("p & (q | r)", "(p & q) | r"),
+        ("all x.F(x)", "F(x)"),
+        ("p & p", "p"),
+    ],
+)
+def test_different_formulas_have_different_nodes(first, second):
+    assert _node(first) is not _node(second)
+    assert _node(first).fingerprint != _node(second).fingerprint
+
+
+def test_subformulas_are_shared():
+    first = _node("all x.(F(x) -> G(x)) & p")
+    second = _node("q | all y.(F(y) -> G(y))")
+    shared = {c for c in first.children} & {c for c in second.children}
+    assert shared == {_node("all x.(F(x) -> G(x))")}
+    assert first.symbols == frozenset({"F", "G", "p"})
+    assert len(first.fingerprint) == 16
+
+
+def test_negation():
+    assert negation(_node("p & q")) is _node("-(q & p)")
+    assert negation(_node("-(p & q)")) is _node("q & p")
+
+
+def test_nodes_are_reinterned_when_unpickled():
+    node = _node("all x.(F(x) -> exists y.R(x,y))")
+    assert pickle.loads(pickle.dumps(node)) is node
+
+
+def test_lambda_terms_are_not_represented():
+    with pytest.raises(ValueError):
+        _node("\\x.F(x)")
+
+
+def _closed_formulas():
+    for formula in fuzzed_formulas(2000):
+        try:
+            expression = parse_formula(formula)
+            formula_signature(expression).arities
+            node = formula_node(expression)
+        except (LogicalExpressionException, ValueError):
+            continue
+        yield expression, node
+
+
+def test_expressions_round_trip():
+    n_formulas = 0
+    for expression, node in _closed_formulas():
+        assert formula_node(to_expression(node)) is node
+        reparsed = parse_formula(str(to_expression(node)))
+        assert formula_node(reparsed) is node
+        n_formulas += 1
+    assert n_formulas > 500
+
+
+def test_canonical_expressions_are_equivalent():
+    n_checked = 0
+    for expression, node in _closed_formulas():
+        declarations = [[s, s] for s in node.symbols]
+        canonical = to_expression(node)
+        try:
+            valid, _ = check_validity_z3({"1": expression}, {"2": canonical}, declarations)
+        except Exception:
+            # not translatable into SMT (e.g., ill-sorted)
+            continue
+        assert valid
+        assert check_validity_z3({"1": canonical}, {"2": expression}, declarations)[0]
+        n_checked += 1
+        if n_checked == 200:
+            break
+    assert n_checked == 200
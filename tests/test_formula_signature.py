@@ -0,0 +1,79 @@
+import pickle
+
+import pytest
+
+from argdown_feedback.logic.fol_parser import FOLParser, parse_formula
+from argdown_feedback.logic.logic import (
+    FormulaSignature,
+    formula_signature,
+    get_arities,
+    get_propositional_variables,
+)
+
+from .test_fol_parser import fuzzed_formulas
+
+
+@pytest.mark.parametrize(
+    "formula,arities,propositional_variables",
+    [
+        ("p & -q", {"p": 0, "q": 0}, {"p", "q"}),
+        ("all x.(F(x) -> R(x,a))", {"F": 1, "R": 2, "a": 0}, set()),
+        ("F(a) | p", {"F": 1, "a": 0, "p": 0}, {"p"}),
+        ("a = b", {"a": 0, "b": 0}, {"a", "b"}),
+        ("F(G(a))", {"F": 1, "G": 0, "a": 0}, set()),
+        ("all x.(x)", {}, {"x"}),
+        ("john(a) & mary", {"john": 1, "a": 0}, {"mary"}),
+    ],
+)
+def test_signature(formula, arities, propositional_variables):
+    signature = formula_signature(parse_formula(formula))
+    assert signature.arities == arities
+    assert signature.propositional_variables == propositional_variables
+
+
+@pytest.mark.parametrize(
+    "formula,arities_defined,propositional_variables_defined",
+    [
+        ("F(a) & F(a,b)", False, True),
+        ("all F.F(a)", False, True),
+        ("P & q", False, False),
+        ("P = a", True, False),
+    ],
+)
+def test_ill_defined_signature(formula, arities_defined, propositional_variables_defined):
+    signature = formula_signature(parse_formula(formula))
+    for defined, attribute in [
+        (arities_defined, "arities"),
+        (propositional_variables_defined, "propositional_variables"),
+    ]:
+        if defined:
+            getattr(signature, attribute)
+        else:
+            with pytest.raises(ValueError):
+                getattr(signature, attribute)
+
+
+def test_symbols_match_nltk():
+    for formula in fuzzed_formulas(4000):
+        try:
+            expression = parse_formula(formula)
+        except Exception:
+            continue
+        signature = FormulaSignature(expression)
+        assert signature.free_variables == {v.name for v in expression.free()}, formula
+        assert signature.constants == {v.name for v in expression.constants()}, formula
+        assert signature.predicates == {v.name for v in expression.predicates()}, formula
+        assert signature.symbols == {
+            str(v) for v in expression.variables() | expression.predicates() | expression.constants()
+        }, formula
+
+
+def test_signature_is_cached_with_expression():
+    expression = FOLParser.parse("all x.(F(x) -> G(x,a))")
+    signature = formula_signature(expression)
+    assert formula_signature(expression) is signature
+    assert formula_signature(FOLParser.parse("all x.(F(x) -> G(x,a))")) is signature
+    assert get_arities(expression) == {"F": 1, "G": 2, "a": 0}
+    assert get_propositional_variables(expression) == []
+    # expressions remain picklable
+    assert formula_signature(pickle.loads(pickle.dumps(expression))).arities == signature.arities
@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from argdown_feedback.logic.fol_parser import parse_formula
+from argdown_feedback.logic.logic import Syntax
+from argdown_feedback.logic.logic_renderer import (
+    LatexLogicRenderingMachine,
+    _rendering_memo,
+    render_expression,
+)
+
+
+def _postprocess_reference(rendered):
+    # former implementation, which recounts parentheses of every prefix
+    while (
+        rendered[0] == "(" and rendered[-1] == ")" and
+        all(rendered[1:i].count("(") >= rendered[1:i].count(")") for i in range(1, len(rendered)-1))
+    ):
+        rendered = rendered[1:-1]
+    return rendered
+
+
+def test_postprocess_matches_reference():
+    rng = random.Random(42)
+    lrm = LatexLogicRenderingMachine()
+    for _ in range(20000):
+        rendered = "".join(rng.choice("(() a") for _ in range(rng.randint(1, 12)))
+        try:
+            expected = _postprocess_reference(rendered)
+        except IndexError:
+            # reference fails on strings that are entirely stripped, such as '()'
+            continue
+        assert lrm.postprocess(rendered) == expected, rendered
+
+
+@pytest.mark.parametrize(
+    "formula,syntax,expected",
+    [
+        ("(p & q) & r", Syntax.LATEX, "p \\land q \\land r"),
+        ("((p -> q))", Syntax.LATEX, "p \\rightarrow q"),
+        ("(p -> q) & (q -> p)", Syntax.LATEX, "(p \\rightarrow q) \\land (q \\rightarrow p)"),
+        ("all x y.R(x,y)", Syntax.LATEX, "\\forall x \\forall y: R(x,y)"),
+        ("all x.exists y.R(x,y)", Syntax.LATEX, "\\forall x \\exists y: R(x,y)"),
+        ("all x y.R(x,y)", Syntax.Z3, "(forall ((x Universal) (y Universal)) (R x y))"),
+        ("-(a = b) | p", Syntax.Z3, "(or (not (= a b)) p)"),
+    ],
+)
+def test_render_expression(formula, syntax, expected):
+    assert render_expression(parse_formula(formula), syntax) == expected
+
+
+def test_renderings_are_memoized_by_identity():
+    _rendering_memo.clear()
+    expression = parse_formula("all x.(F(x) -> G(x))")
+    rendered = render_expression(expression, Syntax.Z3)
+    hits = _rendering_memo.hits
+    assert render_expression(expression, Syntax.Z3) == rendered
+    assert _rendering_memo.hits == hits + 1
+
+    # alpha-equivalent expressions are equal, but rendered differently
+    other = parse_formula("all y.(F(y) -> G(y))")
+    assert other == expression
+    assert render_expression(other, Syntax.Z3) == "(forall ((y Universal)) (=> (F y) (G y)))"
+
+    # subexpressions are shared across formulas
+    _rendering_memo.clear()
+    implication = parse_formula("F(a) -> G(a)")
+    render_expression(implication, Syntax.LATEX)
+    misses = _rendering_memo.misses
+    assert render_expression(parse_formula("p") & implication, Syntax.LATEX) == "p \\land (F(a) \\rightarrow G(a))"
+    # top-level expression and conjunction are rendered, the implication is looked up
+    assert _rendering_memo.misses == misses + 2
@@ -0,0 +1,164 @@
+import pickle
+
+import pytest
+
+from argdown_feedback.verifiers.parse_cache import ParseCache, get_parse_cache, set_parse_cache
+
+
+class Parser:
+    """Parser that records its calls and returns mutable results."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, snippet):
+        self.calls.append(snippet)
+        if snippet.startswith("!"):
+            raise ValueError(f"cannot parse {snippet}")
+        return {"snippet": snippet, "items": list(snippet)}
+
+
+def test_cached_results_are_copied():
+    cache = ParseCache()
+    parser = Parser()
+    first = cache.parse("argdown", "abc", parser)
+    first["items"].append("mutated")
+    second = cache.parse("argdown", "abc", parser)
+    assert second == {"snippet": "abc", "items": ["a", "b", "c"]}
+    assert second is not first
+    assert parser.calls == ["abc"]
+
+
+def test_keys_depend_on_kind_and_snippet():
+    cache = ParseCache()
+    parser = Parser()
+    cache.parse("argdown", "abc", parser)
+    cache.parse("xml", "abc", parser)
+    cache.parse("argdown", "abc ", parser)
+    cache.parse("argdown", "abc", parser)
+    assert parser.calls == ["abc", "abc", "abc "]
+    assert cache.stats()["size"] == 3
+
+
+def test_parse_errors_are_cached():
+    cache = ParseCache()
+    parser = Parser()
+    for _ in range(3):
+        with pytest.raises(ValueError, match="cannot parse !x"):
+            cache.parse("argdown", "!x", parser)
+    assert parser.calls == ["!x"]
+    assert cache.stats()["hits"] == 2
+
+
+def test_parse_errors_are_raised_as_fresh_exceptions():
+    cache = ParseCache()
+    parser = Parser()
+    errors = []
+    for _ in range(2):
+        with pytest.raises(ValueError) as excinfo:
+            cache.parse("argdown", "!x", parser)
+        errors.append(excinfo.value)
+    assert errors[0] is not errors[1]
+    assert errors[0].args == errors[1].args
+    # the cache holds no exception instances (nor their tracebacks)
+    assert not any(isinstance(e[1], BaseException) for e in cache._entries.values())
+
+
+class ParseFailure(Exception):
+    def __init__(self, snippet: str, line: int):
+        super().__init__(f"cannot parse {snippet} (line {line})")
+
+
+def test_parse_errors_that_cannot_be_recreated_are_not_cached():
+    cache = ParseCache()
+    calls = []
+
+    def parser(snippet):
+        calls.append(snippet)
+        raise ParseFailure(snippet, 1)
+
+    for _ in range(2):
+        with pytest.raises(ParseFailure):
+            cache.parse("argdown", "!x", parser)
+    assert calls == ["!x", "!x"]
+    assert cache.stats()["size"] == 0
+
+
+def test_lru_eviction_by_number_of_entries():
+    cache = ParseCache(max_entries=2)
+    parser = Parser()
+    cache.parse("argdown", "a", parser)
+    cache.parse("argdown", "b", parser)
+    cache.parse("argdown", "a", parser)  # "b" is now least recently used
+    cache.parse("argdown", "c", parser)
+    cache.parse("argdown", "a", parser)
+    cache.parse("argdown", "b", parser)
+    assert parser.calls == ["a", "b", "c", "b"]
+    assert cache.stats()["evictions"] == 2
+    assert cache.stats()["size"] == 2
+
+
+def test_eviction_by_snippet_bytes():
+    cache = ParseCache(max_snippet_bytes=10)
+    parser = Parser()
+    cache.parse("argdown", "aaaa", parser)
+    cache.parse("argdown", "bbbb", parser)
+    assert cache.stats()["snippet_bytes"] == 8
+    cache.parse("argdown", "cccc", parser)
+    assert cache.stats()["snippet_bytes"] == 8
+    assert cache.stats()["evictions"] == 1
+    # snippets exceeding the budget are parsed, but not cached
+    cache.parse("argdown", "x" * 11, parser)
+    cache.parse("argdown", "x" * 11, parser)
+    assert parser.calls.count("x" * 11) == 2
+    assert cache.stats()["size"] == 2
+    # budget counts encoded bytes
+    cache.parse("argdown", "äää", parser)
+    assert cache.stats()["snippet_bytes"] == 10
+
+
+def test_stats_and_clear():
+    cache = ParseCache()
+    parser = Parser()
+    assert cache.stats()["hit_rate"] == 0.0
+    for snippet in ["a", "b", "a", "a"]:
+        cache.parse("argdown", snippet, parser)
+    assert cache.stats() == {
+        "hits": 2,
+        "misses": 2,
+        "hit_rate": 0.5,
+        "evictions": 0,
+        "size": 2,
+        "snippet_bytes": 2,
+    }
+    cache.clear()
+    assert cache.stats()["size"] == cache.stats()["hits"] == cache.stats()["snippet_bytes"] == 0
+    cache.parse("argdown", "a", parser)
+    assert parser.calls == ["a", "b", "a"]
+
+
+def test_unpickled_cache_keeps_configuration_only():
+    cache = ParseCache(max_entries=5, max_snippet_bytes=100)
+    cache.parse("argdown", "a", Parser())
+    restored = pickle.loads(pickle.dumps(cache))
+    assert (restored.max_entries, restored.max_snippet_bytes) == (5, 100)
+    assert restored.stats()["size"] == restored.stats()["misses"] == 0
+    restored.parse("argdown", "a", Parser())
+    assert restored.stats()["size"] == 1
+
+
+def test_invalid_budgets():
+    with pytest.raises(ValueError):
+        ParseCache(max_entries=0)
+    with pytest.raises(ValueError):
+        ParseCache(max_snippet_bytes=0)
+
+
+def test_set_parse_cache():
+    previous = get_parse_cache()
+    set_parse_cache(None)
+    assert get_parse_cache() is None
+    cache = ParseCache()
+    set_parse_cache(cache)
+    assert get_parse_cache() is cache
+    set_parse_cache(previous)
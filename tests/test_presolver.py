@@ -0,0 +1,97 @@
+import pytest
+
+from argdown_feedback.logic.presolver import (
+    Presolver,
+    get_presolver,
+    presolve_validity,
+    set_presolver,
+)
+from argdown_feedback.logic.smtlib import Z3Session, check_validity_z3
+
+from .logic_util import fol_query as _query, swapped_settings
+from .test_smtlib import INFERENCES, _random_arguments
+
+
+@pytest.fixture
+def cross_check():
+    with swapped_settings(get_presolver, set_presolver, Presolver(cross_check=True)):
+        yield
+
+
+@pytest.mark.parametrize(
+    "premises,conclusion,expected",
+    [
+        # conclusion among premises (up to canonical form)
+        (["F(a) & G(b)", "H(a)"], "G(b) & F(a)", True),
+        (["all x.(F(x) -> G(x))"], "all y.(F(y) -> G(y))", True),
+        (["F(a) & G(b)"], "G(b)", True),
+        (["F(a)"], "F(a) | G(a)", True),
+        # modus ponens and modus tollens, chained, with instantiation
+        (["F(a)", "F(a) -> G(a)"], "G(a)", True),
+        (["-G(a)", "F(a) -> G(a)"], "-F(a)", True),
+        (["F(a)", "all x.(F(x) -> G(x))", "all x.(G(x) -> H(x))"], "H(a)", True),
+        (["all x.all y.(R(x,y) -> R(y,x))", "R(a,b)"], "R(b,a)", True),
+        (["F(a) <-> G(a)", "-G(a)"], "-F(a)", True),
+        (["F(a)", "-F(a)"], "exists x.H(x)", True),
+        (["G(a)"], "F(a) -> G(a)", True),
+        # countermodels over a one-element domain
+        (["F(a)"], "G(a)", False),
+        (["all x.(F(x) -> G(x))"], "all x.(G(x) -> F(x))", False),
+        (["F(a) | G(a)"], "F(a)", False),
+        (["F(a) -> G(a)", "G(a)"], "F(a)", False),
+        # left to the solver
+        (["exists x.(F(x) & G(x))"], "exists x.F(x)", None),
+        (["F(a)", "-F(b)"], "-(a = b)", None),
+        (["exists x.F(x)"], "all x.F(x)", None),
+        (["F(a)"], "all x.F(x)", None),
+    ],
+)
+def test_presolve_validity(premises, conclusion, expected):
+    query = _query(premises, conclusion, [])
+    assert presolve_validity(*query[:2]) is expected
+
+
+@pytest.mark.parametrize(
+    "premises,conclusion,expected",
+    [
+        # modus ponens with antecedents that follow from the facts by introduction
+        (["F(a)", "G(a)", "(F(a) & G(a)) -> H(a)"], "H(a)", True),
+        (["F(a)", "(F(a) | G(a)) -> H(a)"], "H(a)", True),
+        (["G(a)", "(F(a) -> G(a)) -> H(a)"], "H(a)", True),
+        # modus tollens with negated consequents that follow by introduction
+        (["F(a)", "G(a)", "H(a) -> -(F(a) & G(a))"], "-H(a)", True),
+        # antecedents and negated consequents that do not follow are not used
+        (["F(a) | G(a)", "F(a) -> H(a)"], "H(a)", False),
+        (["F(a)", "(F(a) & G(a)) -> H(a)"], "H(a)", False),
+        (["-H(a)", "F(a) -> (G(a) | H(a))"], "-F(a)", False),
+    ],
+)
+def test_presolver_chains_derived_antecedents(premises, conclusion, expected, cross_check):
+    query = _query(premises, conclusion, ["F", "G", "H", "a"])
+    assert presolve_validity(*query[:2]) is expected
+    assert check_validity_z3(*query)[0] == expected
+
+
+def test_presolver_respects_identity_of_propositional_variables():
+    # p and q are declared as Booleans, 'p = q' is material equivalence
+    query = _query(["F(a)", "all x.(F(x) -> p)", "p = q"], "q", ["F", "a", "p", "q"])
+    assert presolve_validity(*query[:2]) is None
+    assert check_validity_z3(*query)[0]
+    query = _query(["F(a)", "all x.(F(x) -> p)", "p = q"], "-q", ["F", "a", "p", "q"])
+    assert presolve_validity(*query[:2]) is False
+
+
+@pytest.mark.parametrize(
+    "premises,conclusion,placeholders",
+    INFERENCES + [a for i, a in enumerate(_random_arguments(100)) if i % 2 == 0],
+)
+def test_presolver_matches_z3(premises, conclusion, placeholders, cross_check):
+    query = _query(premises, conclusion, placeholders)
+    try:
+        valid = check_validity_z3(*query)[0]
+    except Exception as e:
+        assert not isinstance(e, AssertionError)
+        with pytest.raises(Exception):
+            check_validity_z3(*query, session=Z3Session())
+        return
+    assert check_validity_z3(*query, session=Z3Session())[0] == valid
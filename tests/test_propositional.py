@@ -0,0 +1,77 @@
+import pytest
+
+from argdown_feedback.logic.fol_parser import FOLParser
+from argdown_feedback.logic.propositional import (
+    Fragment,
+    PropositionalFastPath,
+    TruthTable,
+    check_validity_propositional,
+    classify_fragment,
+    get_propositional_fast_path,
+    set_propositional_fast_path,
+)
+from argdown_feedback.logic.smtlib import Z3Session, check_validity_z3
+
+from .logic_util import fol_query as _query, swapped_settings
+from .test_smtlib import INFERENCES, _random_arguments
+
+
+@pytest.fixture
+def cross_check():
+    with swapped_settings(
+        get_propositional_fast_path, set_propositional_fast_path, PropositionalFastPath(cross_check=True)
+    ):
+        yield
+
+
+def test_classify_fragment():
+    def fragment(*formulas):
+        return classify_fragment([FOLParser.parse(f) for f in formulas])
+
+    assert fragment("p", "(p -> q) & -r", "pp <-> q", "p = q") == Fragment.PROPOSITIONAL
+    assert fragment("p", "F(a)") == Fragment.QUANTIFIER_FREE
+    assert fragment("a = b", "R(a,b)", "-F(a) | p") == Fragment.QUANTIFIER_FREE
+    assert fragment("all x.(F(x) -> G(x))", "exists x.(x = a & F(x))") == Fragment.FIRST_ORDER
+    assert fragment("all x.(F(x) -> G(x))", "R(a,b)") == Fragment.FIRST_ORDER
+    assert fragment("all x.exists y.R(x,y)") == Fragment.FIRST_ORDER
+    assert fragment("all x.(x)") == Fragment.FIRST_ORDER
+    assert fragment("all F.F(a)") == Fragment.FIRST_ORDER
+
+
+def test_truth_table_columns():
+    table = TruthTable(["p", "q", "r"])
+    rows = [
+        [bool(table.evaluate(FOLParser.parse(atom)) >> row & 1) for atom in ["p", "q", "r"]]
+        for row in range(8)
+    ]
+    assert sorted(map(tuple, rows)) == sorted(
+        (bool(i & 1), bool(i & 2), bool(i & 4)) for i in range(8)
+    )
+
+
+@pytest.mark.parametrize(
+    "premises,conclusion,placeholders",
+    INFERENCES + [a for i, a in enumerate(_random_arguments(60)) if i % 2],
+)
+def test_fast_path_matches_z3(premises, conclusion, placeholders, cross_check):
+    query = _query(premises, conclusion, placeholders)
+    try:
+        valid = check_validity_z3(*query)[0]
+    except Exception as e:
+        assert not isinstance(e, AssertionError)
+        return
+    assert check_validity_z3(*query, session=Z3Session())[0] == valid
+    if len(premises) > 1:
+        Z3Session().dispensable_premises(*query)
+    # SAT tactic is used above the truth table threshold
+    sat_valid = check_validity_propositional(*query, max_truth_table_atoms=0)
+    assert sat_valid is None or sat_valid == valid
+
+
+def test_fast_path_with_many_atoms(cross_check):
+    n = 24
+    premises = ["p0"] + [f"(p{i - 1} -> p{i})" for i in range(1, n)]
+    for conclusion, expected in [(f"p{n - 1}", True), (f"-p{n - 1}", False)]:
+        query = _query(premises, conclusion, [f"p{i}" for i in range(n)])
+        assert check_validity_z3(*query)[0] is expected
+        assert check_validity_propositional(*query, max_truth_table_atoms=n) is expected
@@ -0,0 +1,205 @@
+import pytest
+from z3 import parse_smt2_string, SimpleSolver, unsat  # type: ignore
+
+from argdown_feedback.logic.fol_parser import FOLParser
+from argdown_feedback.logic.smtlib import (
+    SMT_program_global,
+    SMTProgram,
+    Z3Session,
+    Z3Translator,
+    check_validity_z3,
+    get_z3_context,
+)
+
+
+INFERENCES = [
+    # (premises, conclusion, declared placeholders)
+    (["p", "p -> q"], "q", ["p", "q"]),
+    (["p -> q"], "q", ["p", "q"]),
+    (["p | q", "-p"], "q", ["p", "q"]),
+    (["pp <-> q", "q"], "pp", ["pp", "q"]),
+    (["all x.(F(x) -> G(x))", "all x.(G(x) -> H(x))"], "all x.(F(x) -> H(x))", ["F", "G", "H"]),
+    (["all x.(F(x) -> G(x))"], "all x.(G(x) -> F(x))", ["F", "G"]),
+    (["all x.(R(x,a))"], "R(b,a)", ["R", "a", "b"]),
+    (["all x y.(R(x,y) -> R(y,x))", "R(a,b)"], "R(b,a)", ["R", "a", "b"]),
+    (["exists x.(F(x) & G(x))"], "exists x.F(x)", ["F", "G"]),
+    (["a = b", "F(a)"], "F(b)", ["F", "a", "b"]),
+    (["F(a)", "-F(b)"], "-(a = b)", ["F", "a", "b"]),
+    (["p = q", "p"], "q", ["p", "q"]),
+    (["all x.(F(x) -> p)", "F(a)"], "p", ["F", "p", "a"]),
+    (["p & -p"], "q", ["p", "q"]),
+    # undeclared placeholder / sort errors
+    (["p -> q"], "q", ["p"]),
+    (["F(a)"], "F(a)", ["F"]),
+    (["F(a,b)", "F(a)"], "F(b)", ["F", "a", "b"]),
+    (["F(a)", "a = b"], "F(b)", ["F", "a", "b"]),
+    (["all x.x"], "p", ["p"]),
+    (["-a"], "p", ["a", "p"]),
+    (["a"], "p", ["a", "p"]),
+    (["a <-> b"], "b <-> a", ["a", "b"]),
+]
+
+
+def _check_validity_smtlib(premises, conclusion, plchd_substitutions):
+    """Reference implementation: render and parse SMT2-LIB program."""
+    ctx = get_z3_context()
+    smtlib_code = SMT_program_global(
+        premises_formalized_nltk=premises,
+        conclusion_formalized_nltk=conclusion,
+        plchd_substitutions=plchd_substitutions,
+    )
+    solver = SimpleSolver(ctx=ctx)
+    solver.add(parse_smt2_string(smtlib_code, ctx=ctx))
+    return solver.check() == unsat, smtlib_code
+
+
+@pytest.mark.parametrize("premises,conclusion,placeholders", INFERENCES)
+def test_direct_translation_matches_smtlib(premises, conclusion, placeholders):
+    premises_nltk = {str(i + 1): FOLParser.parse(p) for i, p in enumerate(premises)}
+    conclusion_nltk = {str(len(premises) + 1): FOLParser.parse(conclusion)}
+    plchd_substitutions = [[k, f"placeholder {k}"] for k in placeholders]
+
+    try:
+        expected, expected_code = _check_validity_smtlib(premises_nltk, conclusion_nltk, plchd_substitutions)
+    except Exception:
+        with pytest.raises(Exception):
+            check_validity_z3(premises_nltk, conclusion_nltk, plchd_substitutions)
+        return
+
+    valid, smtcode = check_validity_z3(premises_nltk, conclusion_nltk, plchd_substitutions)
+    assert valid == expected
+    assert isinstance(smtcode, SMTProgram)
+    assert str(smtcode) == expected_code
+
+
+def test_translator_reuses_declarations():
+    translator = Z3Translator()
+    plchd_substitutions = [["F", "f"], ["a", "a"]]
+    exprs = [FOLParser.parse("F(a)")]
+    symbols_1 = translator.declare(plchd_substitutions, exprs)
+    symbols_2 = translator.declare(plchd_substitutions, exprs)
+    assert symbols_1.constants["a"] is symbols_2.constants["a"]
+    assert symbols_1.functions["F"] is symbols_2.functions["F"]
+    assert translator.translate(exprs[0], symbols_1) is translator.translate(exprs[0], symbols_2)
+
+
+def test_session_matches_isolated_checks():
+    session = Z3Session()
+    for premises, conclusion, placeholders in INFERENCES:
+        premises_nltk = {str(i + 1): FOLParser.parse(p) for i, p in enumerate(premises)}
+        conclusion_nltk = {str(len(premises) + 1): FOLParser.parse(conclusion)}
+        plchd_substitutions = [[k, f"placeholder {k}"] for k in placeholders]
+        try:
+            expected, _ = check_validity_z3(premises_nltk, conclusion_nltk, plchd_substitutions)
+        except Exception:
+            with pytest.raises(Exception):
+                check_validity_z3(premises_nltk, conclusion_nltk, plchd_substitutions, session=session)
+            continue
+        valid, _ = check_validity_z3(premises_nltk, conclusion_nltk, plchd_substitutions, session=session)
+        assert valid == expected
+        # leave-one-out checks re-use the premises asserted before
+        for k in premises_nltk:
+            subset = {j: e for j, e in premises_nltk.items() if j != k}
+            if subset:
+                assert (
+                    check_validity_z3(subset, conclusion_nltk, plchd_substitutions, session=session)[0]
+                    == check_validity_z3(subset, conclusion_nltk, plchd_substitutions)[0]
+                )
+
+
+@pytest.mark.parametrize(
+    "formulas,placeholders",
+    [
+        (["all x.(F(x) -> G(x)) & F(a)", "G(a)", "-G(a) | -F(a)", "exists x.-G(x)", "F(b)"], ["F", "G", "a", "b"]),
+        (["p", "p -> q", "-q", "q = p"], ["p", "q"]),
+        # symbols used differently, undeclared symbols
+        (["p", "F(p)", "-F(a)"], ["F", "a", "p"]),
+        (["F(a)", "F(a,b)", "G(b)"], ["F", "G", "a", "b"]),
+        (["F(a)", "G(c)", "-F(a)"], ["F", "G", "a"]),
+    ],
+)
+def test_session_with_document_declarations_matches_isolated_checks(formulas, placeholders):
+    expressions = [FOLParser.parse(f) for f in formulas]
+    plchd_substitutions = [[k, f"placeholder {k}"] for k in placeholders]
+    session = Z3Session()
+    session.declare(plchd_substitutions, expressions)
+    for source in expressions:
+        for target in expressions:
+            for conclusion in (target, FOLParser.parse(f"-({target})")):
+                try:
+                    expected, _ = check_validity_z3({"1": source}, {"2": conclusion}, plchd_substitutions)
+                except Exception:
+                    with pytest.raises(Exception):
+                        session.check_validity({"1": source}, {"2": conclusion}, plchd_substitutions)
+                    continue
+                assert session.check_validity({"1": source}, {"2": conclusion}, plchd_substitutions)[0] == expected
+
+
+def _dispensable_premises_reference(premises, conclusion, plchd_substitutions):
+    """Reference implementation: check every premise with a separate, isolated validity check."""
+    dispensable = []
+    for k in premises:
+        subset = {j: e for j, e in premises.items() if j != k}
+        if check_validity_z3(subset, conclusion, plchd_substitutions)[0]:
+            dispensable.append(k)
+    return dispensable
+
+
+def _random_formula(rng, atoms, depth=2):
+    if depth == 0 or rng.random() < 0.3:
+        atom = rng.choice(atoms)
+        return f"-{atom}" if rng.random() < 0.3 else atom
+    op = rng.choice(["&", "|", "->", "<->"])
+    return f"({_random_formula(rng, atoms, depth - 1)} {op} {_random_formula(rng, atoms, depth - 1)})"
+
+
+def _random_arguments(n_arguments, seed=42):
+    import random
+
+    rng = random.Random(seed)
+    propositional = ["p", "q", "r", "s"]
+    predicative = ["F(a)", "G(a)", "F(b)", "all x.(F(x) -> G(x))", "exists x.G(x)", "all x.(G(x) -> F(b))"]
+    arguments = []
+    for i in range(n_arguments):
+        atoms = propositional if i % 2 else predicative
+        n_premises = rng.randint(2, 7)
+        premises = [_random_formula(rng, atoms) for _ in range(n_premises)]
+        if rng.random() < 0.5:
+            # make sure there are arguments that are valid
+            premises.append(f"({premises[0]} -> {atoms[0]})")
+            conclusion = atoms[0]
+        else:
+            conclusion = _random_formula(rng, atoms, depth=1)
+        placeholders = ["p", "q", "r", "s"] if i % 2 else ["F", "G", "a", "b"]
+        arguments.append((premises, conclusion, placeholders))
+    return arguments
+
+
+@pytest.mark.parametrize(
+    "premises,conclusion,placeholders",
+    [inference for inference in INFERENCES if len(inference[0]) > 1] + _random_arguments(60) + [
+        (["p", "p", "q"], "p", ["p", "q"]),
+        (["p", "p & q", "q -> r", "r"], "p & r", ["p", "q", "r"]),
+    ],
+)
+def test_dispensable_premises_match_per_premise_checks(premises, conclusion, placeholders):
+    premises_nltk = {str(i + 1): FOLParser.parse(p) for i, p in enumerate(premises)}
+    conclusion_nltk = {str(len(premises) + 1): FOLParser.parse(conclusion)}
+    plchd_substitutions = [[k, f"placeholder {k}"] for k in placeholders]
+
+    try:
+        expected = _dispensable_premises_reference(premises_nltk, conclusion_nltk, plchd_substitutions)
+    except Exception:
+        # handler falls back to per-premise checks
+        with pytest.raises(Exception):
+            Z3Session().dispensable_premises(premises_nltk, conclusion_nltk, plchd_substitutions)
+        return
+
+    dispensable = Z3Session().dispensable_premises(premises_nltk, conclusion_nltk, plchd_substitutions)
+    assert list(dispensable) == expected
+    for k, smtcode in dispensable.items():
+        assert str(smtcode) == str(
+            check_validity_z3(
+                {j: e for j, e in premises_nltk.items() if j != k}, conclusion_nltk, plchd_substitutions
+            )[1]
+        )
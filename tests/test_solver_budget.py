@@ -0,0 +1,58 @@
+import time
+
+import pytest
+
+from argdown_feedback.logic.smtlib import Z3Session, check_validity_z3
+from argdown_feedback.logic.solver_budget import SolverBudget, SolverBudgetExceeded
+
+from .logic_util import fol_query as _query
+
+
+# Premises only have infinite models (R is a strict order without maximal elements),
+# so that Z3 doesn't terminate when looking for a counterexample.
+HARD_PREMISES = [
+    "all x.exists y.R(x,y)",
+    "all x y z.((R(x,y) & R(y,z)) -> R(x,z))",
+    "all x.-R(x,x)",
+]
+
+HARD_QUERY = _query(HARD_PREMISES, "F(a)", ["R", "F", "a"])
+# valid, but not settled by the pre-solver
+EASY_QUERY = _query(["exists x.(F(x) & G(x))"], "exists x.G(x)", ["F", "G"])
+
+
+def test_from_config():
+    assert SolverBudget.from_config() is None
+    assert SolverBudget.from_config(from_key="from") is None
+    assert SolverBudget.from_config(timeout_ms=100, rlimit=None) == SolverBudget(timeout_ms=100)
+
+
+@pytest.mark.parametrize(
+    "budget",
+    [SolverBudget(timeout_ms=200), SolverBudget(rlimit=100_000), SolverBudget(request_timeout_ms=200)],
+)
+def test_hard_query_exceeds_budget(budget):
+    start = time.perf_counter()
+    with pytest.raises(SolverBudgetExceeded):
+        check_validity_z3(*HARD_QUERY, budget=budget)
+    with pytest.raises(SolverBudgetExceeded):
+        check_validity_z3(*HARD_QUERY, session=Z3Session(budget=budget))
+    with pytest.raises(SolverBudgetExceeded):
+        Z3Session(budget=budget).dispensable_premises(*HARD_QUERY)
+    assert time.perf_counter() - start < 10
+
+    # easy queries are decided within the same budget
+    assert check_validity_z3(*EASY_QUERY, budget=budget)[0]
+    assert check_validity_z3(*EASY_QUERY, session=Z3Session(budget=budget))[0]
+
+
+def test_request_deadline_bounds_all_checks_of_session():
+    session = Z3Session(budget=SolverBudget(timeout_ms=10_000, request_timeout_ms=300))
+    assert check_validity_z3(*EASY_QUERY, session=session)[0]
+    start = time.perf_counter()
+    with pytest.raises(SolverBudgetExceeded):
+        check_validity_z3(*HARD_QUERY, session=session)
+    assert time.perf_counter() - start < 2
+    # budget is exhausted, even for easy checks
+    with pytest.raises(SolverBudgetExceeded):
+        check_validity_z3(*EASY_QUERY, session=session)
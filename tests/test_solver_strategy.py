@@ -0,0 +1,93 @@
+import pytest
+from z3 import Context, sat, unsat  # type: ignore
+
+from argdown_feedback.logic.presolver import Presolver, get_presolver, set_presolver
+from argdown_feedback.logic.propositional import (
+    Fragment,
+    PropositionalFastPath,
+    get_propositional_fast_path,
+    set_propositional_fast_path,
+)
+from argdown_feedback.logic.smtlib import Z3Session, Z3Translator, check_validity_z3
+from argdown_feedback.logic.solver_budget import SolverBudget, SolverBudgetExceeded
+from argdown_feedback.logic.solver_strategy import (
+    SolverStrategy,
+    fragment_solver,
+    get_solver_strategy,
+    race_portfolio,
+    set_solver_strategy,
+)
+
+from .logic_util import fol_query as _query
+from .test_smtlib import INFERENCES, _random_arguments
+from .test_solver_budget import HARD_QUERY
+
+
+# transitive chain, invalid (MBQI needs a while to find the countermodel)
+CHAIN = [f"a{i}" for i in range(12)]
+CHAIN_QUERY = _query(
+    ["all x y z.((R(x,y) & R(y,z)) -> R(x,z))"] + [f"R({a},{b})" for a, b in zip(CHAIN, CHAIN[1:])],
+    f"R({CHAIN[-1]},{CHAIN[0]})",
+    ["R", *CHAIN],
+)
+
+
+@pytest.fixture
+def solver_only():
+    """Decides all queries with Z3 (no fast path, no pre-solver)."""
+    previous = get_propositional_fast_path(), get_presolver(), get_solver_strategy()
+    set_propositional_fast_path(PropositionalFastPath(enabled=False))
+    set_presolver(Presolver(enabled=False))
+    yield
+    set_propositional_fast_path(previous[0])
+    set_presolver(previous[1])
+    set_solver_strategy(previous[2])
+
+
+@pytest.mark.parametrize(
+    "premises,conclusion,placeholders",
+    INFERENCES + _random_arguments(60),
+)
+def test_tactic_selection_preserves_verdicts(premises, conclusion, placeholders, solver_only):
+    query = _query(premises, conclusion, placeholders)
+    set_solver_strategy(SolverStrategy(select_tactics=False))
+    try:
+        expected = check_validity_z3(*query)[0]
+    except Exception as e:
+        assert not isinstance(e, AssertionError)
+        return
+    set_solver_strategy(SolverStrategy())
+    assert check_validity_z3(*query)[0] == expected
+    assert check_validity_z3(*query, session=Z3Session())[0] == expected
+
+
+def test_fragment_solver():
+    ctx = Context()
+    translator = Z3Translator(ctx)
+    query = _query(["F(a)", "F(a) -> G(a)"], "G(a)", ["F", "G", "a"])
+    symbols = translator.declare(query[2], [*query[0].values(), *query[1].values()])
+    premises = [translator.translate(e, symbols) for e in query[0].values()]
+    conclusion = translator.translate(query[1]["3"], symbols)
+    for fragment in Fragment:
+        solver = fragment_solver(fragment, ctx)
+        solver.add(translator.counterexample_query(premises, conclusion))
+        assert solver.check() == unsat
+
+
+def test_race_portfolio(solver_only):
+    ctx = Context()
+    translator = Z3Translator(ctx)
+    for query, expected in [(CHAIN_QUERY, sat), (_query(*INFERENCES[4]), unsat)]:
+        symbols = translator.declare(query[2], [*query[0].values(), *query[1].values()])
+        premises = [translator.translate(e, symbols) for e in query[0].values()]
+        conclusion = translator.translate(next(iter(query[1].values())), symbols)
+        solver = fragment_solver(Fragment.FIRST_ORDER, ctx)
+        solver.add(translator.counterexample_query(premises, conclusion))
+        assert race_portfolio(solver.sexpr())[0] == expected
+
+
+def test_portfolio_checks(solver_only):
+    set_solver_strategy(SolverStrategy(portfolio=True, race_after_ms=1))
+    assert not check_validity_z3(*CHAIN_QUERY)[0]
+    with pytest.raises(SolverBudgetExceeded):
+        check_validity_z3(*HARD_QUERY, budget=SolverBudget(timeout_ms=1000))
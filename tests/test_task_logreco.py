@@ -905,3 +905,31 @@ class TestLogRecoFailureTypePreferencePairGenerator:
             chosen,
             rejected,
         )        
+
+
+@pytest.mark.asyncio
+async def test_judge_evaluation_payload_roundtrip(
+    problem_generator_class,
+    judge_class,
+    valid_recos,
+    source_texts
+):
+    import pickle
+    from argdown_feedback.tasks.base import Evaluation
+
+    problem = await problem_generator_class().arun(source_texts[0])
+    for reco in valid_recos:
+        evaluation = judge_class._evaluate_solution(reco, problem=problem)
+        payload = pickle.loads(pickle.dumps(evaluation.to_payload()))
+        assert payload.artifacts["argdown_reco"].codec == "ref"
+        rehydrated = Evaluation.from_payload(payload)
+        assert rehydrated.is_valid == evaluation.is_valid
+        assert rehydrated.metrics == evaluation.metrics
+        assert set(rehydrated.artifacts) == set(evaluation.artifacts)
+        argdown = rehydrated.artifacts["argdown"]
+        assert rehydrated.artifacts["argdown_reco"] is argdown
+        assert [a.label for a in argdown.arguments] == [
+            a.label for a in evaluation.artifacts["argdown"].arguments
+        ]
+        assert rehydrated.artifacts["all_expressions"] == evaluation.artifacts["all_expressions"]
+        assert rehydrated.artifacts["all_declarations"] == evaluation.artifacts["all_declarations"]
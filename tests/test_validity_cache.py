@@ -0,0 +1,114 @@
+import pickle
+
+import pytest
+
+from argdown_feedback.logic.fol_parser import FOLParser
+from argdown_feedback.logic.smtlib import Z3Session, check_validity_z3
+from argdown_feedback.logic.validity_cache import (
+    ValidityCache,
+    canonical_form,
+    get_validity_cache,
+    set_validity_cache,
+    validity_query_key,
+)
+
+from .logic_util import fol_query as _query
+from .test_smtlib import INFERENCES, _random_arguments
+
+
+@pytest.fixture
+def validity_cache():
+    previous = get_validity_cache()
+    cache = ValidityCache(max_entries=1000)
+    set_validity_cache(cache)
+    yield cache
+    set_validity_cache(previous)
+
+
+def test_canonical_form_is_invariant_under_alpha_renaming():
+    assert canonical_form(FOLParser.parse("all x.(F(x) -> exists y.R(x,y))")) == canonical_form(
+        FOLParser.parse("all z.(F(z) -> exists x.R(z,x))")
+    )
+    assert canonical_form(FOLParser.parse("all x.F(x)")) != canonical_form(FOLParser.parse("exists x.F(x)"))
+    assert canonical_form(FOLParser.parse("all x.R(x,a)")) != canonical_form(FOLParser.parse("all x.R(a,x)"))
+    symbols: set[str] = set()
+    canonical_form(FOLParser.parse("all x.(F(x) -> R(x,a))"), symbols)
+    assert symbols == {"F", "R", "a"}
+
+
+def test_query_key_ignores_premise_order_labels_and_unused_declarations():
+    key = validity_query_key(*_query(["p -> q", "p"], "q", ["p", "q"]))
+    assert key == validity_query_key(*_query(["p", "p -> q"], "q", ["q", "p"], labels=["a", "b"]))
+    assert key == validity_query_key(*_query(["p -> q", "p", "p"], "q", ["p", "q", "r"]))
+    assert key != validity_query_key(*_query(["p -> q", "p"], "q", ["p"]))
+    assert key != validity_query_key(*_query(["q -> p", "p"], "q", ["p", "q"]))
+
+
+def test_cached_verdicts_match_uncached_checks(validity_cache):
+    inferences = INFERENCES + _random_arguments(20)
+    for _ in range(2):
+        for premises, conclusion, placeholders in inferences:
+            query = _query(premises, conclusion, placeholders)
+            set_validity_cache(None)
+            try:
+                expected = check_validity_z3(*query)[0]
+            except Exception:
+                set_validity_cache(validity_cache)
+                # errors are raised, and never cached
+                with pytest.raises(Exception):
+                    check_validity_z3(*query)
+                continue
+            set_validity_cache(validity_cache)
+            assert check_validity_z3(*query)[0] == expected
+            assert check_validity_z3(*query, session=Z3Session())[0] == expected
+    stats = validity_cache.stats()
+    # first check of every valid query misses, as does every erroneous query
+    assert stats["size"] <= stats["misses"]
+    assert stats["hits"] >= 3 * stats["size"]
+
+
+def test_dispensable_premises_use_cached_verdicts(validity_cache):
+    query = _query(
+        ["F(a)", "F(a) & G(a)", "all x.(G(x) -> H(x))", "H(a)", "G(b)"],
+        "F(a) & H(a)",
+        ["F", "G", "H", "a", "b"],
+    )
+    expected = Z3Session().dispensable_premises(*query)
+    misses = validity_cache.stats()["misses"]
+    assert list(Z3Session().dispensable_premises(*query)) == list(expected)
+    assert validity_cache.stats()["misses"] == misses
+
+
+def test_lru_eviction():
+    cache = ValidityCache(max_entries=2)
+    cache.put("a", True)
+    cache.put("b", False)
+    assert cache.get("a") is True
+    cache.put("c", True)
+    assert cache.get("b") is None
+    assert cache.get("a") is True
+    assert cache.get("c") is True
+    assert cache.stats() == {"hits": 3, "misses": 1, "evictions": 1, "size": 2}
+
+
+def test_on_disk_store_is_shared(tmp_path):
+    path = str(tmp_path / "validity.sqlite")
+    cache = ValidityCache(path=path)
+    cache.put("a", True)
+    cache.put("b", False)
+
+    # e.g. a judge worker process
+    other = pickle.loads(pickle.dumps(cache))
+    assert other.stats()["size"] == 0
+    assert other.get("a") is True
+    assert other.get("b") is False
+    assert other.get("c") is None
+    assert other.stats() == {"hits": 2, "misses": 1, "evictions": 0, "size": 2}
+
+
+def test_on_disk_store_is_bounded(tmp_path):
+    cache = ValidityCache(max_entries=10, path=str(tmp_path / "validity.sqlite"), max_disk_entries=100)
+    for i in range(2 * ValidityCache._PRUNE_INTERVAL):
+        cache.put(str(i), True)
+    assert cache._connection().execute("SELECT COUNT(*) FROM validity").fetchone()[0] <= 100
+    assert cache.stats()["size"] == 10
@@ -5,10 +5,13 @@ from textwrap import dedent
 
 from pyargdown import parse_argdown
 
+from argdown_feedback.verifiers.argdown_index import ArgdownIndex
+from argdown_feedback.verifiers.base import BaseHandler
 from argdown_feedback.verifiers.core.infreco_handler import (
     InfRecoHandler,
     HasArgumentsHandler,
     HasUniqueArgumentHandler,
+    HasAtLeastNArgumentsHandler,
     HasPCSHandler,
     StartsWithPremiseHandler,
     EndsWithConclusionHandler,
@@ -569,6 +572,37 @@ def test_uses_all_props_handler_invalid(unused_premises_graph):
     assert "not explicitly used" in result.message
 
 
+def test_inference_graph():
+    argdown = parse_fenced_argdown(dedent("""
+    ```argdown
+    <Argument 1>: Animals suffer.
+
+    (1) Animals suffer.
+    (2) Suffering is bad.
+    -- {from: ["1", "2"]} --
+    (3) Animal suffering is bad.
+    (4) Eating animals causes suffering.
+    -- {from: ["3", "4"]} --
+    (5) Eating animals is wrong.
+    (6) Unused premise.
+    -- {from: ["5", "7"]} --
+    (7) Circular conclusion.
+    ```
+    """))
+    argument = argdown.arguments[0]
+    graph = ArgdownIndex(argdown).inference_graph(argument)
+
+    assert graph.introduced_before("1", 2)
+    assert graph.introduced_before("3", 2) is False
+    assert graph.introduced_before("8", 6) is False
+    assert graph.used_labels == {"1", "2", "3", "4", "5", "7"}
+    assert graph.ancestors("3") == {"1", "2"}
+    assert graph.ancestors("5") == {"1", "2", "3", "4"}
+    assert graph.ancestors("1") == set()
+    # circular references do not recurse endlessly
+    assert graph.ancestors("7") == {"1", "2", "3", "4", "5", "7"}
+
+
 def test_no_extra_propositions_handler_valid(valid_infreco_graph):
     handler = NoExtraPropositionsHandler()
     vdata = PrimaryVerificationData(id="test", dtype=VerificationDType.argdown, data=valid_infreco_graph)
@@ -797,4 +831,79 @@ def test_real_world_example_complex():
     pprint(request.results)
     # All validations should pass
     invalid_results = [r for r in request.results if not r.is_valid]
-    assert len(invalid_results) == 0
\ No newline at end of file
+    assert len(invalid_results) == 0
+
+def _results(request):
+    return [(r.verifier_id, r.verification_data_references, r.is_valid, r.message) for r in request.results]
+
+
+@pytest.mark.parametrize(
+    "text_fixtures",
+    [
+        ["valid_infreco_text"],
+        ["multi_argument_text"],
+        ["no_pcs_text"],
+        ["ends_with_premise_text"],
+        ["duplicate_pcs_labels_text"],
+        ["no_label_text"],
+        ["no_gist_text"],
+        ["empty_from_list_text"],
+        ["missing_inference_data_text"],
+        ["invalid_ref_text"],
+        ["unused_premises_text"],
+        ["extra_propositions_text"],
+        ["dialectical_relations_text"],
+        ["prop_inline_data_text"],
+        ["valid_infreco_text", "invalid_ref_text", "duplicate_pcs_labels_text"],
+    ],
+)
+@pytest.mark.parametrize("from_key", ["from", "via"])
+def test_fused_composite_handler_matches_handlers(request, text_fixtures, from_key):
+    def verification_request():
+        vdata = [
+            PrimaryVerificationData(
+                id=f"test_{i}",
+                dtype=VerificationDType.argdown,
+                data=parse_fenced_argdown(request.getfixturevalue(fixture)),
+            )
+            for i, fixture in enumerate(text_fixtures)
+        ]
+        # data that is not an argument map yields processing errors
+        vdata.append(PrimaryVerificationData(id="invalid", dtype=VerificationDType.argdown, data="no graph"))
+        return VerificationRequest(inputs="", verification_data=vdata)
+
+    expected = InfRecoCompositeHandler(from_key=from_key).process(verification_request())
+    fused = InfRecoCompositeHandler(from_key=from_key, fused=True).process(verification_request())
+    assert _results(fused) == _results(expected)
+    assert fused.executed_handlers == expected.executed_handlers
+
+
+def test_fused_composite_handler_with_custom_handlers(invalid_ref_graph, unused_premises_graph):
+    class CustomGistHandler(HasGistHandler):
+        pass
+
+    def handlers():
+        only_first = BaseHandler.create_metadata_filter("filename", ["first.ad"])
+        return [
+            HasArgumentsHandler(name="HasArguments", filter=only_first),
+            PropRefsExistHandler(name="PropRefsExist"),
+            UsesAllPropsHandler(name="UsesAllProps", filter=only_first),
+            HasAtLeastNArgumentsHandler(name="HasAtLeast2Arguments", N=2),
+            CustomGistHandler(name="CustomGist"),
+        ]
+
+    def verification_request():
+        return VerificationRequest(
+            inputs="",
+            verification_data=[
+                PrimaryVerificationData(
+                    id="first", dtype=VerificationDType.argdown, data=invalid_ref_graph, metadata={"filename": "first.ad"}
+                ),
+                PrimaryVerificationData(id="second", dtype=VerificationDType.argdown, data=unused_premises_graph),
+            ],
+        )
+
+    expected = InfRecoCompositeHandler(handlers=handlers()).process(verification_request())
+    fused = InfRecoCompositeHandler(handlers=handlers(), fused=True).process(verification_request())
+    assert _results(fused) == _results(expected)
+    assert [r.verifier_id for r in fused.results].count("HasArguments") == 1
@@ -13,7 +13,10 @@ from argdown_feedback.verifiers.core.logreco_handler import (
     PremisesConsistentHandler,
     FormallyGroundedRelationsHandler,
     LogRecoCompositeHandler,
+    ValidityQueryPlan,
 )
+from argdown_feedback.logic.fol_parser import FOLParser
+from argdown_feedback.logic.smtlib import Z3Session
 from argdown_feedback.verifiers.verification_request import (
     VerificationRequest,
     PrimaryVerificationData,
@@ -513,6 +516,141 @@ def test_composite_handler_process_all(verification_request_with_valid_logreco):
     assert len(result_request.results) > 0
 
 
+def test_composite_handler_shares_solver_session(verification_request_with_valid_logreco):
+    sessions = []
+
+    class SessionSpy(GlobalDeductiveValidityHandler):
+        def solver_session(self, vdata_id, request, shard=None):
+            session = super().solver_session(vdata_id, request, shard)
+            sessions.append(session)
+            return session
+
+    composite = LogRecoCompositeHandler()
+    composite.handlers.insert(1, SessionSpy(name="FirstSessionSpy"))
+    composite.handlers.append(SessionSpy(name="LastSessionSpy"))
+    result_request = composite.process(verification_request_with_valid_logreco)
+
+    assert result_request.is_valid()
+    assert len(sessions) == 2
+    assert sessions[0] is sessions[1]
+    # sessions are discarded once the composite handler is done
+    assert "logreco_solver_sessions" not in result_request.artifacts
+
+
+def test_parallel_checks_match_serial_checks():
+    text = dedent("""
+    ```argdown
+    <Valid>: Socrates is mortal.
+
+    (P1) All men are mortal. {formalization: "all x.(F(x) -> G(x))", declarations: {"F": "man", "G": "mortal"}}
+    (P2) Socrates is a man. {formalization: "F(a)", declarations: {"a": "socrates"}}
+    -- {from: ["P1", "P2"]} --
+    (C1) Socrates is mortal. {formalization: "G(a)"}
+
+    <Invalid>: Everything is a man.
+
+    (P1) Plato is a man. {formalization: "F(b)", declarations: {"b": "plato"}}
+    -- {from: ["P1"]} --
+    (C1) Everything is a man. {formalization: "all x.F(x)"}
+
+    <Irrelevant>: Plato is mortal.
+
+    (P1) All men are mortal.
+    (P2) Plato is a man.
+    (P3) Socrates is a man.
+    -- {from: ["P1", "P2"]} --
+    (C1) Plato is mortal. {formalization: "G(b)"}
+
+    <Inconsistent>: Anything goes.
+
+    (P1) Socrates is a man.
+    (P2) Socrates is not a man. {formalization: "-F(a)"}
+    -- {from: ["P1", "P2"]} --
+    (C1) Plato is mortal.
+    ```
+    """)
+
+    def results(max_workers):
+        vdata = PrimaryVerificationData(
+            id="multi", dtype=VerificationDType.argdown, data=parse_fenced_argdown(text)
+        )
+        request = VerificationRequest(inputs="test", verification_data=[vdata])
+        result_request = LogRecoCompositeHandler(max_workers=max_workers).process(request)
+        assert "logreco_solver_sessions" not in result_request.artifacts
+        return [(r.verifier_id, r.is_valid, r.message, r.details) for r in result_request.results]
+
+    serial = results(None)
+    assert not all(is_valid for _, is_valid, _, _ in serial)
+    assert results(4) == serial
+    assert results(2) == serial
+
+
+def test_query_plan_solves_equivalent_queries_once():
+    plan = ValidityQueryPlan(Z3Session())
+    plchd = [["F", "f"], ["G", "g"], ["a", "a"]]
+    a, b, c = FOLParser.parse("all x.(F(x) -> G(x))"), FOLParser.parse("F(a)"), FOLParser.parse("G(a)")
+    not_c = FOLParser.parse("-G(a)")
+
+    # global and local check of single-step argument
+    assert plan.check_validity({"P1": a, "P2": b}, {"C3": c}, plchd)[0]
+    assert plan.check_validity({"2": b, "1": FOLParser.parse("all y.(F(y) -> G(y))")}, {"3": c}, plchd)[0]
+    assert plan.n_solved == 1
+    # contraposition: a, -G(a) |= -F(a); double negation: a, b |= --G(a)
+    assert plan.check_validity({"1": a, "2": not_c}, {"3": FOLParser.parse("-F(a)")}, plchd)[0]
+    assert plan.check_validity({"1": a, "2": b}, {"3": FOLParser.parse("--G(a)")}, plchd)[0]
+    assert plan.n_solved == 1
+    assert plan.n_queries == 4
+    assert not plan.check_validity({"1": a}, {"2": c}, plchd)[0]
+    assert plan.n_solved == 2
+
+    # dispensable premises reuse and seed answers
+    e = FOLParser.parse("F(b)")
+    plchd = plchd + [["b", "b"]]
+    dispensable = plan.dispensable_premises({"1": a, "2": b, "3": e}, {"4": c}, plchd)
+    assert set(dispensable) == {"3"}
+    n_solved = plan.n_solved
+    assert not plan.check_validity({"1": a, "3": e}, {"4": c}, plchd)[0]
+    assert not plan.check_validity({"2": b, "3": e}, {"4": c}, plchd)[0]
+    assert plan.n_solved == n_solved
+    assert not plan.check_validity({"1": e}, {"2": c}, plchd)[0]
+    assert plan.n_solved == n_solved + 1
+
+    # errors are shared, too
+    with pytest.raises(Exception):
+        plan.check_validity({"1": FOLParser.parse("H(a)")}, {"2": c}, plchd)
+    with pytest.raises(Exception):
+        plan.check_validity({"1": FOLParser.parse("H(a)")}, {"2": c}, plchd)
+
+
+def test_solver_budget_reports_timeout():
+    # premises only have infinite models, Z3 doesn't terminate without budget
+    text = dedent("""
+    ```argdown
+    <Argument>: Endless chains.
+
+    (P1) Everything precedes something. {formalization: "all x.exists y.R(x,y)", declarations: {"R": "precedes"}}
+    (P2) Precedence is transitive. {formalization: "all x y z.((R(x,y) & R(y,z)) -> R(x,z))"}
+    (P3) Nothing precedes itself. {formalization: "all x.-R(x,x)"}
+    -- {from: ["P1", "P2", "P3"]} --
+    (C1) Socrates is a man. {formalization: "F(a)", declarations: {"F": "man", "a": "Socrates"}}
+    ```
+    """)
+    vdata = PrimaryVerificationData(
+        id="hard", dtype=VerificationDType.argdown, data=parse_fenced_argdown(text)
+    )
+    request = VerificationRequest(inputs="test", verification_data=[vdata])
+
+    composite = LogRecoCompositeHandler(timeout_ms=200, request_timeout_ms=5000)
+    result_request = composite.process(request)
+
+    results = {r.verifier_id: r for r in result_request.results}
+    global_result = results["LogReco.GlobalDeductiveValidityHandler"]
+    assert not global_result.is_valid
+    assert global_result.details["solver_status"] == "timeout"
+    assert "resource budget" in global_result.message
+    assert "logreco_solver_deadline" not in result_request.artifacts
+
+
 def test_handle_none_data():
     handler = WellFormedFormulasHandler()
     result = handler.evaluate(
@@ -1,11 +1,16 @@
 from pprint import pprint
+import datetime
+import random
 import pytest
 import copy
 from textwrap import dedent
 from bs4 import BeautifulSoup
+import yaml  # type: ignore[import]
 
-from pyargdown import ArgdownMultiDiGraph
+from pyargdown import ArgdownMultiDiGraph, Valence
 
+from argdown_feedback.verifiers.argdown_index import ARGDOWN_INDEX_ARTIFACT, argdown_index
+from argdown_feedback.verifiers.parse_cache import ParseCache, get_parse_cache, set_parse_cache
 from argdown_feedback.verifiers.processing_handler import (
     ProcessingHandler,
     FencedCodeBlockExtractor,
@@ -178,6 +183,69 @@ def test_fenced_code_block_extractor_no_codeblocks():
     assert len(result_request.verification_data) == 0
 
 
+def _extract_reference(input_text, languages):
+    """Reference implementation: split the remaining text at code and close markers, language by language."""
+    code_markers = {VerificationDType.argdown: "```argdown", VerificationDType.xml: "```xml"}
+    blocks = []
+    for language in languages:
+        code_marker = code_markers[language]
+        needs_to_be_parsed = input_text
+        while code_marker in needs_to_be_parsed:
+            splits = needs_to_be_parsed.split(code_marker, 1)[1].split("\n```", 1)
+            if len(splits) <= 1:
+                break
+            needs_to_be_parsed = splits[1]
+            try:
+                metadata = yaml.safe_load(splits[0].split("\n")[0].strip().replace("=", ": "))
+            except yaml.YAMLError:
+                metadata = None
+            blocks.append((language, code_marker + splits[0] + "\n```", metadata))
+    return blocks
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_fenced_code_block_extractor_matches_reference(seed):
+    rng = random.Random(seed)
+    pieces = [
+        "```argdown", "```xml", "```", "\n```", "````", "\n", " ", "Some text.", "[A]: Claim.", "<p>Text</p>",
+        " filename=map.ad", " version=1", " k=yes", " a=b c=d", ' {"type": "map"}', " {a: [1, 2]}", " =", ": ",
+    ]
+    input_text = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 200)))
+    for languages in (
+        [VerificationDType.argdown, VerificationDType.xml],
+        [VerificationDType.xml, VerificationDType.argdown],
+        [VerificationDType.xml],
+    ):
+        request = VerificationRequest(inputs=input_text, source=None)
+        request = FencedCodeBlockExtractor(supported_languages=languages).process(request)
+        assert [
+            (vdata.dtype, vdata.code_snippet, vdata.metadata) for vdata in request.verification_data
+        ] == _extract_reference(input_text, languages)
+
+
+@pytest.mark.parametrize(
+    "header,metadata",
+    [
+        ("", None),
+        (" filename=map.ad", {"filename": "map.ad"}),
+        ("  filename=map.ad  ", {"filename": "map.ad"}),
+        (" version=1", {"version": 1}),
+        (" version=1.0", {"version": 1.0}),
+        (" final=true", {"final": True}),
+        (" date=2024-01-01", {"date": datetime.date(2024, 1, 1)}),
+        (" 1=map", {1: "map"}),
+        (" a=b c=d", None),
+        (' {"type": "map", "author": "test"}', {"type": "map", "author": "test"}),
+        (" map", "map"),
+    ],
+)
+def test_fenced_code_block_extractor_metadata(header, metadata):
+    request = VerificationRequest(inputs=f"```argdown{header}\n[A]: Claim.\n```", source=None)
+    request = FencedCodeBlockExtractor().process(request)
+    assert request.verification_data[0].metadata == metadata
+    assert type(request.verification_data[0].metadata) is type(metadata)
+
+
 def test_argdown_parser_valid(argdown_input_text):
     request = VerificationRequest(inputs=argdown_input_text, source=None)
 
@@ -193,6 +261,23 @@ def test_argdown_parser_valid(argdown_input_text):
     assert len(request.results) == 0  # No errors
 
 
+def test_argdown_parser_indexes_labels(argdown_input_text):
+    request = VerificationRequest(inputs=argdown_input_text, source=None)
+    request = ArgdownParser().process(FencedCodeBlockExtractor().process(request))
+
+    vdata = request.verification_data[0]
+    index = request.artifacts[ARGDOWN_INDEX_ARTIFACT][vdata.id]
+    assert index is argdown_index(vdata, request)
+    assert index.propositions["No meat"].label == "No meat"
+    assert set(index.arguments) == {"Suffering", "Climate change"}
+    assert [drel.valence for drel in index.dialectical_relations("Suffering", "No meat")] == [Valence.SUPPORT]
+    assert index.dialectical_relations("No meat", "Suffering") == []
+
+    # index is rebuilt if the data is replaced
+    vdata.data = ArgdownParser.parse_snippet("[A]: Some claim.")
+    assert set(argdown_index(vdata, request).propositions) == {"A"}
+
+
 def test_argdown_parser_invalid(invalid_argdown_input):
     request = VerificationRequest(inputs=invalid_argdown_input, source=None)
 
@@ -209,6 +294,36 @@ def test_argdown_parser_invalid(invalid_argdown_input):
     assert "Failed to parse argdown" in request.results[0].message
 
 
+def test_parsers_with_parse_cache(argdown_input_text, invalid_argdown_input, xml_input_text):
+    previous = get_parse_cache()
+    cache = ParseCache()
+    set_parse_cache(cache)
+    try:
+        requests = []
+        for _ in range(2):
+            for inputs in (argdown_input_text, invalid_argdown_input, xml_input_text):
+                request = VerificationRequest(inputs=inputs, source=None)
+                request = FencedCodeBlockExtractor().process(request)
+                request = XMLParser().process(ArgdownParser().process(request))
+                requests.append(request)
+    finally:
+        set_parse_cache(previous)
+
+    assert cache.stats()["misses"] == 3
+    assert cache.stats()["hits"] == 3
+    for first, second in zip(requests[:3], requests[3:]):
+        assert [r.message for r in first.results] == [r.message for r in second.results]
+        data1, data2 = first.verification_data[0].data, second.verification_data[0].data
+        # cached results are copied
+        assert (data1 is None and data2 is None) or data1 is not data2
+    assert isinstance(requests[3].verification_data[0].data, ArgdownMultiDiGraph)
+    assert {p.label for p in requests[0].verification_data[0].data.propositions} == {
+        p.label for p in requests[3].verification_data[0].data.propositions
+    }
+    assert "Failed to parse argdown" in requests[4].results[0].message
+    assert str(requests[2].verification_data[0].data) == str(requests[5].verification_data[0].data)
+
+
 def test_xml_parser_valid(xml_input_text):
     request = VerificationRequest(inputs=xml_input_text, source=None)
 